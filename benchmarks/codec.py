@@ -0,0 +1,181 @@
+"""
+Serialization benchmark for twpm.core.codec against json and pickle.
+
+Encodes and decodes a compiled workflow and a session snapshot with each
+format and reports the median time per operation and the encoded size.
+Session snapshots are measured with and without the DataLayout key table.
+
+json and pickle run in C while the codec is pure Python, so it trades
+speed for size, versioning and safety; the tradeoff is printed with the
+results.
+
+Usage:
+    uv run python benchmarks/codec.py
+    uv run python benchmarks/codec.py --nodes 200 --number 2000
+"""
+
+import argparse
+import json
+import pickle
+import statistics
+import timeit
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from twpm.core.codec import (
+    SessionSnapshot,
+    decode_session,
+    decode_workflow,
+    encode_session,
+    encode_workflow,
+)
+from twpm.core.definitions import CompiledWorkflow, NodeSpec, compile_definition
+
+TRADEOFF = """
+Notes:
+  twpm.codec is pure Python: values of mixed types cost one Python call
+  each, while json and pickle run in C. Compiled workflows are decoded
+  once per process, from the definitions cache; session snapshots, written
+  every turn, pack string-only dictionaries into a few C calls. In exchange
+  messages are the smallest, carry a format version and key table
+  checksum, and unlike pickle decoding never runs code from the message.
+"""
+
+
+def sample_definition(questions: int) -> dict:
+    nodes: list[dict] = [{"type": "message", "key": "welcome", "message": "Welcome!"}]
+    for i in range(questions):
+        if i % 3 == 2:
+            nodes.append(
+                {
+                    "type": "pool",
+                    "key": f"choice_{i}",
+                    "question": f"Pick an option for step {i}",
+                    "options": ["Small", "Medium", {"text": "Large", "value": "l"}],
+                }
+            )
+        else:
+            nodes.append(
+                {"type": "question", "key": f"field_{i}", "question": f"Field {i}"}
+            )
+    nodes.append(
+        {
+            "type": "summary",
+            "key": "summary",
+            "title": "Summary",
+            "fields": [["First", "field_0"], ["Second", "field_1"]],
+        }
+    )
+    return {
+        "name": "benchmark",
+        "version": "1",
+        "nodes": nodes,
+        "progress": {"fields": [["First", "field_0"]], "after_each": ["question"]},
+    }
+
+
+def workflow_to_json(workflow: CompiledWorkflow) -> bytes:
+    return json.dumps(
+        {
+            "name": workflow.name,
+            "version": workflow.version,
+            "digest": workflow.digest,
+            "head": workflow.head,
+            "specs": [list(spec) for spec in workflow.specs],
+        },
+        separators=(",", ":"),
+    ).encode()
+
+
+def workflow_from_json(blob: bytes) -> CompiledWorkflow:
+    raw = json.loads(blob)
+    specs = tuple(NodeSpec(*spec) for spec in raw["specs"])
+    return CompiledWorkflow(
+        raw["name"], raw["version"], raw["digest"], specs, raw["head"]
+    )
+
+
+def session_to_json(snapshot: SessionSnapshot) -> bytes:
+    return json.dumps(snapshot._asdict(), separators=(",", ":")).encode()
+
+
+def session_from_json(blob: bytes) -> SessionSnapshot:
+    return SessionSnapshot(**json.loads(blob))
+
+
+def measure(func: Callable[[], Any], number: int, repeat: int) -> float:
+    """Median microseconds per call."""
+    samples = timeit.repeat(func, number=number, repeat=repeat)
+    return statistics.median(samples) / number * 1e6
+
+
+def report(
+    name: str,
+    value: Any,
+    codecs: dict[str, tuple[Callable, Callable]],
+    number: int,
+    repeat: int,
+) -> None:
+    print(f"\n{name}")
+    print(f"{'format':<18} {'size':>8} {'encode':>11} {'decode':>11}")
+    for label, (encode, decode) in codecs.items():
+        blob = encode(value)
+        encode_us = measure(partial(encode, value), number, repeat)
+        decode_us = measure(partial(decode, blob), number, repeat)
+        print(f"{label:<18} {len(blob):>7}B {encode_us:>9.1f}us {decode_us:>9.1f}us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=50)
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    workflow = compile_definition(sample_definition(args.nodes))
+    layout_keys = workflow.layout.keys
+    snapshot = SessionSnapshot(
+        session_id="5f0c6a52-8d1e-4a43-9a55-0f6d1c2b7e10",
+        workflow=workflow.name,
+        version=workflow.version,
+        node="field_7",
+        data={key: f"value of {key}" for key in layout_keys[1:] if "_" in key},
+    )
+
+    pickle_codec = (
+        lambda value: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+        pickle.loads,
+    )
+
+    report(
+        f"compiled workflow ({len(workflow)} nodes)",
+        workflow,
+        {
+            "twpm.codec": (encode_workflow, decode_workflow),
+            "json": (workflow_to_json, workflow_from_json),
+            "pickle": pickle_codec,
+        },
+        args.number,
+        args.repeat,
+    )
+    report(
+        f"session snapshot ({len(snapshot.data)} keys)",
+        snapshot,
+        {
+            "twpm.codec": (encode_session, decode_session),
+            "twpm.codec+layout": (
+                lambda value: encode_session(value, keys=layout_keys),
+                lambda blob: decode_session(blob, keys=layout_keys),
+            ),
+            "json": (session_to_json, session_from_json),
+            "pickle": pickle_codec,
+        },
+        args.number,
+        args.repeat,
+    )
+    print(TRADEOFF)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Throughput benchmark for the webhook gateway.
+
+Serves a three-step workflow with WebhookGateway and floods it with webhook
+requests from a separate process, over keep-alive connections sending
+pipelined batches. Reports requests per second, measured until every
+message has also been processed and its replies delivered to a fake
+provider, so the figure covers the workflow work and not just HTTP.
+
+Usage:
+    uv run python benchmarks/gateway.py
+    uv run python benchmarks/gateway.py --requests 200000 --connections 8
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+
+from twpm.core import Chain
+from twpm.core.container import Container
+from twpm.core.gateway import WebhookGateway
+from twpm.core.primitives import DisplayMessageNode, QuestionNode
+from twpm.core.template import Template
+
+
+class CountingOutput:
+    """Fake provider output that only counts replies."""
+
+    sent = 0
+
+    async def send_text(self, text: str) -> None:
+        CountingOutput.sent += 1
+
+
+def request(session_id: str, text: str) -> bytes:
+    body = json.dumps({"session_id": session_id, "text": text}).encode()
+    return (
+        b"POST /webhook HTTP/1.1\r\nHost: bench\r\n"
+        b"Content-Type: application/json\r\n"
+        b"Content-Length: %d\r\n\r\n" % len(body) + body
+    )
+
+
+async def flood(port: int, connection: int, count: int, sessions: int, batch: int):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payloads = [
+        request(f"user-{connection}-{session}", "answer") for session in range(sessions)
+    ]
+
+    sent = 0
+    while sent < count:
+        size = min(batch, count - sent)
+        writer.write(b"".join(payloads[(sent + i) % sessions] for i in range(size)))
+        for _ in range(size):
+            await reader.readuntil(b"\r\n\r\n")
+            await reader.readexactly(len(b'{"status":"accepted"}'))
+        sent += size
+
+    writer.close()
+    await writer.wait_closed()
+
+
+def run_clients(port: int, args: argparse.Namespace) -> None:
+    per_connection = args.requests // args.connections
+
+    async def main() -> None:
+        await asyncio.gather(
+            *(
+                flood(port, connection, per_connection, args.sessions, args.batch)
+                for connection in range(args.connections)
+            )
+        )
+
+    asyncio.run(main())
+
+
+async def serve(args: argparse.Namespace) -> None:
+    template = (
+        Chain()
+        .add(QuestionNode("Name", key="name"))
+        .add(QuestionNode("City", key="city"))
+        .add(DisplayMessageNode("bye", message=Template("Bye {name} from {city}")))
+        .template()
+    )
+    gateway = WebhookGateway(
+        template.build, Container(), lambda session_id: CountingOutput()
+    )
+    await gateway.start(port=0)
+
+    clients = multiprocessing.Process(target=run_clients, args=(gateway.port, args))
+    start = time.perf_counter()
+    clients.start()
+    await asyncio.to_thread(clients.join)
+    await gateway.drain()
+    elapsed = time.perf_counter() - start
+    await gateway.close()
+
+    total = args.requests // args.connections * args.connections
+    print(f"requests:   {total}")
+    print(f"replies:    {CountingOutput.sent}")
+    print(f"elapsed:    {elapsed:.2f}s")
+    print(f"throughput: {total / elapsed:,.0f} requests/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--sessions", type=int, default=1000, help="per connection")
+    parser.add_argument("--batch", type=int, default=32, help="pipelined requests")
+    args = parser.parse_args()
+
+    asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    main()
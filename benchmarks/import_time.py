@@ -0,0 +1,84 @@
+"""
+Cold start benchmark for twpm imports.
+
+Runs each import statement in a fresh interpreter with `python -X importtime`
+and reports the median cumulative time of the twpm modules it loaded.
+
+Usage:
+    uv run python benchmarks/import_time.py
+    uv run python benchmarks/import_time.py --runs 20 "import twpm"
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+DEFAULT_STATEMENTS = [
+    "import twpm",
+    "import twpm.core",
+    "from twpm.core import Chain",
+    "from twpm.core import Orchestrator",
+    "from twpm.core.primitives import QuestionNode",
+    "from twpm.core.primitives import *",
+    "from twpm.core.definitions import load_definition",
+]
+
+
+def measure(statement: str) -> tuple[int, list[str]]:
+    """
+    Import in a fresh interpreter.
+
+    Returns:
+        Total cumulative microseconds of top-level twpm imports, and the
+        names of every twpm module that was loaded
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        if not name.strip().startswith("twpm"):
+            continue
+
+        modules.append(name.strip())
+        # Only top-level entries (no indentation) avoid double counting
+        if name.startswith(" twpm"):
+            total += int(cumulative)
+
+    return total, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("statements", nargs="*", default=DEFAULT_STATEMENTS)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    # Warm up the bytecode cache so compilation isn't measured
+    for statement in args.statements:
+        measure(statement)
+
+    print(f"{'statement':<55} {'median':>10} {'modules':>8}")
+    for statement in args.statements:
+        samples = []
+        modules: list[str] = []
+        for _ in range(args.runs):
+            total, modules = measure(statement)
+            samples.append(total)
+
+        median_ms = statistics.median(samples) / 1000
+        print(f"{statement:<55} {median_ms:>8.2f}ms {len(modules):>8}")
+
+
+if __name__ == "__main__":
+    main()
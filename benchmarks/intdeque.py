@@ -0,0 +1,81 @@
+"""
+Memory and append benchmark for IntDeque.
+
+Builds integer sequences of growing sizes with IntDeque, list,
+collections.deque, LinkedList and DoubleLinkedList, and reports the bytes
+allocated per element (measured with tracemalloc, so the int objects boxed
+by the other containers count too) and the time per append.
+
+Usage:
+    uv run python benchmarks/intdeque.py
+    uv run python benchmarks/intdeque.py --sizes 10000 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections import deque
+from typing import Any
+
+from twpm.dsa.doublelinkedlist import DoubleLinkedList
+from twpm.dsa.intdeque import IntDeque
+from twpm.dsa.linkedlist import LinkedList
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+SEQUENCES: dict[str, type] = {
+    "IntDeque": IntDeque,
+    "list": list,
+    "deque": deque,
+    "LinkedList": LinkedList,
+    "DoubleLinkedList": DoubleLinkedList,
+}
+
+# Past the small int cache, so every element is its own object unless unboxed
+OFFSET = 1 << 20
+
+
+def measure(name: str, size: int) -> tuple[float, float]:
+    """
+    Append `size` integers to an empty sequence.
+
+    Returns:
+        Bytes allocated per element and nanoseconds per append
+    """
+    elements = range(OFFSET, OFFSET + size)
+
+    # Timed without tracemalloc, which slows down every allocation
+    sequence: Any = SEQUENCES[name]()
+    append = sequence.append
+    start = time.perf_counter()
+    for element in elements:
+        append(element)
+    elapsed = time.perf_counter() - start
+    del sequence, append
+
+    tracemalloc.start()
+    sequence = SEQUENCES[name]()
+    for element in elements:
+        sequence.append(element)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return allocated / size, elapsed / size * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    print(f"{'sequence':<18} {'size':>10} {'memory':>14} {'append':>12}")
+    for size in args.sizes:
+        for name in SEQUENCES:
+            per_element, append_ns = measure(name, size)
+            print(
+                f"{name:<18} {size:>10} {per_element:>8.1f}B/elem {append_ns:>10.0f}ns"
+            )
+
+
+if __name__ == "__main__":
+    main()
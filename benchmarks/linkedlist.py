@@ -0,0 +1,58 @@
+"""
+Append and traversal benchmark for twpm.dsa linked lists.
+
+Builds lists of growing sizes and reports the time per append, which stays
+flat when appends are O(1), and the time to iterate the finished list.
+
+Usage:
+    uv run python benchmarks/linkedlist.py
+    uv run python benchmarks/linkedlist.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import time
+
+from twpm.dsa.doublelinkedlist import DoubleLinkedList
+from twpm.dsa.linkedlist import LinkedList
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def measure(list_type: type[LinkedList], size: int) -> tuple[float, float]:
+    """
+    Build a list of `size` elements, then iterate it.
+
+    Returns:
+        Nanoseconds per append and per iterated node
+    """
+    linked_list = list_type()
+    append = linked_list.append
+
+    start = time.perf_counter()
+    for element in range(size):
+        append(element)
+    appended = time.perf_counter()
+    for _ in linked_list:
+        pass
+    iterated = time.perf_counter()
+
+    return (appended - start) / size * 1e9, (iterated - appended) / size * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+
+    print(f"{'list':<18} {'size':>10} {'append':>12} {'iterate':>12}")
+    for list_type in (LinkedList, DoubleLinkedList):
+        for size in args.sizes:
+            append_ns, iterate_ns = measure(list_type, size)
+            print(
+                f"{list_type.__name__:<18} {size:>10} "
+                f"{append_ns:>10.0f}ns {iterate_ns:>10.0f}ns"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Positional operation benchmark for twpm.dsa sequences.
+
+Compares ChunkedList with LinkedList, DoubleLinkedList, list and
+collections.deque on random-position reads, inserts and deletes, reporting
+the median time per operation at each size.
+
+Usage:
+    uv run python benchmarks/sequences.py
+    uv run python benchmarks/sequences.py --sizes 10000 1000000 --ops 500
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from twpm.dsa.chunkedlist import ChunkedList
+from twpm.dsa.doublelinkedlist import DoubleLinkedList
+from twpm.dsa.linkedlist import LinkedList
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+# Linked lists walk to every position; skip them above this size
+LINKED_LIST_MAX_SIZE = 100_000
+
+
+def build(name: str, size: int) -> Any:
+    if name == "list":
+        return list(range(size))
+    if name == "deque":
+        return deque(range(size))
+    if name == "ChunkedList":
+        return ChunkedList(range(size))
+
+    linked_list = LinkedList() if name == "LinkedList" else DoubleLinkedList()
+    linked_list.extend(range(size))
+    return linked_list
+
+
+def delete(sequence: Any, index: int) -> None:
+    if isinstance(sequence, LinkedList):
+        sequence.pop(index)
+    else:
+        del sequence[index]
+
+
+OPERATIONS: dict[str, Callable[[Any, int], Any]] = {
+    "index": lambda sequence, index: sequence[index],
+    "insert": lambda sequence, index: sequence.insert(index, -1),
+    "delete": delete,
+}
+
+
+def measure(name: str, size: int, ops: int, repeat: int) -> dict[str, float]:
+    """Median microseconds per operation."""
+    rng = random.Random(size)
+    results = {}
+
+    for operation, func in OPERATIONS.items():
+        samples = []
+        for _ in range(repeat):
+            sequence = build(name, size)
+            # Inserts and deletes alternate sizes by at most ops elements
+            indexes = [rng.randrange(size - ops) for _ in range(ops)]
+            start = time.perf_counter()
+            for index in indexes:
+                func(sequence, index)
+            samples.append((time.perf_counter() - start) / ops * 1e6)
+        results[operation] = statistics.median(samples)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--ops", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    names = ["ChunkedList", "list", "deque", "LinkedList", "DoubleLinkedList"]
+
+    header = "".join(f"{operation:>12}" for operation in OPERATIONS)
+    print(f"{'sequence':<18} {'size':>10}{header}")
+    for size in args.sizes:
+        for name in names:
+            if name.endswith("LinkedList") and size > LINKED_LIST_MAX_SIZE:
+                continue
+            results = measure(name, size, args.ops, args.repeat)
+            row = "".join(f"{results[op]:>10.2f}us" for op in OPERATIONS)
+            print(f"{name:<18} {size:>10}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import pytest
 
 from twpm.core.base import ListData, NodeResult, NodeStatus
 from twpm.core.primitives.condition import ConditionalNode
+from twpm.core.primitives.display_message import DisplayMessageNode
 from twpm.core.primitives.task import TaskNode
 
 
@@ -237,3 +238,38 @@ class TestConditionalNode:
         assert result.success is False
         assert "Condition evaluation failed" in result.message
         assert result.is_awaiting_input is False
+
+    async def test_conditional_node_accepts_expression_string(self):
+        """Test that an expression string is compiled into the condition."""
+
+        async def dummy_task(data: ListData) -> bool:
+            return True
+
+        true_node = TaskNode(dummy_task, key="true_node")
+        false_node = TaskNode(dummy_task, key="false_node")
+
+        cond_node = ConditionalNode()
+        cond_node.set_condition("int(score) >= 3", true_node, false_node)
+
+        data = ListData(data={"score": "2"})
+        result = await cond_node.execute(data)
+
+        assert result.success is True
+        assert cond_node.next == false_node
+
+    async def test_conditional_node_can_run_again(self):
+        """Test re-running the node switches branches instead of stacking them."""
+        true_node = DisplayMessageNode(message="yes", key="yes")
+        false_node = DisplayMessageNode(message="no", key="no")
+        after = DisplayMessageNode(message="after", key="after")
+
+        cond_node = ConditionalNode()
+        cond_node.set_condition("flag == 'y'", true_node, false_node)
+        cond_node.next = after
+
+        await cond_node.execute(ListData(data={"flag": "y"}))
+        await cond_node.execute(ListData(data={"flag": "n"}))
+
+        assert cond_node.next is false_node
+        assert false_node.next is after
+        assert true_node.next is after
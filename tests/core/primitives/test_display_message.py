@@ -2,6 +2,7 @@ import pytest
 
 from twpm.core.base.models import ListData
 from twpm.core.primitives import DisplayMessageNode
+from twpm.core.template import Template
 
 
 class MockOutput:
@@ -57,3 +58,38 @@ class TestDisplayMessageNode:
             ValueError, match="Either message or message_func must be provided."
         ):
             DisplayMessageNode(key="test_msg")
+
+    async def test_message_func_runs_for_every_session(self):
+        node = DisplayMessageNode(
+            key="test_msg", message_func=lambda data: f"Hello, {data.get('name')}!"
+        )
+        output = MockOutput()
+
+        await node.execute(ListData(data={"name": "John"}), output)
+        await node.execute(ListData(data={"name": "Mary"}), output)
+
+        assert output.messages == ["Hello, John!", "Hello, Mary!"]
+
+    async def test_renders_message_template(self):
+        node = DisplayMessageNode(
+            message=Template("Thanks, {name|friend}!"), key="test_msg"
+        )
+        output = MockOutput()
+
+        await node.execute(ListData(data={"name": "John"}), output)
+        await node.execute(ListData(data={}), output)
+
+        assert output.messages == ["Thanks, John!", "Thanks, friend!"]
+        assert node.input_keys() == ("name",)
+
+    @pytest.mark.parametrize(
+        "message", ["Use } to close", 'JSON: {"a": 1}', "Hello {name}"]
+    )
+    async def test_plain_message_keeps_literal_braces(self, message):
+        node = DisplayMessageNode("test_msg", message=message)
+        output = MockOutput()
+
+        await node.execute(ListData(data={"name": "John"}), output)
+
+        assert output.messages == [message]
+        assert node.input_keys() == ()
@@ -0,0 +1,142 @@
+import pytest
+
+from twpm.core.analysis import WorkflowValidationError
+from twpm.core.base import ListData
+from twpm.core.chain import Chain
+from twpm.core.container import Container, ServiceScope
+from twpm.core.depedencies import Output
+from twpm.core.orchestrator import Orchestrator
+from twpm.core.primitives import (
+    ConditionalNode,
+    DisplayMessageNode,
+    GotoNode,
+    LoopNode,
+    QuestionNode,
+    TaskNode,
+)
+
+
+class MockOutput:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text)
+
+
+def create_orchestrator(output: MockOutput, max_steps: int | None = 100):
+    container = Container()
+    container.register(Output, lambda: output, ServiceScope.SINGLETON)
+    return Orchestrator(container=container, max_steps=max_steps)
+
+
+@pytest.mark.asyncio
+class TestGotoNode:
+    async def test_jumps_to_bound_target(self):
+        target = DisplayMessageNode(message="Hi", key="start")
+        goto = GotoNode("start")
+        Chain(target, goto).build()
+
+        result = await goto.execute(ListData(data={}))
+
+        assert result.success
+        assert result.next_node is target
+
+    async def test_counts_iterations_and_falls_through(self):
+        goto = GotoNode("start", max_iterations=2)
+        Chain(DisplayMessageNode(message="Hi", key="start"), goto).build()
+        data = ListData(data={})
+
+        first = await goto.execute(data)
+        second = await goto.execute(data)
+        third = await goto.execute(data)
+
+        assert first.next_node is not None
+        assert second.next_node is not None
+        assert third.next_node is None
+        assert data["goto_iterations"] == "0"
+
+    async def test_condition_expression(self):
+        goto = GotoNode("name", condition="name == ''")
+        Chain(QuestionNode("Name", key="name"), goto).build()
+
+        assert (await goto.execute(ListData(data={"name": ""}))).next_node
+        assert not (await goto.execute(ListData(data={"name": "x"}))).next_node
+
+    async def test_unresolved_target_fails_validation(self):
+        with pytest.raises(WorkflowValidationError, match="'missing' not found"):
+            Chain(
+                DisplayMessageNode(message="Hi", key="hi"), GotoNode("missing")
+            ).build()
+
+    async def test_unresolved_target_fails_execution(self):
+        result = await GotoNode("missing").execute(ListData(data={}))
+
+        assert result.success is False
+
+    async def test_invalid_max_iterations(self):
+        with pytest.raises(ValueError):
+            GotoNode("start", max_iterations=0)
+
+
+@pytest.mark.asyncio
+class TestLoopWorkflows:
+    async def test_repeats_question_until_valid(self):
+        output = MockOutput()
+        head = Chain(
+            QuestionNode("Email", key="email"),
+            LoopNode("email", until="'@' in email"),
+            DisplayMessageNode(message="Thanks!", key="thanks"),
+        ).build()
+        orchestrator = create_orchestrator(output)
+        orchestrator.start("session", head)
+
+        await orchestrator.process()
+        await orchestrator.process("nope")
+        await orchestrator.process("john@example.com")
+
+        assert orchestrator.is_finished
+        assert output.messages.count("\n? Email: ") == 2
+        assert output.messages[-1] == "Thanks!"
+
+    async def test_loop_does_not_grow_the_chain(self):
+        visits = []
+
+        async def visit(data: ListData) -> bool:
+            visits.append(data.get("loop_iterations", "0"))
+            return True
+
+        cond = ConditionalNode()
+        cond.set_condition(
+            "loop_iterations == '1'",
+            DisplayMessageNode(message="odd", key="odd"),
+            DisplayMessageNode(message="even", key="even"),
+        )
+        head = Chain(
+            TaskNode(visit, key="visit"),
+            cond,
+            LoopNode("visit", until="False", max_iterations=3),
+        ).build()
+        orchestrator = create_orchestrator(MockOutput())
+        orchestrator.start("session", head)
+
+        await orchestrator.process()
+
+        assert visits == ["0", "1", "2", "3"]
+        node, length = head, 0
+        while node is not None and length < 10:
+            node, length = node.next, length + 1
+        assert length == 4
+
+    async def test_step_budget_stops_runaway_loop(self):
+        head = Chain(
+            DisplayMessageNode(message="again", key="again"),
+            GotoNode("again", max_iterations=1_000),
+        ).build()
+        orchestrator = create_orchestrator(MockOutput(), max_steps=50)
+        orchestrator.start("session", head)
+
+        await orchestrator.process()
+
+        assert orchestrator.is_finished
+        assert orchestrator.has_error
@@ -0,0 +1,42 @@
+from twpm.core.primitives.menu import MenuCache, render_menu
+
+PROMPT = "Select an option (1-{}):"
+
+
+class TestRenderMenu:
+    def test_renders_numbered_options_and_prompt(self):
+        assert render_menu(["Red", "Blue"], PROMPT) == (
+            "  1. Red\n  2. Blue\nSelect an option (1-2):"
+        )
+
+
+class TestMenuCache:
+    def test_reuses_menu_for_same_list(self):
+        cache = MenuCache()
+        options = ["Red", "Blue"]
+
+        menu = cache.get(options, PROMPT)
+
+        assert cache.get(options, PROMPT) is menu
+        assert len(cache) == 1
+
+    def test_equal_lists_are_cached_separately(self):
+        cache = MenuCache()
+
+        cache.get(["Red"], PROMPT)
+        menu = cache.get(["Blue"], PROMPT)
+
+        assert "Blue" in menu
+
+    def test_evicts_least_recently_used(self):
+        cache = MenuCache(maxsize=2)
+        first, second, third = ["a"], ["b"], ["c"]
+
+        cache.get(first, PROMPT)
+        cache.get(second, PROMPT)
+        cache.get(first, PROMPT)
+        cache.get(third, PROMPT)
+
+        assert len(cache) == 2
+        assert (id(second), PROMPT) not in cache._entries
+        assert (id(first), PROMPT) in cache._entries
@@ -0,0 +1,168 @@
+import pytest
+
+from twpm.core.base.models import ListData
+from twpm.core.primitives import PagedPoolNode, PoolOption
+
+CATALOGUE = [PoolOption(f"Product {i}", f"sku-{i}") for i in range(1, 26)]
+
+
+class MockOutput:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text)
+
+
+class PageFetcher:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, data: ListData, offset: int, limit: int):
+        self.calls.append((offset, limit))
+        return CATALOGUE[offset : offset + limit]
+
+
+async def answer(node, data, output, text):
+    data["_user_input"] = text
+    return await node.execute(data, output)
+
+
+@pytest.mark.asyncio
+class TestPagedPoolNode:
+    async def test_shows_first_page_only(self):
+        fetcher = PageFetcher()
+        node = PagedPoolNode("Product", key="product", fetch_page=fetcher)
+        output = MockOutput()
+
+        result = await node.execute(ListData(data={}), output)
+
+        assert result.is_awaiting_input
+        assert fetcher.calls == [(0, 11)]
+        assert len(node.options) == 10
+        assert "  10. Product 10\n" in output.messages[0]
+        assert "Product 11" not in output.messages[0]
+        assert "Type 'next' for more options." in output.messages[0]
+
+    async def test_navigates_between_pages(self):
+        node = PagedPoolNode("Product", key="product", fetch_page=PageFetcher())
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+
+        await answer(node, data, output, "next")
+        await answer(node, data, output, "NEXT")
+
+        assert node.page == 2
+        assert [str(option) for option in node.options] == [
+            f"Product {i}" for i in range(21, 26)
+        ]
+        assert "Type 'next'" not in output.messages[-1]
+        assert "Select an option (21-25):" in output.messages[-1]
+
+        await answer(node, data, output, "previous")
+
+        assert node.page == 1
+        assert "  11. Product 11\n" in output.messages[-1]
+
+    async def test_selects_by_global_number_or_text(self):
+        node = PagedPoolNode("Product", key="product", fetch_page=PageFetcher())
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+        await answer(node, data, output, "next")
+
+        result = await answer(node, data, output, "12")
+
+        assert not result.is_awaiting_input
+        assert data["product"] == "sku-12"
+
+        await node.execute(data, output)
+        await answer(node, data, output, "product 3")
+
+        assert data["product"] == "sku-3"
+
+    async def test_rejects_number_outside_current_page(self):
+        node = PagedPoolNode("Product", key="product", fetch_page=PageFetcher())
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+
+        result = await answer(node, data, output, "15")
+
+        assert result.is_awaiting_input
+        assert output.messages[-1].startswith("Invalid input")
+
+    async def test_reads_pages_from_stream(self):
+        consumed = []
+
+        async def stream(data: ListData):
+            for option in CATALOGUE:
+                consumed.append(option)
+                yield option
+
+        node = PagedPoolNode("Product", key="product", stream=stream, page_size=5)
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+        await answer(node, data, output, "next")
+
+        assert [option.value for option in node.options] == [
+            f"sku-{i}" for i in range(6, 11)
+        ]
+        assert len(consumed) < len(CATALOGUE)
+
+    async def test_keeps_stream_open_between_pages(self):
+        opened = []
+        consumed = []
+
+        async def stream(data: ListData):
+            opened.append(data)
+            for option in CATALOGUE:
+                consumed.append(option)
+                yield option
+
+        node = PagedPoolNode("Product", key="product", stream=stream, page_size=5)
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+        for command in ("next", "next", "previous", "next", "next"):
+            await answer(node, data, output, command)
+
+        assert node.page == 3
+        assert len(opened) == 1
+        # Every option is read once, plus the one peeked to detect more pages
+        assert consumed == CATALOGUE[:21]
+
+        await answer(node, data, output, "16")
+
+        assert data["product"] == "sku-16"
+
+        await node.execute(data, output)
+
+        assert len(opened) == 2
+        assert node.page == 0
+
+    async def test_picks_options_labelled_like_commands(self):
+        async def fetch_page(data: ListData, offset: int, limit: int):
+            options = [PoolOption("Next"), PoolOption("Previous"), PoolOption("Other")]
+            return options[offset : offset + limit]
+
+        node = PagedPoolNode("Step", key="step", fetch_page=fetch_page, page_size=2)
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+
+        result = await answer(node, data, output, "next")
+
+        assert not result.is_awaiting_input
+        assert data["step"] == "Next"
+
+        await node.execute(data, output)
+        await answer(node, data, output, "n")
+
+        assert node.page == 1
+
+    async def test_requires_exactly_one_source(self):
+        with pytest.raises(ValueError):
+            PagedPoolNode("Product", key="product")
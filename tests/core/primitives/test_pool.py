@@ -1,6 +1,7 @@
 import pytest
 
 from twpm.core.base.models import ListData
+from twpm.core.matching import FUZZY_INDEXES
 from twpm.core.primitives import PoolNode, PoolOption
 
 
@@ -27,6 +28,20 @@ class TestPoolNode:
 
         assert result.is_awaiting_input
 
+    async def test_displays_option_texts(self):
+        node = PoolNode(
+            question="Color?",
+            options=[PoolOption("Red", "red"), PoolOption("Blue", "blue")],
+            key="color",
+        )
+        output = MockOutput()
+
+        await node.execute(ListData(data={}), output)
+
+        assert output.messages == [
+            "\n? Color?:\n  1. Red\n  2. Blue\nSelect an option (1-2):"
+        ]
+
     async def test_first_execution_succeeds(self):
         node = PoolNode(
             question="Color?",
@@ -70,6 +85,94 @@ class TestPoolNode:
 
         assert not result.is_awaiting_input
 
+    async def test_stores_selected_option_by_text_or_value(self):
+        node = PoolNode(
+            question="City?",
+            options=[PoolOption("São Paulo", "sp"), PoolOption("Rio", "rj")],
+            key="city",
+        )
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+
+        data["_user_input"] = "  sao paulo "
+        result = await node.execute(data, output)
+
+        assert not result.is_awaiting_input
+        assert data["city"] == "sp"
+
+        await node.execute(data, output)
+        data["_user_input"] = "RJ"
+        await node.execute(data, output)
+
+        assert data["city"] == "rj"
+
+    async def test_matches_text_of_lazy_options(self):
+        async def load_options(data: ListData):
+            return [PoolOption("Red"), PoolOption("Blue")]
+
+        node = PoolNode(question="Color?", options=load_options, key="color")
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+        data["_user_input"] = "blue"
+
+        await node.execute(data, output)
+
+        assert data["color"] == "Blue"
+
+    async def test_suggests_similar_options(self):
+        node = PoolNode(
+            question="City?",
+            options=[PoolOption("Lisboa"), PoolOption("Porto"), PoolOption("Braga")],
+            key="city_suggestions",
+        )
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+        data["_user_input"] = "lisbao"
+
+        result = await node.execute(data, output)
+
+        assert result.is_awaiting_input
+        assert output.messages[-1].startswith("Did you mean:\n  1. Lisboa\n")
+
+    async def test_same_key_nodes_do_not_share_suggestions(self):
+        FUZZY_INDEXES.clear()
+        nodes = [
+            PoolNode(question="City?", options=options, key="city")
+            for options in (
+                [PoolOption("Lisboa"), PoolOption("Porto")],
+                [PoolOption("Madrid"), PoolOption("Sevilla")],
+            )
+        ]
+
+        for node, typo in zip(nodes, ("lisbao", "madird")):
+            data = ListData(data={})
+            output = MockOutput()
+            await node.execute(data, output)
+            data["_user_input"] = typo
+            await node.execute(data, output)
+            assert output.messages[-1].startswith("Did you mean:\n  1. ")
+
+        assert len(FUZZY_INDEXES) == 2
+
+    async def test_suggestions_can_be_disabled(self):
+        node = PoolNode(
+            question="City?",
+            options=[PoolOption("Lisboa"), PoolOption("Porto")],
+            key="city_no_suggestions",
+            suggestions=0,
+        )
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+        data["_user_input"] = "lisbao"
+
+        await node.execute(data, output)
+
+        assert output.messages[-1].startswith("Invalid input")
+
     async def test_rejects_out_of_range_selection(self):
         node = PoolNode(
             question="Color?",
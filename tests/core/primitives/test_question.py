@@ -2,6 +2,7 @@ import pytest
 
 from twpm.core.base.models import ListData
 from twpm.core.primitives import QuestionNode
+from twpm.core.template import Template
 
 
 class MockOutput:
@@ -23,6 +24,15 @@ class TestQuestionNode:
 
         assert result.is_awaiting_input
 
+    async def test_question_is_a_template(self):
+        node = QuestionNode(question=Template("Email for {name}?"), key="email")
+        output = MockOutput()
+
+        await node.execute(ListData(data={"name": "John"}), output)
+
+        assert output.messages == ["\n? Email for John?: "]
+        assert node.input_keys() == ("name",)
+
     async def test_first_execution_succeeds(self):
         node = QuestionNode(question="Your name?", key="name")
         data = ListData(data={})
@@ -0,0 +1,138 @@
+import pytest
+
+from twpm.core.base.models import ListData
+from twpm.core.primitives import (
+    BankQuestion,
+    QuestionBank,
+    QuestionBankNode,
+    QuestionBankSummaryNode,
+)
+
+BANK = QuestionBank(
+    [(f"{i} + 1?", [str(i), str(i + 1), str(i + 2)], str(i + 1)) for i in range(20)]
+)
+
+
+class MockOutput:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text)
+
+
+async def answer_all(node, data, output, choose):
+    """Answer every question, choose(question, displayed options) -> number."""
+    await node.execute(data, output)
+    result = None
+    for _ in range(node.count):
+        seed = int(data["quiz_seed"])
+        questions = [int(i) for i in data["quiz_questions"].split(",")]
+        answered = len(data["quiz_answers"].split(",")) if data["quiz_answers"] else 0
+        index = questions[answered]
+        order = BANK.option_order(seed, index)
+        data["_user_input"] = str(choose(BANK[index], order))
+        result = await node.execute(data, output)
+    return result
+
+
+def correct_choice(question, order):
+    return order.index(question.answer) + 1
+
+
+def wrong_choice(question, order):
+    return next(i for i, option in enumerate(order, 1) if option != question.answer)
+
+
+class TestQuestionBank:
+    def test_converts_expected_answers_to_indices(self):
+        assert BANK[0] == BankQuestion("0 + 1?", ("0", "1", "2"), 1)
+
+    def test_rejects_unknown_expected_answer(self):
+        with pytest.raises(ValueError):
+            QuestionBank([("Q", ["a", "b"], "c")])
+
+    @pytest.mark.parametrize("answer", [-1, 3, True])
+    def test_rejects_invalid_answer_index(self, answer):
+        with pytest.raises(ValueError):
+            BankQuestion("Q", ("a", "b", "c"), answer)
+
+    def test_sampling_is_deterministic_per_seed(self):
+        assert BANK.sample(7, 5) == BANK.sample(7, 5)
+        assert len(set(BANK.sample(7, 5))) == 5
+        assert BANK.option_order(7, 3) == BANK.option_order(7, 3)
+        assert sorted(BANK.option_order(7, 3)) == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+class TestQuestionBankNode:
+    async def test_stores_only_indices(self):
+        node = QuestionBankNode(BANK, count=3, key="quiz", seed=42)
+        data = ListData(data={})
+
+        result = await answer_all(node, data, MockOutput(), correct_choice)
+
+        assert not result.is_awaiting_input
+        assert data["quiz_seed"] == "42"
+        assert data["quiz_questions"] == ",".join(map(str, BANK.sample(42, 3)))
+        assert data["quiz_answers"] == "1,1,1"
+
+    async def test_sessions_get_different_samples(self):
+        samples = set()
+        for _ in range(5):
+            data = ListData(data={})
+            await QuestionBankNode(BANK, count=3, key="quiz").execute(
+                data, MockOutput()
+            )
+            samples.add(data["quiz_questions"])
+
+        assert len(samples) > 1
+
+    async def test_displays_shuffled_options(self):
+        node = QuestionBankNode(BANK, count=1, key="quiz", seed=3)
+        data = ListData(data={})
+        output = MockOutput()
+
+        await node.execute(data, output)
+
+        index = BANK.sample(3, 1)[0]
+        options = [BANK[index].options[i] for i in BANK.option_order(3, index)]
+        assert f"  1. {options[0]}\n  2. {options[1]}\n" in output.messages[0]
+        assert "(1/1)" in output.messages[0]
+
+    async def test_rejects_invalid_selection(self):
+        node = QuestionBankNode(BANK, count=1, key="quiz", seed=3)
+        data = ListData(data={})
+        output = MockOutput()
+        await node.execute(data, output)
+        data["_user_input"] = "9"
+
+        result = await node.execute(data, output)
+
+        assert result.is_awaiting_input
+        assert data["quiz_answers"] == ""
+
+    async def test_rejects_count_larger_than_bank(self):
+        with pytest.raises(ValueError):
+            QuestionBankNode(BANK, count=21, key="quiz")
+
+
+@pytest.mark.asyncio
+class TestQuestionBankSummaryNode:
+    async def test_scores_from_indices(self):
+        node = QuestionBankNode(BANK, count=4, key="quiz", seed=1)
+        data = ListData(data={})
+        await answer_all(node, data, MockOutput(), wrong_choice)
+        answers = data["quiz_answers"].split(",")
+        answers[0] = "1"
+        data["quiz_answers"] = ",".join(answers)
+        output = MockOutput()
+
+        summary = QuestionBankSummaryNode(BANK, quiz_key="quiz", title="Resultado")
+        await summary.execute(data, output)
+
+        assert data["quiz_summary_score"] == "1"
+        assert data["quiz_summary_score_total"] == "4"
+        assert data["quiz_summary_score_percentage"] == "25.0"
+        assert output.messages[0].count("✅") == 1
+        assert output.messages[0].count("❌") == 3
@@ -0,0 +1,168 @@
+import pytest
+
+from twpm.core.base import ListData
+from twpm.core.chain import Chain
+from twpm.core.container import Container, ServiceScope
+from twpm.core.definitions import compile_definition
+from twpm.core.depedencies import Output
+from twpm.core.orchestrator import Orchestrator
+from twpm.core.primitives import (
+    DataScope,
+    DisplayMessageNode,
+    QuestionNode,
+    SubworkflowNode,
+    SummaryNode,
+)
+from twpm.core.registry import WorkflowRegistry
+
+
+class MockOutput:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text)
+
+
+def create_address_chain():
+    return Chain(
+        DisplayMessageNode(
+            message_func=lambda data: f"Address for {data.get('name', '?')}",
+            key="address_intro",
+        ),
+        QuestionNode("City", key="city"),
+        QuestionNode("Street", key="street"),
+    ).build()
+
+
+@pytest.fixture
+def registry():
+    registry = WorkflowRegistry()
+    registry.register("address", create_address_chain)
+    return registry
+
+
+def create_orchestrator(registry: WorkflowRegistry, output: MockOutput):
+    container = Container()
+    container.register(Output, lambda: output, ServiceScope.SINGLETON)
+    container.register(WorkflowRegistry, lambda: registry, ServiceScope.SINGLETON)
+    return Orchestrator(container=container)
+
+
+async def run(orchestrator: Orchestrator, head, answers: list[str]) -> ListData:
+    data = ListData(data={})
+    orchestrator.start("session", head, data=data)
+    await orchestrator.process()
+    for answer in answers:
+        await orchestrator.process(answer)
+    return data
+
+
+@pytest.mark.asyncio
+class TestSubworkflowNode:
+    async def test_isolated_scope_copies_inputs_and_outputs(self, registry):
+        output = MockOutput()
+        head = Chain(
+            QuestionNode("Name", key="name"),
+            SubworkflowNode("address", inputs=["name"], outputs=["city"]),
+            SummaryNode(title="Done", fields=[("City", "city")]),
+        ).build()
+        orchestrator = create_orchestrator(registry, output)
+
+        data = await run(orchestrator, head, ["John", "Lisbon", "Main St"])
+
+        assert orchestrator.is_finished
+        assert orchestrator.call_depth == 0
+        assert "Address for John" in output.messages
+        assert data["city"] == "Lisbon"
+        assert not data.has("street")
+        assert output.messages[-1] == "Done\n✅ Lisbon\n"
+
+    async def test_isolated_scope_copies_every_key_by_default(self, registry):
+        head = Chain(SubworkflowNode("address")).build()
+        orchestrator = create_orchestrator(registry, MockOutput())
+
+        data = await run(orchestrator, head, ["Lisbon", "Main St"])
+
+        assert data["city"] == "Lisbon"
+        assert data["street"] == "Main St"
+
+    async def test_shared_scope_uses_caller_data(self, registry):
+        output = MockOutput()
+        head = Chain(
+            QuestionNode("Name", key="name"),
+            SubworkflowNode("address", scope=DataScope.SHARED),
+        ).build()
+        orchestrator = create_orchestrator(registry, output)
+
+        data = await run(orchestrator, head, ["John", "Lisbon", "Main St"])
+
+        assert "Address for John" in output.messages
+        assert data["street"] == "Main St"
+
+    async def test_nested_calls_return_to_each_caller(self, registry):
+        registry.register(
+            "profile",
+            lambda: Chain(
+                QuestionNode("Name", key="name"),
+                SubworkflowNode("address", outputs=["city"]),
+            ).build(),
+        )
+        output = MockOutput()
+        head = Chain(
+            SubworkflowNode("profile", outputs=["name", "city"]),
+            DisplayMessageNode(message="Bye", key="bye"),
+        ).build()
+        orchestrator = create_orchestrator(registry, output)
+
+        data = await run(orchestrator, head, ["John", "Lisbon", "Main St"])
+
+        assert orchestrator.is_finished
+        assert data["name"] == "John"
+        assert data["city"] == "Lisbon"
+        assert output.messages[-1] == "Bye"
+
+    async def test_each_call_builds_fresh_nodes(self, registry):
+        head = Chain(
+            SubworkflowNode("address", key="home", outputs=["city"]),
+            SubworkflowNode("address", key="work", outputs=[]),
+        ).build()
+        orchestrator = create_orchestrator(registry, MockOutput())
+
+        data = await run(orchestrator, head, ["Lisbon", "A", "Porto", "B"])
+
+        assert orchestrator.is_finished
+        assert data["city"] == "Lisbon"
+
+    async def test_fails_without_registered_registry(self):
+        container = Container()
+        container.register(Output, lambda: MockOutput(), ServiceScope.SINGLETON)
+        orchestrator = Orchestrator(container=container)
+        node = SubworkflowNode("address")
+
+        orchestrator.start("session", node)
+        await orchestrator.process()
+
+        assert orchestrator.is_finished
+        assert node.status.name == "FAILED"
+
+    async def test_shared_scope_rejects_inputs(self):
+        with pytest.raises(ValueError):
+            SubworkflowNode("address", scope="shared", inputs=["name"])
+
+    async def test_definition_builds_subworkflow(self):
+        head = compile_definition(
+            {
+                "nodes": [
+                    {
+                        "type": "subworkflow",
+                        "key": "address",
+                        "workflow": "address",
+                        "outputs": ["city"],
+                    }
+                ]
+            }
+        ).build()
+
+        assert isinstance(head, SubworkflowNode)
+        assert head.outputs == ("city",)
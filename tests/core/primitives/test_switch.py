@@ -352,3 +352,19 @@ class TestSwitchNode:
 
         assert result.success is True
         assert switch_node.next == nodes["default"]
+
+    async def test_switch_node_accepts_expression_string(self, create_nodes):
+        """Test that an expression string is compiled into the switch function."""
+        nodes = create_nodes("case_a", "case_b", "default")
+
+        switch_node = SwitchNode(key="switch")
+        switch_node.set_switch(
+            "'a' if int(score) > 5 else 'b'",
+            {"a": nodes["case_a"], "b": nodes["case_b"]},
+            nodes["default"],
+        )
+
+        result = await switch_node.execute(ListData(data={"score": "7"}))
+
+        assert result.success is True
+        assert switch_node.next == nodes["case_a"]
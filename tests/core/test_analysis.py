@@ -0,0 +1,228 @@
+import pytest
+
+from twpm.core.analysis import Issue, WorkflowValidationError, analyze, validate
+from twpm.core.base import ListData, Node, NodeResult
+from twpm.core.chain import Chain
+from twpm.core.cursor import Cursor
+from twpm.core.primitives import (
+    ConditionalNode,
+    DisplayMessageNode,
+    ProgressNode,
+    QuestionNode,
+    QuizNode,
+    QuizSummaryNode,
+    SummaryNode,
+    SwitchNode,
+)
+
+
+class DummyNode(Node):
+    """Custom node that may write any key."""
+
+    async def execute(self, data: ListData) -> NodeResult:
+        return NodeResult(success=True, data={}, message="")
+
+
+def message(key: str) -> DisplayMessageNode:
+    return DisplayMessageNode(key=key, message=key)
+
+
+class TestAnalyze:
+    def test_valid_workflow_has_no_issues(self):
+        cond = ConditionalNode()
+        cond.set_condition("name == 'x'", message("yes"), message("no"))
+        head = Chain(QuestionNode("Name", key="name"), cond).build(validate=False)
+
+        assert analyze(head) == []
+
+    def test_reports_unconfigured_conditional(self):
+        head = Chain(ConditionalNode()).build(validate=False)
+
+        issues = analyze(head)
+
+        assert Issue("conditional", "Condition function is not set.") in issues
+        assert Issue("conditional", "Next node is not set.") in issues
+
+    def test_reports_switch_without_default(self):
+        switch = SwitchNode()
+        switch.switch_func = lambda data: "a"
+        switch.case_nodes = {"a": message("a")}
+        head = Chain(switch).build(validate=False)
+
+        assert analyze(head) == [Issue("switch", "Default node is not set.")]
+
+    def test_reports_duplicate_keys_once(self):
+        head = Chain(message("a"), message("a"), message("a")).build(validate=False)
+
+        assert analyze(head) == [Issue("a", "Duplicate node key.")]
+
+    def test_reports_duplicate_keys_in_branches(self):
+        cond = ConditionalNode()
+        cond.set_condition(lambda data: True, message("a"), message("b"))
+        head = Chain(message("a"), cond).build(validate=False)
+
+        assert analyze(head) == [Issue("a", "Duplicate node key.")]
+
+    def test_reports_fields_never_written(self):
+        head = Chain(
+            QuestionNode("Name", key="name"),
+            SummaryNode(title="Done", fields=[("Name", "name"), ("Age", "age")]),
+        ).build(validate=False)
+
+        assert analyze(head) == [Issue("summary", "Reads 'age' but no node writes it.")]
+
+    def test_reports_expression_fields_never_written(self):
+        cond = ConditionalNode()
+        cond.set_condition("int(age) > 18", message("adult"), message("minor"))
+        head = Chain(QuestionNode("Name", key="name"), cond).build(validate=False)
+
+        assert analyze(head) == [
+            Issue("conditional", "Reads 'age' but no node writes it.")
+        ]
+
+    def test_quiz_summary_reads_quiz_results(self):
+        head = Chain(
+            QuizNode("1 + 1?", ["1", "2"], "2", key="quiz1"),
+            QuizSummaryNode(title="Result", quiz_keys=["quiz1", "quiz2"]),
+        ).build(validate=False)
+
+        messages = {issue.message for issue in analyze(head)}
+
+        assert messages == {
+            "Reads 'quiz2' but no node writes it.",
+            "Reads 'quiz2_expected' but no node writes it.",
+            "Reads 'quiz2_correct' but no node writes it.",
+        }
+
+    def test_known_keys_are_not_reported(self):
+        cond = ConditionalNode()
+        cond.set_condition("tenant == 'a'", message("a"), message("other"))
+        head = Chain(QuestionNode("Name", key="name"), cond).build(validate=False)
+
+        assert analyze(head, known_keys=["tenant"]) == []
+
+    def test_skips_data_flow_check_with_unknown_writers(self):
+        head = Chain(
+            DummyNode("custom"),
+            ProgressNode(fields=[("Age", "age")]),
+        ).build(validate=False)
+
+        assert analyze(head) == []
+
+    def test_reports_branch_reusing_main_chain_node(self):
+        first = message("first")
+        cond = ConditionalNode()
+        cond.set_condition(lambda data: True, first, message("no"))
+        head = Chain(first, cond).build(validate=False)
+
+        issues = analyze(head)
+
+        assert len(issues) == 1
+        assert issues[0].node_key == "first"
+        assert "create a cycle" in issues[0].message
+
+    def test_reports_branch_containing_its_router(self):
+        cond = ConditionalNode()
+        branch = Chain(message("yes"), cond).build(validate=False)
+        cond.set_condition(lambda data: True, branch, message("n"))
+        cond.previous = None
+
+        issues = analyze(cond)
+
+        assert [issue.node_key for issue in issues] == ["conditional"]
+
+    def test_reports_next_cycle(self):
+        a = message("a")
+        b = message("b")
+        a.next = b
+        b.next = a
+
+        issues = analyze(a)
+
+        assert issues == [
+            Issue("a", "The main chain links back to this node, forming a cycle.")
+        ]
+
+    def test_reports_every_problem_together(self):
+        head = Chain(
+            ConditionalNode(),
+            message("a"),
+            message("a"),
+            SummaryNode(title="Done", fields=[("Age", "age")]),
+        ).build(validate=False)
+
+        assert len(analyze(head)) == 4
+
+
+class TestValidate:
+    def test_raises_with_all_issues(self):
+        head = Chain(ConditionalNode(), message("a"), message("a")).build(
+            validate=False
+        )
+
+        with pytest.raises(WorkflowValidationError) as error:
+            validate(head)
+
+        assert len(error.value.issues) == 3
+        assert "conditional: Condition function is not set." in str(error.value)
+
+    def test_marks_nodes_as_verified(self):
+        cond = ConditionalNode()
+        cond.set_condition(lambda data: True, message("yes"), message("no"))
+        head = Chain(message("start"), cond).build(validate=False)
+
+        validate(head)
+
+        assert all(node.verified for node in Cursor.walk(head))
+
+
+class TestChainValidation:
+    def test_build_validates_by_default(self):
+        with pytest.raises(WorkflowValidationError, match="Duplicate node key"):
+            Chain(message("a"), message("a")).build()
+
+    def test_build_marks_nodes_verified(self):
+        head = Chain(message("a"), message("b")).build()
+
+        assert head.verified
+        assert head.next.verified
+
+    def test_build_accepts_known_keys(self):
+        cond = ConditionalNode()
+        cond.set_condition("tenant == 'a'", message("a"), message("other"))
+        chain = Chain(message("welcome"), cond)
+
+        with pytest.raises(WorkflowValidationError, match="Reads 'tenant'"):
+            chain.compile()
+        head = chain.build(known_keys={"tenant"})
+
+        assert head.verified
+        assert chain.template(known_keys=("tenant",)).build().verified
+
+    def test_plain_text_with_braces_builds(self):
+        head = Chain(
+            DisplayMessageNode("hello", message="Hello {name}"),
+            QuestionNode('Reply with {"ok": true}', key="reply"),
+            SummaryNode(title="Done }", fields=[("Reply", "reply")]),
+        ).build()
+
+        assert head.verified
+
+    def test_build_can_skip_validation(self):
+        head = Chain(message("a"), message("a")).build(validate=False)
+
+        assert not head.verified
+
+
+@pytest.mark.asyncio
+class TestVerifiedExecution:
+    async def test_verified_conditional_skips_checks(self):
+        cond = ConditionalNode()
+        cond.set_condition(lambda data: True, message("yes"), message("no"))
+        Chain(cond).build()
+        cond.validate = lambda: pytest.fail("verified node must not validate")
+
+        result = await cond.execute(ListData(data={}))
+
+        assert result.success
+        assert cond.next.key == "yes"
@@ -0,0 +1,192 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from twpm.core.analytics import OTHER_ANSWER, WorkflowAnalytics
+from twpm.core.base import ListData
+from twpm.core.container import Container, ServiceScope
+from twpm.core.depedencies import Output
+from twpm.core.orchestrator import Orchestrator
+from twpm.core.primitives import (
+    PoolNode,
+    PoolOption,
+    QuestionBank,
+    QuestionBankNode,
+    QuizNode,
+    QuizSummaryNode,
+)
+
+
+class MockOutput:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build_quiz():
+    color = PoolNode(
+        question="Color?",
+        options=[PoolOption("Red"), PoolOption("Blue")],
+        key="color",
+    )
+    quiz = QuizNode("1 + 1?", ["1", "2"], "2", key="sum")
+    summary = QuizSummaryNode("Result", quiz_keys=["sum"], key="result")
+    color.next = quiz
+    quiz.previous = color
+    quiz.next = summary
+    summary.previous = quiz
+    return color
+
+
+def new_orchestrator(analytics: WorkflowAnalytics) -> Orchestrator:
+    container = Container()
+    container.register(Output, lambda: MockOutput(), ServiceScope.SINGLETON)
+    orchestrator = Orchestrator(container)
+    orchestrator.add_listener(analytics)
+    return orchestrator
+
+
+async def run_session(analytics, session_id, inputs):
+    orchestrator = new_orchestrator(analytics)
+    orchestrator.start(session_id, build_quiz(), ListData(data={}))
+    await orchestrator.process()
+    for user_input in inputs:
+        await orchestrator.process(input=user_input)
+    return orchestrator
+
+
+@pytest.mark.asyncio
+class TestWorkflowAnalytics:
+    async def test_counts_reach_and_completions(self):
+        analytics = WorkflowAnalytics()
+
+        await run_session(analytics, "s1", ["1", "2"])
+        await run_session(analytics, "s2", ["2"])
+
+        assert analytics.started == 2
+        assert analytics.finished == 1
+        assert analytics.reach == {"color": 2, "sum": 2, "result": 1}
+        assert analytics.completed == {"color": 2, "sum": 1, "result": 1}
+
+    async def test_dropoff_counts_waiting_and_abandoned_sessions(self):
+        analytics = WorkflowAnalytics(max_open_sessions=1)
+
+        await run_session(analytics, "s1", [])
+        await run_session(analytics, "s2", ["1"])
+
+        assert analytics.abandoned == {"color": 1}
+        assert analytics.dropoff() == {"color": 1, "sum": 1}
+
+    async def test_restarted_session_counts_as_abandoned(self):
+        analytics = WorkflowAnalytics()
+
+        await run_session(analytics, "s1", ["1"])
+        await run_session(analytics, "s1", ["1", "2"])
+
+        assert analytics.abandoned == {"sum": 1}
+        assert analytics.finished == 1
+
+    async def test_answer_distributions_and_scores(self):
+        analytics = WorkflowAnalytics(score_bins=4)
+
+        await run_session(analytics, "s1", ["1", "2"])
+        await run_session(analytics, "s2", ["2", "2"])
+        await run_session(analytics, "s3", ["2", "1"])
+
+        assert analytics.answers["color"] == {"Red": 1, "Blue": 2}
+        assert analytics.answers["sum"] == {"2": 2, "1": 1}
+        assert analytics.scores == {"result": [1, 0, 0, 2]}
+
+    async def test_rare_answers_are_grouped(self):
+        analytics = WorkflowAnalytics(max_answers=1)
+
+        await run_session(analytics, "s1", ["1"])
+        await run_session(analytics, "s2", ["2"])
+
+        assert analytics.answers["color"] == {"Red": 1, OTHER_ANSWER: 1}
+
+    async def test_saves_snapshots_in_the_background(self, tmp_path, monkeypatch):
+        clock = FakeClock()
+        path = tmp_path / "analytics.json"
+        analytics = WorkflowAnalytics(
+            snapshot_path=path, snapshot_interval=30, clock=clock
+        )
+        writers = []
+        write = WorkflowAnalytics._write
+
+        def record_thread(*args):
+            writers.append(threading.current_thread())
+            write(*args)
+
+        monkeypatch.setattr(WorkflowAnalytics, "_write", staticmethod(record_thread))
+
+        await run_session(analytics, "s1", ["1"])
+        clock.now = 31
+        await run_session(analytics, "s2", ["2"])
+
+        # The listener only scheduled the save
+        for _ in range(100):
+            if path.exists():
+                break
+            await asyncio.sleep(0.01)
+
+        saved = json.loads(path.read_text())
+        assert saved["started"] == 2
+        assert saved["answers"]["color"] == {"Red": 1, "Blue": 1}
+        assert writers and threading.main_thread() not in writers
+
+    async def test_flush_writes_pending_counters(self, tmp_path):
+        path = tmp_path / "analytics.json"
+        analytics = WorkflowAnalytics(snapshot_path=path, snapshot_interval=3600)
+
+        await run_session(analytics, "s1", ["1"])
+        assert not path.exists()
+
+        await analytics.flush()
+        assert json.loads(path.read_text())["answers"]["color"] == {"Red": 1}
+
+    async def test_question_bank_answers_are_counted_per_question(self):
+        bank = QuestionBank([("1 + 1?", ["1", "2"], "2"), ("2 + 2?", ["4", "5"], "4")])
+        analytics = WorkflowAnalytics()
+        orchestrator = new_orchestrator(analytics)
+        quiz = QuestionBankNode(bank, count=2, key="quiz", seed=7)
+        orchestrator.start("s1", quiz, ListData(data={}))
+        await orchestrator.process()
+        await orchestrator.process(input="1")
+        await orchestrator.process(input="1")
+
+        seed = 7
+        chosen = {
+            index: bank[index].options[bank.option_order(seed, index)[0]]
+            for index in bank.sample(seed, 2)
+        }
+        assert analytics.answers == {
+            f"quiz[{index}]": {answer: 1} for index, answer in chosen.items()
+        }
+
+    async def test_load_adds_saved_counters(self, tmp_path):
+        path = tmp_path / "analytics.json"
+        analytics = WorkflowAnalytics()
+        await run_session(analytics, "s1", ["1", "2"])
+        analytics.save(path)
+
+        restored = WorkflowAnalytics()
+        restored.load(path)
+        await run_session(restored, "s2", ["1", "1"])
+
+        assert restored.finished == 2
+        assert restored.answers["color"] == {"Red": 2}
+        assert restored.scores["result"][0] == 1
+        assert restored.scores["result"][-1] == 1
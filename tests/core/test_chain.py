@@ -2,6 +2,17 @@ import pytest
 
 from twpm.core.base import ListData, Node, NodeResult
 from twpm.core.chain import Chain, chain
+from twpm.core.container import Container, ServiceScope
+from twpm.core.depedencies import Output
+from twpm.core.orchestrator import Orchestrator
+from twpm.core.primitives import (
+    ConditionalNode,
+    DisplayMessageNode,
+    GotoNode,
+    ProgressNode,
+    QuestionNode,
+)
+from twpm.core.template import Template
 
 
 class DummyNode(Node):
@@ -291,3 +302,143 @@ class TestChain:
         # Assert
         assert head is node1
         assert node1.next is node2
+
+
+class MarkerNode(DummyNode):
+    """Subclass of DummyNode used to test type lookups."""
+
+
+def keys(head: Node) -> list[str]:
+    result = []
+    while head is not None:
+        result.append(head.key)
+        head = head.next
+    return result
+
+
+class TestChainCompile:
+    """Test suite for Chain.compile and node injection."""
+
+    def test_injections_follow_matching_nodes(self):
+        compiled = (
+            Chain(DummyNode("A"), MarkerNode("B"), DummyNode("C"))
+            .inject_after(MarkerNode, lambda node: DummyNode(f"{node.key}_audit"))
+            .with_progress(fields=[("B", "B")], after_each=MarkerNode)
+            .compile()
+        )
+
+        assert keys(compiled.head) == ["A", "B", "B_audit", "progress_1", "C"]
+        assert compiled.tail.key == "C"
+        assert len(compiled) == 5
+        assert compiled.tail.previous.key == "progress_1"
+
+    def test_with_progress_replaces_previous_configuration(self):
+        head = (
+            Chain(DummyNode("A"), DummyNode("B"))
+            .with_progress(fields=[], after_each=None)
+            .with_progress(fields=[], after_each=lambda node: node.key == "B")
+            .build()
+        )
+
+        assert keys(head) == ["A", "B", "progress_1"]
+
+    def test_find_by_type_uses_index(self):
+        compiled = (
+            Chain(DummyNode("A"), MarkerNode("B"), DummyNode("C"), MarkerNode("D"))
+            .with_progress(fields=[], after_each=MarkerNode)
+            .compile()
+        )
+
+        assert [n.key for n in compiled.find_by_type(MarkerNode)] == ["B", "D"]
+        assert [n.key for n in compiled.find_by_type(DummyNode)] == [
+            "A",
+            "B",
+            "C",
+            "D",
+        ]
+        assert [n.key for n in compiled.find_by_type((MarkerNode, ProgressNode))] == [
+            "B",
+            "progress_1",
+            "D",
+            "progress_2",
+        ]
+        assert compiled.nodes["C"].key == "C"
+
+    def test_prelinked_tail_is_kept_and_injected(self):
+        tail_head, tail_end = MarkerNode("X"), DummyNode("Y")
+        tail_head.next = tail_end
+
+        head = (
+            Chain(DummyNode("A"), tail_head)
+            .with_progress(fields=[], after_each=MarkerNode)
+            .build()
+        )
+
+        assert keys(head) == ["A", "X", "progress_1", "Y"]
+
+
+class MockOutput:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text)
+
+
+@pytest.mark.asyncio
+class TestChainTemplate:
+    """Test suite for ChainTemplate."""
+
+    async def test_builds_independent_copies(self):
+        template = Chain(DummyNode("A"), DummyNode("B")).template()
+
+        first = template.build()
+        second = template.build()
+
+        assert first is not second
+        assert first is not template.head
+        assert keys(first) == keys(second) == ["A", "B"]
+        assert first.next.previous is first
+        assert first.next.verified
+
+    async def test_copies_share_configuration(self):
+        question = QuestionNode("Email?", key="email")
+        head = Chain(question).template().build()
+
+        assert head is not question
+        assert head._question is question._question
+
+    async def test_relinks_branches_and_loop_targets(self):
+        condition = ConditionalNode(key="check")
+        condition.set_condition("retry == 'yes'", DummyNode("yes"), DummyNode("no"))
+        goto = GotoNode("start")
+        template = Chain(DummyNode("start"), condition, goto).template()
+
+        head = template.build()
+        copied_condition = head.next
+        copied_goto = copied_condition.next
+
+        assert copied_condition.true_node is not condition.true_node
+        assert copied_condition.true_node.key == "yes"
+        assert copied_goto.target_node is head
+
+    async def test_sessions_keep_separate_state(self):
+        template = Chain(
+            QuestionNode("Name?", key="name"),
+            DisplayMessageNode(message=Template("Hi {name}"), key="greet"),
+        ).template()
+        output = MockOutput()
+        container = Container()
+        container.register(Output, lambda: output, ServiceScope.SINGLETON)
+        first, second = Orchestrator(container), Orchestrator(container)
+        first.start("s1", template.build(), ListData(data={}))
+        second.start("s2", template.build(), ListData(data={}))
+
+        await first.process()
+        await second.process()
+        await first.process(input="Ana")
+
+        assert first.is_finished
+        assert not second.is_finished
+        await second.process(input="Rui")
+        assert output.messages[-1] == "Hi Rui"
@@ -0,0 +1,200 @@
+import random
+
+import pytest
+
+from twpm.core import codec
+from twpm.core.codec import (
+    CallSnapshot,
+    CodecError,
+    SessionSnapshot,
+    decode_session,
+    decode_workflow,
+    encode_session,
+    encode_workflow,
+)
+from twpm.core.definitions import compile_definition
+from twpm.core.primitives import ConditionalNode, PoolNode
+
+DEFINITION = {
+    "name": "onboarding",
+    "version": "1",
+    "nodes": [
+        {"type": "message", "key": "welcome", "message": "Welcome!"},
+        {"type": "question", "key": "user_name", "question": "Your name"},
+        {
+            "type": "pool",
+            "key": "plan",
+            "question": "Plan",
+            "options": ["Free", {"text": "Premium", "value": "premium"}],
+        },
+        {
+            "type": "conditional",
+            "key": "is_premium",
+            "condition": "plan == 'premium'",
+            "true": [{"type": "message", "key": "thanks", "message": "Thanks!"}],
+            "false": [{"type": "message", "key": "bye", "message": "Bye"}],
+        },
+    ],
+    "progress": {"fields": [["Name", "user_name"]], "after_each": ["question"]},
+}
+
+SNAPSHOT = SessionSnapshot(
+    session_id="session-1",
+    workflow="onboarding",
+    version="1",
+    node="plan",
+    data={
+        "user_name": "João",
+        "plan": "premium",
+        "count": -300,
+        "ratio": 0.25,
+        "tags": ["a", ("b", True)],
+        "nested": {"missing": None},
+    },
+)
+
+
+class TestWorkflowCodec:
+    def test_round_trip(self):
+        compiled = compile_definition(DEFINITION)
+
+        decoded = decode_workflow(encode_workflow(compiled))
+
+        assert decoded.specs == compiled.specs
+        assert (decoded.name, decoded.version, decoded.digest, decoded.head) == (
+            compiled.name,
+            compiled.version,
+            compiled.digest,
+            compiled.head,
+        )
+
+    def test_decoded_workflow_builds(self):
+        decoded = decode_workflow(encode_workflow(compile_definition(DEFINITION)))
+
+        head = decoded.build()
+
+        assert head.key == "welcome"
+        assert isinstance(head.next.next.next, PoolNode)
+        assert isinstance(head.next.next.next.next, ConditionalNode)
+
+    def test_rejects_other_message_kinds(self):
+        with pytest.raises(CodecError, match="kind"):
+            decode_workflow(encode_session(SNAPSHOT))
+
+
+class TestSessionCodec:
+    def test_round_trip(self):
+        assert decode_session(encode_session(SNAPSHOT)) == SNAPSHOT
+
+    def test_shared_key_table_shrinks_snapshots(self):
+        keys = ("_user_input", "user_name", "plan", "count")
+
+        encoded = encode_session(SNAPSHOT, keys=keys)
+
+        assert len(encoded) < len(encode_session(SNAPSHOT))
+        assert b"user_name" not in encoded
+        assert decode_session(encoded, keys=keys) == SNAPSHOT
+
+    def test_rejects_different_key_table(self):
+        encoded = encode_session(SNAPSHOT, keys=("user_name", "plan"))
+
+        with pytest.raises(CodecError, match="key table"):
+            decode_session(encoded, keys=("plan", "user_name"))
+
+    @pytest.mark.parametrize(
+        "message",
+        [b"", b"JSON\x01\x02", b"TWPM\x09\x02"],
+        ids=["empty", "magic", "version"],
+    )
+    def test_rejects_invalid_headers(self, message):
+        with pytest.raises(CodecError):
+            decode_session(message)
+
+    def test_rejects_truncated_messages(self):
+        encoded = encode_session(SNAPSHOT)
+
+        for size in range(6, len(encoded)):
+            with pytest.raises(CodecError):
+                decode_session(encoded[:size])
+
+    def test_rejects_unsupported_values(self):
+        snapshot = SNAPSHOT._replace(data={"when": object()})
+
+        with pytest.raises(CodecError, match="object"):
+            encode_session(snapshot)
+
+    def test_round_trip_with_call_stack(self):
+        snapshot = SNAPSHOT._replace(
+            workflow="address",
+            node="street",
+            data={"street": "Rua Augusta"},
+            calls=(
+                CallSnapshot("onboarding", "1", "plan", {"user_name": "João"}, None),
+                CallSnapshot("address", "2", None, None, ("street", "city")),
+            ),
+        )
+
+        assert decode_session(encode_session(snapshot)) == snapshot
+
+    def test_round_trip_of_packed_strings(self):
+        data = {f"field_{i}": "ação " * (i % 70) for i in range(300)}
+        snapshot = SNAPSHOT._replace(
+            data={**data, "list": list(data), "tuple": tuple(data.values())}
+        )
+
+        assert decode_session(encode_session(snapshot)) == snapshot
+        decoded = decode_session(encode_session(snapshot, keys=list(data)), list(data))
+        assert decoded == snapshot
+        assert type(decoded.data["tuple"]) is tuple
+
+    def test_round_trip_with_duplicate_shared_keys(self):
+        keys = ("a", "a", "b")
+        snapshot = SNAPSHOT._replace(data={"a": "1", "b": "2", "c": "3", "d": "4"})
+
+        encoded = encode_session(snapshot, keys=keys)
+
+        assert decode_session(encoded, keys=keys) == snapshot
+
+    def test_rejects_deeply_nested_values(self, monkeypatch):
+        nested: list = []
+        for _ in range(200):
+            nested = [nested]
+
+        with pytest.raises(CodecError, match="nested"):
+            encode_session(SNAPSHOT._replace(data={"nested": nested}))
+
+        monkeypatch.setattr(codec, "MAX_DEPTH", 1000)
+        encoded = encode_session(SNAPSHOT._replace(data={"nested": nested}))
+        monkeypatch.undo()
+
+        with pytest.raises(CodecError, match="nested"):
+            decode_session(encoded)
+
+    def test_rejects_crafted_nesting_without_recursion_error(self):
+        empty = encode_session(SessionSnapshot("", "w", "v", None, {}))
+        # Drop the node, data and call stack, then nest lists endlessly
+        crafted = empty[:-4] + b"\x06\x01" * 100_000
+
+        with pytest.raises(CodecError, match="nested"):
+            decode_session(crafted)
+
+    def test_rejects_self_referencing_values(self):
+        loop: list = []
+        loop.append(loop)
+
+        with pytest.raises(CodecError, match="nested"):
+            encode_session(SNAPSHOT._replace(data={"loop": loop}))
+
+    def test_corrupted_messages_raise_codec_errors(self):
+        data = {**SNAPSHOT.data, **{f"field_{i}": f"value {i}" for i in range(10)}}
+        encoded = encode_session(SNAPSHOT._replace(data=data))
+        rng = random.Random(1)
+
+        for _ in range(500):
+            corrupted = bytearray(encoded)
+            for _ in range(rng.randint(1, 3)):
+                corrupted[rng.randrange(6, len(corrupted))] = rng.randrange(256)
+            try:
+                decode_session(bytes(corrupted))
+            except CodecError:
+                pass
@@ -1,7 +1,7 @@
 import pytest
 
 from twpm.core.base import ListData, Node, NodeResult
-from twpm.core.cursor import Cursor
+from twpm.core.cursor import Cursor, Segment
 
 
 class DummyNode(Node):
@@ -399,3 +399,93 @@ class TestCursor:
 
         nodes_backward.reverse()
         assert nodes_backward == nodes_forward
+
+
+def assert_linked(head: Node, *names: str) -> None:
+    """Assert a chain has the given nodes, with consistent previous links."""
+    nodes = []
+    current, previous = head, None
+    while current is not None:
+        assert current.previous is previous
+        nodes.append(current.name)
+        previous, current = current, current.next
+    assert nodes == list(names)
+
+
+class TestSegment:
+    """Test suite for Segment."""
+
+    def test_links_nodes_in_order(self):
+        segment = Segment(DummyNode("A"), DummyNode("B"), DummyNode("C"))
+
+        assert len(segment) == 3
+        assert segment.tail.name == "C"
+        assert [node.name for node in segment] == ["A", "B", "C"]
+        assert_linked(segment.head, "A", "B", "C")
+
+    def test_append_node_and_segment(self):
+        segment = Segment(DummyNode("A"))
+        other = Segment(DummyNode("C"), DummyNode("D"))
+
+        segment.append(DummyNode("B")).append(other)
+
+        assert len(segment) == 4
+        assert segment.tail.name == "D"
+        assert len(other) == 0
+        assert_linked(segment.head, "A", "B", "C", "D")
+
+    def test_append_to_empty_segment(self):
+        segment = Segment()
+
+        segment.append(Segment(DummyNode("A"), DummyNode("B")))
+
+        assert segment.head.name == "A"
+        assert segment.tail.name == "B"
+
+    def test_insert_after_middle_and_tail(self):
+        node_a, node_d = DummyNode("A"), DummyNode("D")
+        segment = Segment(node_a, node_d)
+
+        segment.insert_after(node_a, Segment(DummyNode("B"), DummyNode("C")))
+        segment.insert_after(segment.tail, DummyNode("E"))
+
+        assert len(segment) == 5
+        assert segment.tail.name == "E"
+        assert_linked(segment.head, "A", "B", "C", "D", "E")
+
+    def test_rejects_linked_node(self):
+        node_a, node_b = DummyNode("A"), DummyNode("B")
+        node_a.next = node_b
+
+        with pytest.raises(ValueError, match="from_head"):
+            Segment(DummyNode("X")).append(node_a)
+
+    def test_from_head_finds_tail_and_fixes_previous(self):
+        node_a, node_b, node_c = DummyNode("A"), DummyNode("B"), DummyNode("C")
+        node_a.next = node_b
+        node_b.next = node_c
+
+        segment = Segment.from_head(node_a)
+
+        assert segment.tail is node_c
+        assert len(segment) == 3
+        assert_linked(node_a, "A", "B", "C")
+
+    def test_cursor_insert_sets_previous_links(self):
+        node_a, node_d = DummyNode("A"), DummyNode("D")
+        Segment(node_a, node_d)
+
+        Cursor.insert(node_a, Segment(DummyNode("B"), DummyNode("C")))
+
+        assert_linked(node_a, "A", "B", "C", "D")
+
+    def test_cursor_insert_with_known_end(self):
+        node_a, node_d = DummyNode("A"), DummyNode("D")
+        Segment(node_a, node_d)
+        node_b, node_c = DummyNode("B"), DummyNode("C")
+        node_b.next = node_c
+        node_c.previous = node_b
+
+        Cursor.insert(node_a, node_b, end=node_c)
+
+        assert_linked(node_a, "A", "B", "C", "D")
@@ -0,0 +1,383 @@
+import hashlib
+import json
+import random
+
+import pytest
+
+from twpm.core import definitions
+from twpm.core.base import ListData
+from twpm.core.container import Container, ServiceScope
+from twpm.core.cursor import Cursor
+from twpm.core.definitions import (
+    CompiledWorkflow,
+    DefinitionError,
+    compile_definition,
+    load_definition,
+    load_workflow,
+    loads_definition,
+)
+from twpm.core.depedencies import Output
+from twpm.core.orchestrator import Orchestrator
+from twpm.core.primitives import (
+    ConditionalNode,
+    DisplayMessageNode,
+    LoopNode,
+    PoolNode,
+    PoolOption,
+    ProgressNode,
+    QuestionNode,
+    QuizNode,
+    QuizSummaryNode,
+    SummaryNode,
+    SwitchNode,
+    TaskNode,
+)
+
+
+class MockOutput:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text)
+
+
+async def save_lead(data: ListData) -> bool:
+    data["saved"] = "yes"
+    return True
+
+
+async def load_options(data: ListData) -> list[PoolOption]:
+    return [PoolOption("A"), PoolOption("B")]
+
+
+DEFINITION = {
+    "name": "onboarding",
+    "version": "2",
+    "nodes": [
+        {"type": "message", "key": "welcome", "message": "Welcome!"},
+        {"type": "question", "key": "user_name", "question": "Your name"},
+        {
+            "type": "pool",
+            "key": "plan",
+            "question": "Plan",
+            "options": ["Free", {"text": "Premium", "value": "premium"}],
+        },
+        {
+            "type": "conditional",
+            "key": "is_premium",
+            "condition": "plan == 'premium'",
+            "true": [{"type": "message", "key": "thanks", "message": "Thanks!"}],
+            "false": [{"type": "task", "key": "save", "function": "save_lead"}],
+        },
+        {
+            "type": "summary",
+            "title": "Done",
+            "fields": [["Name", "user_name"], ["Plan", "plan"]],
+        },
+    ],
+    "progress": {"fields": [["Name", "user_name"]], "after_each": ["question"]},
+}
+
+
+def collect_keys(head):
+    keys = []
+    while head is not None:
+        keys.append(head.key)
+        head = head.next
+    return keys
+
+
+class TestCompileDefinition:
+    def test_compiles_metadata(self):
+        compiled = compile_definition(DEFINITION)
+
+        assert compiled.name == "onboarding"
+        assert compiled.version == "2"
+        assert len(compiled.digest) == 64
+
+    def test_builds_linked_chain_with_progress(self):
+        head = compile_definition(DEFINITION).build({"save_lead": save_lead})
+
+        assert collect_keys(head) == [
+            "welcome",
+            "user_name",
+            "progress_1",
+            "plan",
+            "is_premium",
+            "summary",
+        ]
+        assert head.next.previous is head
+
+    def test_builds_every_primitive(self):
+        definition = {
+            "nodes": [
+                {"type": "message", "key": "m", "message": "Hi"},
+                {"type": "question", "key": "q", "question": "Q"},
+                {"type": "pool", "key": "p", "question": "P", "options": ["A"]},
+                {
+                    "type": "pool",
+                    "key": "p2",
+                    "question": "P",
+                    "options": {"function": "load_options"},
+                },
+                {
+                    "type": "quiz",
+                    "key": "z",
+                    "question": "Z",
+                    "options": ["1", "2"],
+                    "expected_answer": "2",
+                },
+                {"type": "quiz_summary", "title": "T", "quiz_keys": ["z"]},
+                {"type": "progress", "fields": [["Q", "q"]]},
+                {"type": "summary", "title": "S", "fields": [["Q", "q"]]},
+                {"type": "task", "key": "t", "function": "save_lead"},
+                {
+                    "type": "switch",
+                    "switch": "q",
+                    "cases": {"a": [{"type": "message", "key": "a", "message": "A"}]},
+                    "default": [{"type": "message", "key": "d", "message": "D"}],
+                },
+            ]
+        }
+
+        head = compile_definition(definition).build(
+            {"save_lead": save_lead, "load_options": load_options}
+        )
+
+        types = [type(node) for node in Cursor.walk(head)]
+        assert types == [
+            DisplayMessageNode,
+            QuestionNode,
+            PoolNode,
+            PoolNode,
+            QuizNode,
+            QuizSummaryNode,
+            ProgressNode,
+            SummaryNode,
+            TaskNode,
+            SwitchNode,
+            DisplayMessageNode,
+            DisplayMessageNode,
+        ]
+
+    def test_each_build_creates_fresh_nodes(self):
+        compiled = compile_definition(DEFINITION)
+        functions = {"save_lead": save_lead}
+
+        assert compiled.build(functions) is not compiled.build(functions)
+
+    def test_conditional_branches_are_set(self):
+        head = compile_definition(DEFINITION).build({"save_lead": save_lead})
+        conditional = next(n for n in Cursor.walk(head) if n.key == "is_premium")
+
+        assert isinstance(conditional, ConditionalNode)
+        assert conditional.true_node.key == "thanks"
+        assert conditional.false_node.key == "save"
+
+    def test_loop_target_is_bound(self):
+        head = compile_definition(
+            {
+                "nodes": [
+                    {"type": "question", "key": "email", "question": "Email"},
+                    {"type": "loop", "target": "email", "until": "'@' in email"},
+                ]
+            }
+        ).build()
+
+        assert isinstance(head.next, LoopNode)
+        assert head.next.target_node is head
+
+    def test_layout_covers_declared_keys(self):
+        compiled = compile_definition(DEFINITION)
+
+        assert "user_name" in compiled.layout
+        assert "plan" in compiled.layout
+
+    @pytest.mark.parametrize(
+        ("definition", "match"),
+        [
+            ([], "must be a JSON object"),
+            ({"nodes": []}, "non-empty list"),
+            ({"nodes": [{"type": "unknown", "key": "x"}]}, "unknown node type"),
+            ({"nodes": [{"type": "question", "question": "Q"}]}, "missing 'key'"),
+            ({"nodes": [{"type": "question", "key": "q"}]}, "requires 'question'"),
+            ({"nodes": [{"type": "message", "key": "m"}]}, "'message' requires"),
+            (
+                {
+                    "nodes": [
+                        {
+                            "type": "conditional",
+                            "condition": "a.b",
+                            "true": [{"type": "message", "key": "m", "message": ""}],
+                            "false": [{"type": "message", "key": "n", "message": ""}],
+                        }
+                    ]
+                },
+                "Unsupported syntax",
+            ),
+            (
+                {"nodes": [{"type": "summary", "title": "T", "fields": ["x"]}]},
+                "label, key",
+            ),
+            (
+                {"nodes": [{"type": "question", "key": "q", "question": 1}]},
+                "expected a string",
+            ),
+            (
+                {
+                    "nodes": [
+                        {"type": "message", "key": "m", "message": {"template": "{"}}
+                    ]
+                },
+                "Invalid template",
+            ),
+            (
+                {"nodes": [{"type": "goto", "target": "x", "max_iterations": 0}]},
+                "positive integer",
+            ),
+        ],
+    )
+    def test_rejects_invalid_definitions(self, definition, match):
+        with pytest.raises(DefinitionError, match=match):
+            compile_definition(definition)
+
+    async def test_texts_are_literal_unless_templates(self):
+        output = MockOutput()
+        container = Container()
+        container.register(Output, lambda: output, ServiceScope.SINGLETON)
+        compiled = compile_definition(
+            {
+                "nodes": [
+                    {"type": "question", "key": "name", "question": "Name {x}"},
+                    {
+                        "type": "message",
+                        "key": "hi",
+                        "message": {"template": "Hi {name}"},
+                    },
+                ]
+            }
+        )
+        orchestrator = Orchestrator(container)
+        orchestrator.start("s", compiled.build(), compiled.layout.new_data())
+
+        await orchestrator.process()
+        await orchestrator.process("Ana")
+
+        assert "Name {x}" in output.messages[0]
+        assert output.messages[-1] == "Hi Ana"
+
+    def test_build_rejects_missing_function(self):
+        compiled = compile_definition(DEFINITION)
+
+        with pytest.raises(DefinitionError, match="unknown function 'save_lead'"):
+            compiled.build()
+
+
+class TestLoadDefinition:
+    def test_loads_from_file(self, tmp_path):
+        path = tmp_path / "workflow.json"
+        path.write_text(json.dumps(DEFINITION))
+
+        head = load_workflow(path, functions={"save_lead": save_lead})
+
+        assert head.key == "welcome"
+
+    def test_invalid_json_raises_definition_error(self):
+        with pytest.raises(DefinitionError, match="Invalid JSON"):
+            loads_definition("{not json")
+
+    def test_writes_and_reuses_cache(self, tmp_path, monkeypatch):
+        path = tmp_path / "workflow.json"
+        path.write_text(json.dumps(DEFINITION))
+        cache_dir = tmp_path / "cache"
+
+        first = load_definition(path, cache_dir=cache_dir)
+        assert len(list(cache_dir.iterdir())) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("definition should be loaded from cache")
+
+        monkeypatch.setattr(definitions, "compile_definition", fail)
+        second = load_definition(path, cache_dir=cache_dir)
+
+        assert isinstance(second, CompiledWorkflow)
+        assert second.digest == first.digest
+        assert second.specs == first.specs
+
+    def test_changed_content_misses_cache(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+
+        loads_definition(json.dumps(DEFINITION), cache_dir=cache_dir)
+        changed = dict(DEFINITION, version="3")
+        compiled = loads_definition(json.dumps(changed), cache_dir=cache_dir)
+
+        assert compiled.version == "3"
+        assert len(list(cache_dir.iterdir())) == 2
+
+    def test_corrupted_cache_is_ignored(self, tmp_path):
+        content = json.dumps(DEFINITION)
+        cache_dir = tmp_path / "cache"
+        loads_definition(content, cache_dir=cache_dir)
+        for cache_file in cache_dir.iterdir():
+            cache_file.write_bytes(b"garbage")
+
+        compiled = loads_definition(content, cache_dir=cache_dir)
+
+        assert compiled.name == "onboarding"
+
+    def test_damaged_cache_entries_are_recompiled(self, tmp_path):
+        content = json.dumps(DEFINITION)
+        cache_dir = tmp_path / "cache"
+        loads_definition(content, cache_dir=cache_dir)
+        (cache_file,) = cache_dir.iterdir()
+        valid = cache_file.read_bytes()
+        assert valid[4:8] == b"TWPM"
+
+        rng = random.Random(3)
+        for _ in range(200):
+            damaged = bytearray(valid)
+            for _ in range(rng.randint(1, 4)):
+                damaged[rng.randrange(len(damaged))] = rng.randrange(256)
+            cache_file.write_bytes(bytes(damaged[: rng.randint(1, len(damaged))]))
+
+            compiled = loads_definition(content, cache_dir=cache_dir)
+
+            assert compiled.name == "onboarding"
+            compiled.build({"save_lead": save_lead})
+
+    def test_cache_entry_of_another_definition_is_ignored(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        other = loads_definition(
+            json.dumps(dict(DEFINITION, name="other")), cache_dir=cache_dir
+        )
+        content = json.dumps(DEFINITION)
+        (other_file,) = cache_dir.iterdir()
+        digest = hashlib.sha256(content.encode()).hexdigest()
+        other_file.rename(cache_dir / other_file.name.replace(other.digest, digest))
+
+        compiled = loads_definition(content, cache_dir=cache_dir)
+
+        assert compiled.name == "onboarding"
+
+
+@pytest.mark.asyncio
+class TestDefinitionExecution:
+    async def test_runs_loaded_workflow(self):
+        output = MockOutput()
+        container = Container()
+        container.register(Output, lambda: output, ServiceScope.SINGLETON)
+        orchestrator = Orchestrator(container)
+        compiled = compile_definition(DEFINITION)
+        head = compiled.build({"save_lead": save_lead})
+        data = compiled.layout.new_data()
+
+        orchestrator.start("session", head, data=data)
+        await orchestrator.process()
+        await orchestrator.process("John")
+        await orchestrator.process("1")
+
+        assert orchestrator.is_finished
+        assert data["user_name"] == "John"
+        assert data["plan"] == "Free"
+        assert data["saved"] == "yes"
@@ -0,0 +1,81 @@
+import pickle
+
+import pytest
+
+from twpm.core.base import ListData
+from twpm.core.expressions import Expression, ExpressionError, compile_expression
+from twpm.core.layout import DataLayout
+
+
+class TestExpression:
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            ("name == 'John'", True),
+            ("name != 'John'", False),
+            ("int(score) >= 3", True),
+            ("int(score) * 2 + 1", 9),
+            ("int(score) // 3 == 1 and int(score) % 3 == 1", True),
+            ("name in ['John', 'Mary']", True),
+            ("name not in ('John',)", False),
+            ("1 < int(score) < 5", True),
+            ("not missing", True),
+            ("missing is None", None),
+            ("'yes' if int(score) > 3 else 'no'", "yes"),
+            ("lower(name) == 'john'", True),
+            ("len(name)", 4),
+            ("field('user-email') == 'a@b.c'", True),
+        ],
+    )
+    def test_evaluates_expression(self, source, expected):
+        data = ListData(data={"name": "John", "score": "4", "user-email": "a@b.c"})
+
+        if expected is None:
+            with pytest.raises(ExpressionError):
+                Expression(source)
+            return
+
+        assert Expression(source)(data) == expected
+
+    def test_missing_field_is_none(self):
+        assert Expression("missing")(ListData(data={})) is None
+
+    def test_collects_referenced_names(self):
+        expression = Expression("int(a) > int(b) or field('c-d') == a")
+
+        assert expression.names == ("a", "b", "c-d")
+
+    def test_works_with_compact_data(self):
+        data = DataLayout(["score"]).new_data({"score": "10"})
+
+        assert Expression("int(score) == 10")(data) is True
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "__import__('os')",
+            "name.upper()",
+            "open('file')",
+            "name[0]",
+            "[x for x in name]",
+            "lambda: 1",
+            "field(name)",
+            "int(name, base=2)",
+            "__class__",
+            "name =",
+        ],
+    )
+    def test_rejects_unsafe_or_invalid_syntax(self, source):
+        with pytest.raises(ExpressionError):
+            Expression(source)
+
+    def test_pickles_by_source(self):
+        expression = Expression("int(score) > 1")
+
+        restored = pickle.loads(pickle.dumps(expression))
+
+        assert restored == expression
+        assert restored(ListData(data={"score": "2"})) is True
+
+    def test_compile_expression_reuses_instances(self):
+        assert compile_expression("a == b") is compile_expression("a == b")
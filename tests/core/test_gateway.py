@@ -0,0 +1,280 @@
+import asyncio
+import json
+
+import pytest
+
+from twpm.core import Chain
+from twpm.core.analytics import WorkflowAnalytics
+from twpm.core.container import Container
+from twpm.core.gateway import InboundMessage, WebhookGateway, parse_message
+from twpm.core.primitives import DisplayMessageNode, QuestionNode
+from twpm.core.template import Template
+
+
+class FakeProvider:
+    """Messaging provider collecting the replies sent to each session."""
+
+    def __init__(self):
+        self.sent: dict[str, list[str]] = {}
+
+    def output(self, session_id: str) -> "FakeOutput":
+        return FakeOutput(self.sent.setdefault(session_id, []))
+
+
+class FakeOutput:
+    def __init__(self, messages: list[str]):
+        self.messages = messages
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text.strip())
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def signup_template():
+    return (
+        Chain()
+        .add(QuestionNode("Name", key="name"))
+        .add(QuestionNode("City", key="city"))
+        .add(DisplayMessageNode("bye", message=Template("Bye {name} from {city}")))
+        .template()
+    )
+
+
+def new_gateway(provider: FakeProvider, **options) -> WebhookGateway:
+    return WebhookGateway(
+        signup_template().build, Container(), provider.output, **options
+    )
+
+
+async def request(writer, reader, method, path, body=b"", headers=""):
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\n"
+        f"Content-Length: {len(body)}\r\n{headers}\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ")[1])
+    length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+    return status, json.loads(await reader.readexactly(length))
+
+
+def message(session_id, text=None):
+    return json.dumps({"session_id": session_id, "text": text}).encode()
+
+
+@pytest.mark.asyncio
+class TestWebhookGateway:
+    async def test_drives_sessions_end_to_end(self):
+        provider = FakeProvider()
+        async with new_gateway(provider) as gateway:
+            await gateway.start(port=0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", gateway.port)
+
+            # One keep-alive connection carries every message
+            for session_id, text in [
+                ("alice", "hi"),
+                ("bob", None),
+                ("alice", "Alice"),
+                ("bob", "Bob"),
+                ("alice", "Paris"),
+            ]:
+                status, body = await request(
+                    writer, reader, "POST", "/webhook", message(session_id, text)
+                )
+                assert status == 202
+                assert body == {"status": "accepted"}
+            await gateway.drain()
+
+            writer.close()
+
+        assert provider.sent["alice"] == ["? Name:", "? City:", "Bye Alice from Paris"]
+        assert provider.sent["bob"] == ["? Name:", "? City:"]
+        assert gateway.session("alice") is None
+        assert gateway.session("bob").current_node.key == "city"
+
+    async def test_rejects_invalid_requests(self):
+        provider = FakeProvider()
+        async with new_gateway(provider, max_body_size=100) as gateway:
+            await gateway.start(port=0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", gateway.port)
+
+            assert (await request(writer, reader, "GET", "/webhook"))[0] == 405
+            assert (await request(writer, reader, "POST", "/other", b"{}"))[0] == 404
+            status, body = await request(writer, reader, "POST", "/webhook", b"[1")
+            assert status == 400
+            status, body = await request(writer, reader, "POST", "/webhook", b"{}")
+            assert body == {"error": "session_id must be a non-empty string"}
+
+            status, _ = await request(writer, reader, "POST", "/webhook", b"x" * 101)
+            assert status == 413
+            # The connection is closed after an unreadable body
+            assert await reader.read() == b""
+            writer.close()
+
+        assert gateway.session_count == 0
+
+    async def test_closes_connections_with_a_stalled_body(self):
+        provider = FakeProvider()
+        async with new_gateway(provider, keep_alive_timeout=0.1) as gateway:
+            await gateway.start(port=0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", gateway.port)
+
+            writer.write(b"POST /webhook HTTP/1.1\r\nContent-Length: 100\r\n\r\n{")
+            await writer.drain()
+
+            assert await asyncio.wait_for(reader.read(), 1) == b""
+            writer.close()
+
+        assert gateway.session_count == 0
+
+    async def test_pipelined_requests_and_connection_close(self):
+        provider = FakeProvider()
+        async with new_gateway(provider) as gateway:
+            await gateway.start(port=0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", gateway.port)
+
+            body = message("carol")
+            single = (
+                b"POST /webhook HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body)
+                + body
+            )
+            last = (
+                b"POST /webhook HTTP/1.1\r\nConnection: close\r\n"
+                b"Content-Length: %d\r\n\r\n" % len(body) + body
+            )
+            writer.write(single * 3 + last)
+
+            responses = await reader.read()
+            assert responses.count(b"HTTP/1.1 202 Accepted") == 4
+            assert responses.endswith(
+                b"Connection: close\r\n\r\n" + b'{"status":"accepted"}'
+            )
+            await gateway.drain()
+            writer.close()
+
+        assert provider.sent["carol"] == ["? Name:"]
+
+    async def test_ignored_payloads(self):
+        def parse(payload):
+            if payload.get("type") == "receipt":
+                return None
+            return parse_message(payload)
+
+        provider = FakeProvider()
+        async with new_gateway(provider, parse=parse) as gateway:
+            await gateway.start(port=0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", gateway.port)
+
+            status, body = await request(
+                writer, reader, "POST", "/webhook", b'{"type": "receipt"}'
+            )
+
+            assert status == 200
+            assert body == {"status": "ignored"}
+            assert gateway.session_count == 0
+            writer.close()
+
+    async def test_messages_of_a_session_are_processed_in_order(self):
+        provider = FakeProvider()
+        gateway = new_gateway(provider)
+
+        for text in ["start", "Dana", "Lyon", "again"]:
+            gateway.submit(InboundMessage("dana", text))
+        await gateway.drain()
+
+        # The message after the end starts the workflow over
+        assert provider.sent["dana"] == [
+            "? Name:",
+            "? City:",
+            "Bye Dana from Lyon",
+            "? Name:",
+        ]
+        assert gateway.session("dana").current_node.key == "name"
+
+    async def test_drops_idle_and_excess_sessions(self):
+        clock = FakeClock()
+        gateway = new_gateway(
+            FakeProvider(), max_sessions=2, idle_timeout=10.0, clock=clock
+        )
+
+        for session_id in ["a", "b", "c"]:
+            gateway.submit(InboundMessage(session_id, None))
+        await gateway.drain()
+        assert gateway.session("a") is None
+        assert gateway.session_count == 2
+
+        clock.now = 20.0
+        gateway.submit(InboundMessage("d", None))
+        await gateway.drain()
+
+        assert gateway.session("b") is None
+        assert gateway.session("c") is None
+        assert gateway.session_count == 1
+
+    async def test_busy_sessions_are_not_dropped(self):
+        provider = FakeProvider()
+        gateway = new_gateway(provider, max_sessions=1)
+
+        gateway.submit(InboundMessage("a", None))
+        gateway.submit(InboundMessage("b", None))
+        orchestrator = gateway.session("a")
+        gateway.submit(InboundMessage("a", "Dana"))
+
+        # Both sessions still have a message to process
+        assert gateway.session_count == 2
+        assert gateway.session("a") is orchestrator
+
+        await gateway.drain()
+        assert provider.sent["a"] == ["? Name:", "? City:"]
+        assert gateway.session_count == 1
+
+    async def test_failures_outside_the_workflow_answer_500(self):
+        def workflow():
+            raise RuntimeError("registry unavailable")
+
+        def parse(payload):
+            if payload.get("type") == "crash":
+                raise RuntimeError("parser bug")
+            return parse_message(payload)
+
+        async with WebhookGateway(
+            workflow, Container(), FakeProvider().output, parse=parse
+        ) as gateway:
+            await gateway.start(port=0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", gateway.port)
+
+            crash = b'{"type": "crash"}'
+            assert (await request(writer, reader, "POST", "/webhook", crash))[0] == 500
+            status, body = await request(
+                writer, reader, "POST", "/webhook", message("a", "hi")
+            )
+            assert status == 500
+            assert body == {"error": "Internal Server Error"}
+            assert gateway.session_count == 0
+
+            # The connection is still usable
+            gateway.workflow = signup_template().build
+            status, _ = await request(
+                writer, reader, "POST", "/webhook", message("a", "hi")
+            )
+            assert status == 202
+            writer.close()
+
+    async def test_listeners_see_every_session(self):
+        analytics = WorkflowAnalytics()
+        gateway = new_gateway(FakeProvider(), listeners=[analytics])
+
+        gateway.submit(InboundMessage("a", None))
+        gateway.submit(InboundMessage("b", None))
+        await gateway.drain()
+
+        assert analytics.started == 2
+        assert analytics.reach == {"name": 2}
@@ -0,0 +1,143 @@
+import pytest
+
+from twpm.core.base import CompactListData, ListData
+from twpm.core.chain import Chain
+from twpm.core.layout import DataLayout
+from twpm.core.primitives import (
+    ConditionalNode,
+    DisplayMessageNode,
+    ProgressNode,
+    QuestionNode,
+    QuizNode,
+    SummaryNode,
+)
+
+
+class MockOutput:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text)
+
+
+class TestDataLayout:
+    def test_assigns_slots_in_order_without_duplicates(self):
+        layout = DataLayout(["a", "b", "a", "c"])
+
+        assert layout.keys == ("a", "b", "c")
+        assert layout.slot("b") == 1
+        assert layout.slot("missing") is None
+        assert len(layout) == 3
+
+    def test_from_chain_collects_node_and_field_keys(self):
+        head = (
+            Chain()
+            .add(DisplayMessageNode(message="Hi", key="welcome"))
+            .add(QuestionNode("Name", key="user_name"))
+            .add(QuestionNode("Email", key="email"))
+            .add(QuizNode("1 + 1?", ["1", "2"], "2", key="quiz1"))
+            .add(SummaryNode(title="Done", fields=[("Email", "email")]))
+            .build()
+        )
+
+        layout = DataLayout.from_chain(head)
+
+        assert "_user_input" in layout
+        assert "user_name" in layout
+        assert "quiz1_correct" in layout
+        assert "email" in layout
+        assert "welcome" not in layout
+
+    def test_from_chain_includes_branch_nodes(self):
+        cond = ConditionalNode()
+        cond.set_condition(
+            lambda data: True,
+            QuestionNode("A", key="branch_a"),
+            QuestionNode("B", key="branch_b"),
+        )
+
+        layout = DataLayout.from_chain(Chain(cond).build())
+
+        assert "branch_a" in layout
+        assert "branch_b" in layout
+
+    def test_plan_is_cached(self):
+        layout = DataLayout(["a", "b"])
+
+        plan = layout.plan(("b", "x"))
+
+        assert plan == (1, None)
+        assert layout.plan(("b", "x")) is plan
+
+
+class TestCompactListData:
+    def test_new_data_returns_compact_list_data(self):
+        data = DataLayout(["a"]).new_data()
+
+        assert isinstance(data, CompactListData)
+        assert isinstance(data, ListData)
+
+    def test_stores_known_and_dynamic_keys(self):
+        data = DataLayout(["a"]).new_data()
+
+        data["a"] = "1"
+        data["dynamic"] = "2"
+
+        assert data["a"] == "1"
+        assert data["dynamic"] == "2"
+        assert data.data == {"a": "1", "dynamic": "2"}
+
+    def test_missing_known_key_raises_key_error(self):
+        data = DataLayout(["a"]).new_data()
+
+        with pytest.raises(KeyError):
+            data["a"]
+
+    def test_get_has_and_update(self):
+        data = DataLayout(["a"]).new_data({"a": "1"})
+
+        data.update({"b": "2"})
+
+        assert data.get("a") == "1"
+        assert data.get("b") == "2"
+        assert data.get("c", "default") == "default"
+        assert data.has("a")
+        assert data.has("b")
+        assert not data.has("c")
+
+    def test_get_many_matches_list_data(self):
+        values = {"a": "1", "dynamic": "2"}
+        compact = DataLayout(["a", "b"]).new_data(values)
+        plain = ListData(data=dict(values))
+        keys = ("a", "b", "dynamic", "other")
+
+        assert compact.get_many(keys, "-") == plain.get_many(keys, "-")
+
+    def test_equality_uses_stored_values(self):
+        layout = DataLayout(["a"])
+
+        assert layout.new_data({"a": "1"}) == layout.new_data({"a": "1"})
+        assert layout.new_data({"a": "1"}) != layout.new_data({"a": "2"})
+
+
+@pytest.mark.asyncio
+class TestNodesWithCompactData:
+    async def test_progress_node_reads_fields(self):
+        node = ProgressNode(fields=[("Name", "name"), ("Email", "email")])
+        data = DataLayout.from_chain(node).new_data({"name": "John"})
+        output = MockOutput()
+
+        await node.execute(data, output)
+
+        assert "✅ John" in output.messages[0]
+        assert "☑️ Email" in output.messages[0]
+
+    async def test_summary_node_reads_fields(self):
+        node = SummaryNode(title="Done", fields=[("Name", "name"), ("Email", "email")])
+        data = DataLayout.from_chain(node).new_data({"name": "John"})
+        output = MockOutput()
+
+        await node.execute(data, output)
+
+        assert output.messages[0] == "Done\n✅ John\n✅ -\n"
@@ -0,0 +1,97 @@
+from twpm.core.matching import (
+    FuzzyIndex,
+    FuzzyIndexCache,
+    OptionIndex,
+    normalize,
+    trigrams,
+)
+from twpm.core.primitives import PoolOption
+
+
+class TestNormalize:
+    def test_casefolds_strips_accents_and_collapses_spaces(self):
+        assert normalize("  São   PAULO ") == "sao paulo"
+        assert normalize("Straße") == "strasse"
+
+
+class TestOptionIndex:
+    def test_matches_numbers_labels_and_values(self):
+        index = OptionIndex([PoolOption("São Paulo", "sp"), PoolOption("Rio", "rj")])
+
+        assert index.lookup("2") == 1
+        assert index.lookup(" 02 ") == 1
+        assert index.lookup("sao  paulo") == 0
+        assert index.lookup("RJ") == 1
+        assert index.lookup("Recife") is None
+        assert index.lookup("3") is None
+
+    def test_numbers_take_precedence_over_labels(self):
+        index = OptionIndex(["2", "1"])
+
+        assert index.lookup("1") == 0
+
+    def test_first_duplicate_wins(self):
+        index = OptionIndex([PoolOption("Red", "a"), PoolOption("red", "b")])
+
+        assert index.lookup("RED") == 0
+
+    def test_indexes_plain_strings(self):
+        index = OptionIndex(["Sim", "Não"])
+
+        assert index.lookup("nao") == 1
+        assert len(index) == 2
+
+
+class TestFuzzyIndex:
+    def test_trigrams_are_padded(self):
+        assert trigrams("rio") == {"  r", " ri", "rio", "io "}
+
+    def test_finds_misspelled_labels(self):
+        index = FuzzyIndex(["Lisboa", "Porto", "Braga", "São Paulo"])
+
+        assert index.search("lisbao")[0][0] == 0
+        assert index.search("sao paolo")[0][0] == 3
+
+    def test_orders_and_limits_candidates(self):
+        index = FuzzyIndex(["Rio Branco", "Rio de Janeiro", "Rio Claro", "Recife"])
+
+        results = index.search("rio", limit=2)
+
+        assert len(results) == 2
+        assert results[0][1] >= results[1][1]
+        assert {position for position, _ in results} <= {0, 1, 2}
+
+    def test_ignores_dissimilar_labels(self):
+        index = FuzzyIndex(["Lisboa", "Porto"])
+
+        assert index.search("xyz") == []
+
+    def test_update_adds_and_removes_labels(self):
+        index = FuzzyIndex(["Lisboa", "Porto"])
+
+        index.update(["Porto", "Braga"])
+
+        assert len(index) == 2
+        assert index.search("lisboa") == []
+        assert index.search("brag")[0][0] == 1
+        assert index.search("porto")[0][0] == 0
+
+
+class TestFuzzyIndexCache:
+    def test_shares_index_per_source(self):
+        cache = FuzzyIndexCache()
+
+        first = cache.get("cities", ["Lisboa"])
+        second = cache.get("cities", ["Lisboa", "Porto"])
+
+        assert first is second
+        assert second.search("porto")[0][0] == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = FuzzyIndexCache(maxsize=1)
+
+        first = cache.get("a", ["x"])
+        cache.get("b", ["y"])
+
+        assert len(cache) == 1
+        assert cache.get("a", ["x"]) is not first
@@ -0,0 +1,184 @@
+import asyncio
+
+import pytest
+
+from twpm.core.base import ListData
+from twpm.core.options_cache import OptionsCache
+from twpm.core.primitives import PoolNode, PoolOption
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Loader:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self, data: ListData) -> list[str]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("options service down")
+        return [f"{data.get('tenant_id')}-{self.calls}"]
+
+
+@pytest.mark.asyncio
+class TestOptionsCache:
+    async def test_serves_fresh_entries_from_memory(self):
+        loader = Loader()
+        options = OptionsCache(ttl=10).wrap(loader)
+
+        first = await options(ListData(data={}))
+        second = await options(ListData(data={}))
+
+        assert loader.calls == 1
+        assert first is second
+
+    async def test_keys_by_data_field(self):
+        loader = Loader()
+        options = OptionsCache(ttl=10).wrap(loader, key="tenant_id")
+
+        a = await options(ListData(data={"tenant_id": "a"}))
+        b = await options(ListData(data={"tenant_id": "b"}))
+        again = await options(ListData(data={"tenant_id": "a"}))
+
+        assert a == ["a-1"]
+        assert b == ["b-2"]
+        assert again is a
+
+    async def test_reloads_expired_entries(self):
+        clock = FakeClock()
+        loader = Loader()
+        options = OptionsCache(ttl=10, clock=clock).wrap(loader)
+
+        await options(ListData(data={}))
+        clock.now = 11
+        value = await options(ListData(data={}))
+
+        assert loader.calls == 2
+        assert value == ["None-2"]
+
+    async def test_serves_stale_while_revalidating(self):
+        clock = FakeClock()
+        loader = Loader()
+        options = OptionsCache(ttl=10, stale_ttl=60, clock=clock).wrap(loader)
+
+        first = await options(ListData(data={}))
+        clock.now = 20
+        stale = await options(ListData(data={}))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        fresh = await options(ListData(data={}))
+
+        assert stale is first
+        assert loader.calls == 2
+        assert fresh == ["None-2"]
+
+    async def test_concurrent_misses_share_one_load(self):
+        loader = Loader(delay=0.01)
+        options = OptionsCache(ttl=10).wrap(loader)
+
+        results = await asyncio.gather(*(options(ListData(data={})) for _ in range(5)))
+
+        assert loader.calls == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_failed_background_refresh_keeps_stale_entry(self):
+        clock = FakeClock()
+        loader = Loader()
+        cache = OptionsCache(ttl=10, stale_ttl=60, clock=clock)
+        options = cache.wrap(loader)
+
+        first = await options(ListData(data={}))
+        loader.fail = True
+        clock.now = 20
+        await options(ListData(data={}))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert await options(ListData(data={})) is first
+
+    async def test_failed_load_propagates_and_is_retried(self):
+        loader = Loader(fail=True)
+        options = OptionsCache(ttl=10).wrap(loader)
+
+        with pytest.raises(RuntimeError):
+            await options(ListData(data={}))
+        loader.fail = False
+
+        assert await options(ListData(data={})) == ["None-2"]
+
+    async def test_invalidates_wrapped_entries_by_key(self):
+        plans = Loader()
+        cities = Loader()
+        cache = OptionsCache(ttl=10)
+        plan_options = cache.wrap(plans, key="tenant_id")
+        city_options = cache.wrap(cities, key="tenant_id")
+        a = ListData(data={"tenant_id": "a"})
+        b = ListData(data={"tenant_id": "b"})
+        for options in (plan_options, city_options):
+            await options(a)
+            await options(b)
+
+        cache.invalidate("a", loader=plans)
+        assert await plan_options(a) == ["a-3"]
+        assert await city_options(a) == ["a-1"]
+
+        cache.invalidate("a")
+        assert await plan_options(a) == ["a-4"]
+        assert await city_options(a) == ["a-3"]
+        assert await plan_options(b) == ["b-2"]
+
+        cache.invalidate(loader=plans)
+        assert await plan_options(b) == ["b-5"]
+        assert await city_options(b) == ["b-2"]
+
+    async def test_invalidate_during_load_is_not_undone(self):
+        loader = Loader(delay=0.01)
+        cache = OptionsCache(ttl=10)
+        options = cache.wrap(loader, key="tenant_id")
+        data = ListData(data={"tenant_id": "a"})
+
+        pending = asyncio.ensure_future(options(data))
+        await asyncio.sleep(0)
+        cache.invalidate("a")
+
+        assert await pending == ["a-1"]
+        assert len(cache) == 0
+        assert await options(data) == ["a-2"]
+
+    async def test_evicts_least_recently_used(self):
+        loader = Loader()
+        cache = OptionsCache(ttl=10, maxsize=1)
+        options = cache.wrap(loader, key="tenant_id")
+
+        await options(ListData(data={"tenant_id": "a"}))
+        await options(ListData(data={"tenant_id": "b"}))
+
+        assert len(cache) == 1
+
+    async def test_pool_node_uses_cached_options(self):
+        calls = []
+
+        async def load(data: ListData) -> list[PoolOption]:
+            calls.append(1)
+            return [PoolOption("Free"), PoolOption("Premium")]
+
+        options = OptionsCache(ttl=60).wrap(load)
+
+        class Output:
+            async def send_text(self, text: str) -> None:
+                pass
+
+        for _ in range(3):
+            node = PoolNode("Plan", options=options, key="plan")
+            await node.execute(ListData(data={}), Output())
+
+        assert len(calls) == 1
@@ -1,4 +1,6 @@
+import gc
 import logging
+import weakref
 
 import pytest
 
@@ -6,6 +8,8 @@ from twpm.core.base import ListData, Node, NodeResult, NodeStatus
 from twpm.core.container import Container, ServiceScope
 from twpm.core.decorators import safe_execute
 from twpm.core.depedencies import Output
+from twpm.core.events import WorkflowEventType
+from twpm.core.layout import DataLayout
 from twpm.core.orchestrator import Orchestrator
 
 
@@ -152,6 +156,53 @@ class TestOrchestrator:
         assert orchestrator.session_id == "test-session-123"
         assert orchestrator.is_started is True
 
+    async def test_start_uses_given_data(self, orchestrator):
+        """Test that start() stores results in the given data container."""
+        node = MockNode("node1", data={"result": "value1"})
+        data = DataLayout(["result"]).new_data()
+        orchestrator.start("test-session", node, data=data)
+
+        await orchestrator.process()
+
+        assert data["result"] == "value1"
+
+    async def test_step_budget_stops_workflow(self):
+        """Test that process() stops after max_steps node executions."""
+        orchestrator = Orchestrator(container=Container(), max_steps=2)
+        node1 = MockNode("node1")
+        node2 = MockNode("node2")
+        node3 = MockNode("node3")
+        node1.next = node2
+        node2.next = node3
+
+        orchestrator.start("test-session", node1)
+        await orchestrator.process()
+
+        assert node2.execute_count == 1
+        assert node3.execute_count == 0
+        assert orchestrator.is_finished is True
+        assert orchestrator.has_error is True
+
+    async def test_next_node_overrides_next(self, orchestrator):
+        """Test that a result's next_node is executed instead of next."""
+        jump_target = MockNode("target")
+        skipped = MockNode("skipped")
+
+        class JumpNode(Node):
+            async def execute(self, data: ListData) -> NodeResult:
+                return NodeResult(
+                    success=True, data={}, message="", next_node=jump_target
+                )
+
+        jump = JumpNode("jump")
+        jump.next = skipped
+
+        orchestrator.start("test-session", jump)
+        await orchestrator.process()
+
+        assert jump_target.execute_count == 1
+        assert skipped.execute_count == 0
+
     async def test_process_without_start_raises_error(self, orchestrator):
         """Test that process() raises error if not started."""
         with pytest.raises(RuntimeError, match="Orchestrator must be started"):
@@ -537,3 +588,70 @@ class TestOrchestrator:
         assert question.status == NodeStatus.COMPLETE
         assert orchestrator._data.get("comment") == "Great!"
         assert orchestrator.is_finished is True
+
+    async def test_listeners_receive_events_in_order(self, orchestrator):
+        """Test listeners are notified as the workflow progresses."""
+        events = []
+        orchestrator.add_listener(
+            lambda event: events.append((event.type, event.node and event.node.key))
+        )
+        question = QuestionNode("ask_name", "Name?", "name")
+        done = MockNode("done")
+        question.next = done
+        orchestrator.start("test-session", question)
+
+        await orchestrator.process()
+        await orchestrator.process(input="Ana")
+
+        assert events == [
+            (WorkflowEventType.STARTED, None),
+            (WorkflowEventType.NODE_ENTERED, "ask_name"),
+            (WorkflowEventType.AWAITING_INPUT, "ask_name"),
+            (WorkflowEventType.NODE_COMPLETED, "ask_name"),
+            (WorkflowEventType.NODE_ENTERED, "done"),
+            (WorkflowEventType.NODE_COMPLETED, "done"),
+            (WorkflowEventType.FINISHED, None),
+        ]
+
+    async def test_finished_event_carries_failed_node(self, orchestrator):
+        """Test a failed workflow reports the node it stopped at."""
+        events = []
+        orchestrator.add_listener(events.append)
+        orchestrator.start("test-session", FailingNode("broken"))
+
+        await orchestrator.process()
+
+        assert events[-2].type == WorkflowEventType.NODE_FAILED
+        assert events[-1].type == WorkflowEventType.FINISHED
+        assert events[-1].node.key == "broken"
+
+    async def test_failing_listener_does_not_stop_workflow(self, orchestrator):
+        """Test listener exceptions are contained."""
+
+        def broken_listener(event):
+            raise RuntimeError("listener error")
+
+        orchestrator.add_listener(broken_listener)
+        node = MockNode("node1")
+        orchestrator.start("test-session", node)
+
+        await orchestrator.process()
+
+        assert orchestrator.is_finished
+        assert node.status == NodeStatus.COMPLETE
+
+    async def test_signature_cache_does_not_keep_node_classes_alive(self):
+        """Test node classes created at runtime can be garbage collected."""
+
+        class RuntimeNode(MockNode):
+            pass
+
+        orchestrator = Orchestrator(container=Container())
+        orchestrator.start("test-session", RuntimeNode("node1"))
+        await orchestrator.process()
+        node_class = weakref.ref(RuntimeNode)
+
+        del RuntimeNode, orchestrator
+        gc.collect()
+
+        assert node_class() is None
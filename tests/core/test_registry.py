@@ -0,0 +1,170 @@
+import json
+
+import pytest
+
+from twpm.core.base import CompactListData, ListData, Node, NodeResult
+from twpm.core.chain import Chain
+from twpm.core.container import Container, ServiceScope
+from twpm.core.definitions import compile_definition
+from twpm.core.depedencies import Output
+from twpm.core.orchestrator import Orchestrator
+from twpm.core.primitives import QuestionNode
+from twpm.core.registry import WorkflowRegistry
+
+
+class DummyNode(Node):
+    async def execute(self, data: ListData) -> NodeResult:
+        return NodeResult(success=True, data={}, message="")
+
+
+class MockOutput:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text)
+
+
+def definition(version: str, question: str = "Your name") -> dict:
+    return {
+        "name": "onboarding",
+        "version": version,
+        "nodes": [{"type": "question", "key": "user_name", "question": question}],
+    }
+
+
+def builder(key: str):
+    return lambda: Chain(DummyNode(key)).build()
+
+
+class TestWorkflowRegistry:
+    def test_new_sessions_use_latest_version(self):
+        registry = WorkflowRegistry()
+        registry.register("flow", builder("v1"), version="1")
+        registry.register("flow", builder("v2"), version="2")
+
+        session = registry.start_session("s1", "flow")
+
+        assert session.version == "2"
+        assert session.head.key == "v2"
+
+    def test_sessions_stay_pinned_to_their_version(self):
+        registry = WorkflowRegistry()
+        registry.register("flow", builder("v1"), version="1")
+        old = registry.start_session("s1", "flow")
+
+        registry.register("flow", builder("v2"), version="2")
+        new = registry.start_session("s2", "flow")
+
+        assert old.version == "1"
+        assert new.version == "2"
+        assert registry.get_session("s1").head.key == "v1"
+        assert registry.versions("flow") == ["1", "2"]
+
+    def test_each_session_gets_a_fresh_graph(self):
+        registry = WorkflowRegistry()
+        registry.register("flow", builder("a"))
+
+        first = registry.start_session("s1", "flow")
+        second = registry.start_session("s2", "flow")
+
+        assert first.head is not second.head
+
+    def test_evicts_old_version_when_last_session_ends(self):
+        registry = WorkflowRegistry()
+        registry.register("flow", builder("v1"), version="1")
+        registry.start_session("s1", "flow")
+        registry.start_session("s2", "flow")
+        registry.register("flow", builder("v2"), version="2")
+
+        registry.end_session("s1")
+        assert registry.versions("flow") == ["1", "2"]
+
+        registry.end_session("s2")
+        assert registry.versions("flow") == ["2"]
+
+    def test_evicts_unused_version_on_register(self):
+        registry = WorkflowRegistry()
+        registry.register("flow", builder("v1"), version="1")
+
+        registry.register("flow", builder("v2"), version="2")
+
+        assert registry.versions("flow") == ["2"]
+
+    def test_latest_version_is_never_evicted(self):
+        registry = WorkflowRegistry()
+        registry.register("flow", builder("v1"), version="1")
+        registry.start_session("s1", "flow")
+
+        registry.end_session("s1")
+
+        assert registry.versions("flow") == ["1"]
+
+    def test_rejects_duplicate_version(self):
+        registry = WorkflowRegistry()
+        registry.register("flow", builder("v1"), version="1")
+
+        with pytest.raises(ValueError, match="already exists"):
+            registry.register("flow", builder("v1"), version="1")
+
+    def test_rejects_duplicate_session(self):
+        registry = WorkflowRegistry()
+        registry.register("flow", builder("v1"))
+        registry.start_session("s1", "flow")
+
+        with pytest.raises(ValueError, match="already running"):
+            registry.start_session("s1", "flow")
+
+    def test_unknown_workflow_raises_key_error(self):
+        with pytest.raises(KeyError):
+            WorkflowRegistry().start_session("s1", "missing")
+
+    def test_session_data_uses_compiled_layout(self):
+        registry = WorkflowRegistry()
+        registry.register("onboarding", compile_definition(definition("1")))
+
+        session = registry.start_session("s1", "onboarding")
+
+        assert isinstance(session.data, CompactListData)
+        assert "user_name" in session.data.layout
+        assert session.version == "1"
+
+    def test_reload_registers_changed_definitions_only(self, tmp_path):
+        path = tmp_path / "onboarding.json"
+        registry = WorkflowRegistry()
+
+        path.write_text(json.dumps(definition("1")))
+        first = registry.reload("onboarding", path)
+        unchanged = registry.reload("onboarding", path)
+        path.write_text(json.dumps(definition("1", question="Full name")))
+        changed = registry.reload("onboarding", path)
+
+        assert unchanged is first
+        assert changed is not first
+        assert changed.version.startswith("1+")
+        assert registry.latest("onboarding") is changed
+
+
+@pytest.mark.asyncio
+class TestHotReload:
+    async def test_in_flight_session_finishes_on_old_version(self):
+        registry = WorkflowRegistry()
+        registry.register("onboarding", compile_definition(definition("1", "Old")))
+        container = Container()
+        output = MockOutput()
+        container.register(Output, lambda: output, ServiceScope.SINGLETON)
+
+        session = registry.start_session("s1", "onboarding")
+        orchestrator = Orchestrator(container)
+        orchestrator.start(session.session_id, session.head, data=session.data)
+        await orchestrator.process()
+
+        registry.register("onboarding", compile_definition(definition("2", "New")))
+        await orchestrator.process("John")
+        registry.end_session("s1")
+
+        assert "Old" in output.messages[0]
+        assert orchestrator.is_finished
+        assert session.data["user_name"] == "John"
+        assert registry.versions("onboarding") == ["2"]
+        assert isinstance(registry.start_session("s2", "onboarding").head, QuestionNode)
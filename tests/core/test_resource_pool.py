@@ -0,0 +1,274 @@
+import asyncio
+
+import pytest
+
+from twpm.core.base import ListData, Node, NodeResult, NodeStatus
+from twpm.core.container import Container, ServiceScope
+from twpm.core.decorators import safe_execute
+from twpm.core.depedencies import Output
+from twpm.core.orchestrator import Orchestrator
+from twpm.core.resource_pool import ResourcePool
+
+
+class Connection:
+    created = 0
+
+    def __init__(self):
+        Connection.created += 1
+        self.id = Connection.created
+        self.closed = False
+        self.healthy = True
+
+    def close(self):
+        self.closed = True
+
+
+class MockOutput:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str) -> None:
+        self.messages.append(text)
+
+
+class QueryNode(Node):
+    def __init__(self, key: str):
+        super().__init__(key)
+        self.seen = []
+
+    @safe_execute()
+    async def execute(self, data: ListData, db: Connection) -> NodeResult:
+        self.seen.append(db)
+        return NodeResult(success=True, data={self.key: str(db.id)}, message="")
+
+
+@pytest.fixture(autouse=True)
+def reset_connections():
+    Connection.created = 0
+
+
+@pytest.mark.asyncio
+class TestResourcePool:
+    async def test_reuses_released_resources(self):
+        pool = ResourcePool(Connection)
+
+        async with pool.lease() as first:
+            pass
+        async with pool.lease() as second:
+            pass
+
+        assert first is second
+        assert pool.size == 1
+        assert pool.idle == 1
+
+    async def test_supports_async_factory(self):
+        async def connect():
+            return Connection()
+
+        pool = ResourcePool(connect)
+
+        async with pool.lease() as conn:
+            assert isinstance(conn, Connection)
+
+    async def test_waits_when_exhausted(self):
+        pool = ResourcePool(Connection, max_size=1)
+        first = await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await pool.release(first)
+        second = await asyncio.wait_for(waiter, 1)
+
+        assert second is first
+        assert pool.size == 1
+
+    async def test_replaces_unhealthy_resources(self):
+        pool = ResourcePool(
+            Connection, health_check=lambda conn: conn.healthy, close=Connection.close
+        )
+        async with pool.lease() as first:
+            first.healthy = False
+
+        async with pool.lease() as second:
+            pass
+
+        assert second is not first
+        assert first.closed
+        assert pool.size == 1
+
+    async def test_health_check_errors_count_as_unhealthy(self):
+        def failing_check(conn):
+            raise RuntimeError("ping failed")
+
+        pool = ResourcePool(Connection, health_check=failing_check)
+        async with pool.lease() as first:
+            pass
+
+        async with pool.lease() as second:
+            assert second is not first
+
+    async def test_evicts_idle_resources(self):
+        pool = ResourcePool(Connection, idle_timeout=0, close=Connection.close)
+        async with pool.lease() as conn:
+            pass
+        await asyncio.sleep(0.01)
+
+        assert await pool.evict_idle() == 1
+        assert conn.closed
+        assert pool.size == 0
+
+    async def test_discard_closes_resource(self):
+        pool = ResourcePool(Connection, close=Connection.close)
+        conn = await pool.acquire()
+
+        await pool.release(conn, discard=True)
+
+        assert conn.closed
+        assert pool.idle == 0
+
+    async def test_close_waits_for_leases_and_rejects_new_ones(self):
+        pool = ResourcePool(Connection, close=Connection.close)
+        idle = await pool.acquire()
+        leased = await pool.acquire()
+        await pool.release(idle)
+
+        closing = asyncio.create_task(pool.close())
+        await asyncio.sleep(0)
+
+        assert idle.closed
+        assert not closing.done()
+        with pytest.raises(RuntimeError, match="closed"):
+            await pool.acquire()
+
+        await pool.release(leased)
+        await asyncio.wait_for(closing, 1)
+        assert leased.closed
+        assert pool.size == 0
+
+    async def test_close_survives_failing_close_callback(self):
+        def close(conn):
+            if conn.id == 1:
+                raise OSError("socket already gone")
+            conn.close()
+
+        pool = ResourcePool(Connection, close=close)
+        resources = [await pool.acquire() for _ in range(3)]
+        for conn in resources:
+            await pool.release(conn)
+
+        await pool.close()
+
+        assert [conn.closed for conn in resources] == [False, True, True]
+        assert pool.size == 0
+        assert pool.idle == 0
+
+    async def test_close_timeout(self):
+        pool = ResourcePool(Connection)
+        await pool.acquire()
+
+        await pool.close(timeout=0.01)
+
+        assert pool.closed
+        assert pool.in_use == 1
+
+    async def test_rejects_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            ResourcePool(Connection, max_size=0)
+
+
+@pytest.mark.asyncio
+class TestPooledContainer:
+    async def test_acquire_leases_from_pool(self):
+        container = Container()
+        container.register(Connection, Connection, ServiceScope.POOLED, max_size=2)
+
+        async with container.acquire(Connection) as conn:
+            assert isinstance(conn, Connection)
+
+    async def test_resolve_rejects_pooled_services(self):
+        container = Container()
+        container.register(Connection, Connection, ServiceScope.POOLED)
+
+        with pytest.raises(ValueError, match="must be acquired"):
+            container.resolve(Connection)
+
+    async def test_pool_options_require_pooled_scope(self):
+        with pytest.raises(ValueError, match="only valid for POOLED"):
+            Container().register(
+                Connection, Connection, ServiceScope.SINGLETON, max_size=2
+            )
+
+    async def test_shutdown_closes_pools(self):
+        container = Container()
+        container.register(
+            Connection, Connection, ServiceScope.POOLED, close=Connection.close
+        )
+        async with container.acquire(Connection) as conn:
+            pass
+
+        await container.shutdown()
+
+        assert conn.closed
+
+    async def test_orchestrator_injects_pooled_service(self):
+        container = Container()
+        container.register(Output, MockOutput, ServiceScope.SINGLETON)
+        container.register(Connection, Connection, ServiceScope.POOLED, max_size=1)
+        pool = container.providers[Connection].pool
+        first = QueryNode("first")
+        second = QueryNode("second")
+        first.next = second
+
+        orchestrator = Orchestrator(container)
+        orchestrator.start("session", first)
+        await orchestrator.process()
+
+        assert orchestrator.is_finished
+        assert first.seen[0] is second.seen[0]
+        assert pool.in_use == 0
+        assert pool.idle == 1
+
+    @pytest.mark.parametrize("broken", ["factory", "closed pool"])
+    async def test_failing_acquire_fails_the_node(self, broken):
+        def connect():
+            raise ConnectionError("database unreachable")
+
+        container = Container()
+        factory = connect if broken == "factory" else Connection
+        container.register(Connection, factory, ServiceScope.POOLED, max_size=1)
+        pool = container.providers[Connection].pool
+        if broken == "closed pool":
+            await pool.close()
+        node = QueryNode("query")
+
+        orchestrator = Orchestrator(container)
+        orchestrator.start("session", node)
+        await orchestrator.process()
+
+        assert orchestrator.is_finished
+        assert node.status == NodeStatus.FAILED
+        assert node.seen == []
+        assert pool.in_use == 0
+
+    async def test_orchestrator_injects_registered_services_by_type(self):
+        class Settings:
+            greeting = "hi"
+
+        class GreetingNode(Node):
+            @safe_execute()
+            async def execute(self, data: ListData, settings: Settings) -> NodeResult:
+                return NodeResult(
+                    success=True, data={"greeting": settings.greeting}, message=""
+                )
+
+        container = Container()
+        container.register(Settings, Settings, ServiceScope.SINGLETON)
+        orchestrator = Orchestrator(container)
+        data = ListData(data={})
+        orchestrator.start("session", GreetingNode("greet"), data=data)
+
+        await orchestrator.process()
+
+        assert data["greeting"] == "hi"
@@ -0,0 +1,80 @@
+import pickle
+
+import pytest
+
+from twpm.core.base import ListData
+from twpm.core.layout import DataLayout
+from twpm.core.template import (
+    Template,
+    TemplateError,
+    as_template,
+    compile_template,
+    escape,
+)
+
+
+class TestTemplate:
+    def test_renders_placeholders(self):
+        template = Template("Hi {user_name}, your plan is {plan}.")
+        data = ListData(data={"user_name": "John", "plan": "Free"})
+
+        assert template.render(data) == "Hi John, your plan is Free."
+
+    def test_missing_keys_render_empty_or_default(self):
+        template = Template("Hi {user_name|friend}{suffix}!")
+
+        assert template.render(ListData(data={})) == "Hi friend!"
+
+    def test_escaped_braces(self):
+        template = Template("{{literal}} {name}")
+
+        assert template.is_static is False
+        assert template.render(ListData(data={"name": "x"})) == "{literal} x"
+        assert Template("{{a}}").render(ListData(data={})) == "{a}"
+
+    def test_static_template(self):
+        template = Template("Welcome!")
+
+        assert template.is_static
+        assert template.names == ()
+        assert template.render(ListData(data={})) == "Welcome!"
+
+    def test_names_are_deduplicated(self):
+        template = Template("{a} {b} {a}")
+
+        assert template.names == ("a", "b")
+        assert template.render(ListData(data={"a": "1", "b": "2"})) == "1 2 1"
+
+    def test_renders_compact_data(self):
+        template = Template("{name} <{email|-}>")
+        data = DataLayout(["name", "email"]).new_data({"name": "John"})
+
+        assert template.render(data) == "John <->"
+
+    @pytest.mark.parametrize("source", ["{", "}", "{}", "{name:>10}", "{name!r}"])
+    def test_rejects_invalid_templates(self, source):
+        with pytest.raises(TemplateError):
+            Template(source)
+
+    def test_compile_template_is_cached(self):
+        assert compile_template("Hi {name}") is compile_template("Hi {name}")
+
+    def test_pickles_by_source(self):
+        template = Template("Hi {name}")
+
+        assert pickle.loads(pickle.dumps(template)) == template
+
+    @pytest.mark.parametrize(
+        "text", ["Use } to close", 'JSON: {"a": 1}', "Hello {name}", "{{x}}", "{"]
+    )
+    def test_plain_text_renders_verbatim(self, text):
+        template = as_template(text)
+
+        assert template.names == ()
+        assert template.render(ListData(data={"name": "x"})) == text
+        assert Template(escape(text)) == template
+
+    def test_as_template_keeps_templates(self):
+        template = Template("Hi {name}")
+
+        assert as_template(template) is template
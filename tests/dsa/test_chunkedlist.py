@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from twpm.dsa.chunkedlist import ChunkedList
+
+
+class TestChunkedList:
+    def test_builds_from_elements(self):
+        chunked = ChunkedList(range(10), load=3)
+
+        assert len(chunked) == 10
+        assert list(chunked) == list(range(10))
+        assert chunked[-1] == 9
+
+    def test_insert_and_pop_positions(self):
+        chunked = ChunkedList(range(10), load=2)
+
+        chunked.insert(5, 100)
+        chunked.insert(-1, 200)
+        chunked.insert(50, 300)
+
+        assert list(chunked) == [0, 1, 2, 3, 4, 100, 5, 6, 7, 8, 200, 9, 300]
+        assert chunked.pop(5) == 100
+        assert chunked.pop() == 300
+        assert chunked.pop(0) == 0
+        assert list(chunked) == [1, 2, 3, 4, 5, 6, 7, 8, 200, 9]
+
+    def test_index_errors(self):
+        chunked = ChunkedList([1, 2])
+
+        with pytest.raises(IndexError):
+            chunked[2]
+        with pytest.raises(IndexError):
+            chunked[-3] = 0
+        with pytest.raises(IndexError):
+            ChunkedList().pop()
+
+    def test_slices_are_views(self):
+        chunked = ChunkedList(range(20), load=4)
+
+        view = chunked[5:15:2]
+        chunked[7] = -7
+
+        assert list(view) == [5, -7, 9, 11, 13]
+        assert list(view[1:3]) == [-7, 9]
+        assert view[-1] == 13
+        assert list(chunked[::-1]) == list(chunked)[::-1]
+
+    def test_delete_slices(self):
+        chunked = ChunkedList(range(30), load=4)
+        expected = list(range(30))
+
+        del chunked[3:20]
+        del expected[3:20]
+        del chunked[::3]
+        del expected[::3]
+
+        assert list(chunked) == expected
+
+    def test_extend_and_mixin_methods(self):
+        chunked = ChunkedList([1, 2], load=2)
+
+        chunked.extend(range(3, 8))
+        chunked.extend(chunked)
+        chunked.remove(3)
+
+        assert len(chunked) == 13
+        assert chunked.index(7) == 5
+        assert chunked.count(1) == 2
+        assert 6 in chunked
+
+    def test_matches_list_under_random_edits(self):
+        rng = random.Random(7)
+        chunked = ChunkedList(load=3)
+        expected = []
+
+        for step in range(2000):
+            operation = rng.random()
+            if operation < 0.4:
+                index = rng.randint(-len(expected) - 1, len(expected) + 1)
+                chunked.insert(index, step)
+                expected.insert(index, step)
+            elif operation < 0.55:
+                chunked.append(step)
+                expected.append(step)
+            elif operation < 0.85 and expected:
+                index = rng.randrange(-len(expected), len(expected))
+                assert chunked.pop(index) == expected.pop(index)
+            elif expected:
+                index = rng.randrange(len(expected))
+                chunked[index] = -step
+                expected[index] = -step
+
+        assert list(chunked) == expected
+        assert [chunked[i] for i in range(len(expected))] == expected
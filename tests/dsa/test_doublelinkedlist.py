@@ -1,6 +1,6 @@
 import pytest
 
-from twpm.dsa.doublelinkedlist import DoubleLinkedList
+from twpm.dsa.doublelinkedlist import DoubleLinkedList, DoubleNode
 
 
 class TestDoubleLinkedList:
@@ -122,3 +122,31 @@ class TestDoubleLinkedList:
         assert middle.prev.element == 15
         assert middle.next.element == 50
         assert last.prev.element == 30
+
+    def test_negative_indexes_and_reversed_iteration(self):
+        linked_list = DoubleLinkedList()
+        linked_list.extend([10, 20, 30, 40])
+
+        assert linked_list[-2].element == 30
+        assert [node.element for node in reversed(linked_list)] == [40, 30, 20, 10]
+
+    def test_pop_middle_keeps_links(self):
+        linked_list = DoubleLinkedList()
+        linked_list.extend([10, 20, 30])
+
+        popped = linked_list.pop(-2)
+
+        assert popped.element == 20
+        assert popped.prev is None and popped.next is None
+        assert linked_list[0].next is linked_list[1]
+        assert linked_list[1].prev is linked_list[0]
+
+    def test_setitem_relinks_neighbours(self):
+        linked_list = DoubleLinkedList()
+        linked_list.extend([10, 20, 30])
+
+        linked_list[-1] = DoubleNode(element=35)
+
+        assert linked_list.get_tail().element == 35
+        assert linked_list.get_tail().prev.element == 20
+        assert linked_list[1].next.element == 35
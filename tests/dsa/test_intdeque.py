@@ -0,0 +1,144 @@
+import random
+from array import array
+from collections import deque
+
+import pytest
+
+from twpm.dsa.intdeque import IntDeque
+
+
+class TestIntDeque:
+    def test_builds_from_elements(self):
+        ints = IntDeque(range(10))
+
+        assert len(ints) == 10
+        assert list(ints) == list(range(10))
+        assert ints[-1] == 9
+        assert ints.get_head() == 0
+        assert ints.get_tail() == 9
+
+    def test_empty(self):
+        ints = IntDeque()
+
+        assert not ints
+        assert ints.get_head() is None
+        assert ints.get_tail() is None
+        with pytest.raises(IndexError):
+            ints.pop()
+        with pytest.raises(IndexError):
+            ints.popleft()
+
+    def test_appends_at_both_ends_wrap_the_ring(self):
+        ints = IntDeque()
+        for element in range(5):
+            ints.append(element)
+            ints.appendleft(-element - 1)
+
+        assert list(ints) == [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4]
+        assert list(reversed(ints)) == list(reversed(list(ints)))
+        assert ints.popleft() == -5
+        assert ints.pop() == 4
+        assert ints.capacity == 16
+
+    def test_insert_and_pop_positions(self):
+        ints = IntDeque(range(10))
+
+        ints.insert(5, 100)
+        ints.insert(-1, 200)
+        ints.insert(50, 300)
+        ints.insert_after(0, 400)
+
+        assert list(ints) == [0, 400, 1, 2, 3, 4, 100, 5, 6, 7, 8, 200, 9, 300]
+        assert ints.pop(6) == 100
+        assert ints.pop() == 300
+        assert ints.pop(0) == 0
+        assert list(ints) == [400, 1, 2, 3, 4, 5, 6, 7, 8, 200, 9]
+
+    def test_index_errors(self):
+        ints = IntDeque([1, 2])
+
+        with pytest.raises(IndexError):
+            ints[2]
+        with pytest.raises(IndexError):
+            ints[-3] = 0
+        with pytest.raises(IndexError):
+            ints.insert_after(5, 0)
+
+    def test_rejects_values_outside_64_bits(self):
+        with pytest.raises(OverflowError):
+            IntDeque([2**63])
+
+    def test_setitem(self):
+        ints = IntDeque(range(3))
+        ints.appendleft(-1)
+
+        ints[0] = 10
+        ints[-1] = 20
+
+        assert ints == IntDeque([10, 0, 1, 20])
+
+    def test_extend_accepts_arrays_and_itself(self):
+        ints = IntDeque([1])
+        ints.appendleft(0)
+
+        ints.extend(array("q", [2, 3]))
+        ints.extend(array("i", [4]))
+        ints.extend(ints)
+
+        assert list(ints) == [0, 1, 2, 3, 4] * 2
+
+    def test_view_is_zero_copy(self):
+        ints = IntDeque(range(6))
+        ints.popleft()
+        ints.appendleft(100)
+        ints.appendleft(200)
+
+        view = ints.view()
+        assert view.tolist() == [200, 100, 1, 2, 3, 4, 5]
+        assert view.format == "q"
+
+        ints[1] = 7
+        assert view[1] == 7
+        # Writes that keep the buffer's size work while a view is exported
+        ints.pop(3)
+        ints.insert(1, 8)
+        assert list(ints) == [200, 8, 7, 1, 3, 4, 5]
+
+    def test_clear(self):
+        ints = IntDeque(range(100))
+
+        ints.clear()
+
+        assert len(ints) == 0
+        assert list(ints) == []
+        assert ints.capacity == 8
+
+    def test_matches_deque_under_random_operations(self):
+        rng = random.Random(7)
+        ints = IntDeque()
+        expected: deque[int] = deque()
+
+        for step in range(3000):
+            operation = rng.randrange(6)
+            if operation == 0:
+                ints.append(step)
+                expected.append(step)
+            elif operation == 1:
+                ints.appendleft(step)
+                expected.appendleft(step)
+            elif operation == 2 and expected:
+                assert ints.popleft() == expected.popleft()
+            elif operation == 3 and expected:
+                index = rng.randrange(len(expected))
+                assert ints.pop(index) == expected[index]
+                del expected[index]
+            elif operation == 4:
+                index = rng.randint(0, len(expected))
+                ints.insert(index, step)
+                expected.insert(index, step)
+            elif operation == 5:
+                elements = range(rng.randrange(5))
+                ints.extend(elements)
+                expected.extend(elements)
+
+        assert list(ints) == list(expected)
@@ -163,3 +163,45 @@ class TestLinkedList:
         assert len(linked_list) == 3
         assert first.next.element == 30
         assert middle.next.element == 50
+
+    def test_negative_indexes(self):
+        linked_list = LinkedList()
+        linked_list.extend([10, 20, 30])
+
+        assert linked_list[-1].element == 30
+        assert linked_list[-3].element == 10
+        with pytest.raises(IndexError):
+            linked_list[-4]
+
+    def test_iterates_nodes_in_order(self):
+        linked_list = LinkedList()
+        linked_list.extend([1, 2, 3])
+
+        assert [node.element for node in linked_list] == [1, 2, 3]
+        assert str(linked_list) == "1 -> 2 -> 3"
+
+    def test_tail_follows_appends_and_pops(self):
+        linked_list = LinkedList()
+        linked_list.extend([1, 2, 3])
+
+        linked_list.pop(-1)
+        assert linked_list.get_tail().element == 2
+
+        linked_list.append(4)
+        assert linked_list.get_tail().element == 4
+        assert linked_list[1].next.element == 4
+
+    def test_extend_copies_nodes(self):
+        l1 = LinkedList()
+        l2 = LinkedList()
+        l2.extend([1, 2])
+
+        l1.extend(l2)
+        l2.append(3)
+
+        assert len(l1) == 2
+        assert l1.get_tail().next is None
+
+    def test_pop_from_empty_list(self):
+        with pytest.raises(IndexError):
+            LinkedList().pop(0)
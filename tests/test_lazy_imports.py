@@ -0,0 +1,73 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def loaded_modules(statement: str) -> set[str]:
+    """Run a statement in a fresh interpreter and list the twpm modules loaded."""
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        "print('\\n'.join(m for m in sys.modules if m.startswith('twpm')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    def test_import_twpm_loads_nothing_else(self):
+        assert loaded_modules("import twpm") == {"twpm"}
+
+    def test_import_core_does_not_load_primitives(self):
+        modules = loaded_modules("import twpm.core")
+
+        assert "twpm.core.chain" in modules
+        assert "twpm.core.orchestrator" not in modules
+        assert not any(m.startswith("twpm.core.primitives") for m in modules)
+
+    def test_primitive_access_loads_only_its_module(self):
+        modules = loaded_modules("from twpm.core.primitives import QuestionNode")
+
+        assert "twpm.core.primitives.question" in modules
+        assert "twpm.core.primitives.pool" not in modules
+        assert "twpm.core.primitives.quiz" not in modules
+
+    @pytest.mark.parametrize(
+        ("module", "name"),
+        [
+            ("twpm", "Orchestrator"),
+            ("twpm", "chain"),
+            ("twpm", "ConditionalNode"),
+            ("twpm.core", "DataLayout"),
+            ("twpm.core.primitives", "QuizSummaryNode"),
+        ],
+    )
+    def test_lazy_attributes_resolve(self, module, name):
+        package = __import__(module, fromlist=[name])
+
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+    def test_chain_function_is_not_shadowed_by_submodule(self):
+        import twpm.core.chain  # noqa: F401
+        from twpm.core import chain
+
+        assert chain is sys.modules["twpm.core.chain"].chain
+
+    def test_unknown_attribute_raises(self):
+        import twpm.core.primitives
+
+        with pytest.raises(AttributeError):
+            twpm.core.primitives.MissingNode  # noqa: B018
+
+    def test_progress_tracking_loads_default_progress_node(self):
+        modules = loaded_modules(
+            "from twpm.core import Chain\n"
+            "from twpm.core.primitives import QuestionNode\n"
+            "Chain(QuestionNode('Q', key='q')).with_progress(fields=[]).build()"
+        )
+
+        assert "twpm.core.primitives.progress" in modules
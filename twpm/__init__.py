@@ -1,15 +1,49 @@
-from twpm.core import Chain, Cursor, Orchestrator, chain
-from twpm.core.base import (
-    ListData,
-    Node,
-    NodeKey,
-    NodeResult,
-    NodeStatus,
-    Value,
-)
-from twpm.core.container import Container, Provider, ServiceScope
-from twpm.core.primitives.condition import ConditionalNode
-from twpm.core.primitives.task import TaskNode
+"""
+twpm - a simple workflow builder.
+
+Public names are loaded lazily (PEP 562): importing twpm is cheap and each
+submodule is imported the first time one of its names is accessed.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from twpm.core import Chain, Cursor, Orchestrator, chain
+    from twpm.core.base import (
+        ListData,
+        Node,
+        NodeKey,
+        NodeResult,
+        NodeStatus,
+        Value,
+    )
+    from twpm.core.container import Container, Provider, ServiceScope
+    from twpm.core.primitives.condition import ConditionalNode
+    from twpm.core.primitives.task import TaskNode
+
+# Public name -> module that defines it
+_LAZY_ATTRIBUTES = {
+    # Core orchestration
+    "Orchestrator": "twpm.core.orchestrator",
+    "Container": "twpm.core.container",
+    "Provider": "twpm.core.container",
+    "ServiceScope": "twpm.core.container",
+    # Chain building
+    "Chain": "twpm.core.chain",
+    "chain": "twpm.core.chain",
+    "Cursor": "twpm.core.cursor",
+    # Base classes and types
+    "Node": "twpm.core.base",
+    "NodeResult": "twpm.core.base",
+    "NodeStatus": "twpm.core.base",
+    "ListData": "twpm.core.base",
+    "NodeKey": "twpm.core.base",
+    "Value": "twpm.core.base",
+    # Primitives
+    "TaskNode": "twpm.core.primitives.task",
+    "ConditionalNode": "twpm.core.primitives.condition",
+}
 
 __all__ = [
     # Core orchestration
@@ -34,3 +68,17 @@ __all__ = [
 ]
 
 __version__ = "0.1.1"
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
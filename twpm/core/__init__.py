@@ -2,15 +2,48 @@
 twpm core module - workflow orchestration and node management.
 
 This module provides the core functionality for building and executing workflows.
+Names are loaded lazily (PEP 562), so only the parts that are used get imported.
 """
 
-from twpm.core.chain import Chain, chain
-from twpm.core.cursor import Cursor
-from twpm.core.orchestrator import Orchestrator
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Imported eagerly: the `chain` function shares its name with the
+# twpm.core.chain submodule, which would otherwise shadow it once imported
+from twpm.core.chain import Chain, ChainTemplate, CompiledChain, chain
+
+if TYPE_CHECKING:
+    from twpm.core.cursor import Cursor
+    from twpm.core.layout import DataLayout
+    from twpm.core.orchestrator import Orchestrator
+
+# Public name -> module that defines it
+_LAZY_ATTRIBUTES = {
+    "Cursor": "twpm.core.cursor",
+    "DataLayout": "twpm.core.layout",
+    "Orchestrator": "twpm.core.orchestrator",
+}
 
 __all__ = [
     "Chain",
+    "ChainTemplate",
+    "CompiledChain",
     "Cursor",
+    "DataLayout",
     "Orchestrator",
     "chain",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
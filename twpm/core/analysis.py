@@ -0,0 +1,167 @@
+"""
+Build-time static analysis of workflows.
+
+Walks the whole node graph once, before any session runs, and reports
+every problem at the same time: misconfigured nodes, duplicate keys,
+fields that are read but never written, and branches that would create a
+cycle when spliced into the chain by Cursor.insert. Nodes of a graph that
+passes validation are marked as verified and skip their own checks when
+executing.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from twpm.core.base import Node
+from twpm.core.cursor import Cursor
+
+# Keys written by the orchestrator itself rather than by a node
+_RUNTIME_KEYS = frozenset({"_user_input"})
+
+
+@dataclass(frozen=True)
+class Issue:
+    """
+    A single problem found in a workflow.
+
+    Attributes:
+        node_key: Key of the node the problem refers to
+        message: Description of the problem
+    """
+
+    node_key: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.node_key}: {self.message}"
+
+
+class WorkflowValidationError(ValueError):
+    """
+    Raised when a workflow fails validation.
+
+    Attributes:
+        issues: Every problem found in the workflow
+    """
+
+    def __init__(self, issues: list[Issue]):
+        self.issues = issues
+        details = "\n".join(f"  - {issue}" for issue in issues)
+        super().__init__(f"Workflow validation failed:\n{details}")
+
+
+def _check_nodes(nodes: list[Node]) -> list[Issue]:
+    return [Issue(node.key, problem) for node in nodes for problem in node.validate()]
+
+
+def _check_duplicate_keys(nodes: list[Node]) -> list[Issue]:
+    seen: set[str] = set()
+    reported: set[str] = set()
+    issues = []
+
+    for node in nodes:
+        if node.key in seen and node.key not in reported:
+            issues.append(Issue(node.key, "Duplicate node key."))
+            reported.add(node.key)
+        seen.add(node.key)
+
+    return issues
+
+
+def _check_data_flow(nodes: list[Node], known_keys: Iterable[str]) -> list[Issue]:
+    written = set(_RUNTIME_KEYS)
+    written.update(known_keys)
+
+    for node in nodes:
+        keys = node.output_keys()
+        if keys is None:
+            # A node may write arbitrary keys, nothing can be proven
+            return []
+        written.update(keys)
+
+    return [
+        Issue(node.key, f"Reads '{key}' but no node writes it.")
+        for node in nodes
+        for key in node.input_keys()
+        if key not in written
+    ]
+
+
+def _check_links(head: Node) -> list[Issue]:
+    """
+    Check that every node belongs to exactly one linear sequence.
+
+    The main chain and each branch are sequences. Cursor.insert links the
+    end of a branch to the node after its router, so a branch that reuses
+    a node of another sequence, or a sequence that loops on itself, would
+    create a cycle at runtime.
+    """
+    issues = []
+    owners: dict[int, str] = {}
+    pending: list[tuple[str, Node]] = [("main chain", head)]
+
+    while pending:
+        sequence, current = pending.pop()
+
+        while current is not None:
+            owner = owners.get(id(current))
+            if owner is not None:
+                if owner == sequence:
+                    message = (
+                        f"The {sequence} links back to this node, forming a cycle."
+                    )
+                else:
+                    message = (
+                        f"Node is linked in both the {owner} and the {sequence}; "
+                        "inserting the branch would create a cycle."
+                    )
+                issues.append(Issue(current.key, message))
+                break
+
+            owners[id(current)] = sequence
+            for branch in current.branches():
+                pending.append((f"branch '{branch.key}' of '{current.key}'", branch))
+            current = current.next
+
+    return issues
+
+
+def analyze(head: Node, known_keys: Iterable[str] = ()) -> list[Issue]:
+    """
+    Analyze every node reachable from head.
+
+    Args:
+        head: The head node of a built chain
+        known_keys: Keys supplied from outside the workflow, e.g. by the
+                    session's initial ListData, which nodes may read
+                    without any node writing them
+
+    Returns:
+        List of problems found, empty when the workflow is valid
+    """
+    issues = _check_links(head)
+    nodes = list(Cursor.walk(head))
+
+    issues.extend(_check_nodes(nodes))
+    issues.extend(_check_duplicate_keys(nodes))
+    issues.extend(_check_data_flow(nodes, known_keys))
+    return issues
+
+
+def validate(head: Node, known_keys: Iterable[str] = ()) -> None:
+    """
+    Validate a workflow and mark its nodes as verified.
+
+    Args:
+        head: The head node of a built chain
+        known_keys: Keys supplied from outside the workflow (see analyze)
+
+    Raises:
+        WorkflowValidationError: With every problem found, if any
+    """
+    issues = analyze(head, known_keys)
+    if issues:
+        raise WorkflowValidationError(issues)
+
+    for node in Cursor.walk(head):
+        node.verified = True
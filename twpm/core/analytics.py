@@ -0,0 +1,347 @@
+"""
+Streaming analytics aggregated across sessions.
+
+QuizSummaryNode and friends score one session and move on. A
+WorkflowAnalytics listener, registered on every session's Orchestrator,
+folds their events into compact counters instead of storing sessions:
+
+    - reach: sessions that entered each node (once per session)
+    - drop-off: sessions that stopped at each node, because the node
+      failed or the session was abandoned while waiting there
+    - answers: distribution of the values chosen at option nodes
+      (PoolNode, QuizNode, PagedPoolNode), and per sampled question for
+      QuestionBankNode, under `{key}[{question index}]`
+    - scores: histogram of every `*_score_percentage` output
+
+Memory grows with the number of nodes and distinct answers, not with the
+number of sessions: only sessions still in progress are tracked, up to
+`max_open_sessions`. Counters can be written to a JSON file periodically
+and are restored with `load()`. Listeners run inside the orchestrator's
+processing loop, so the listener only notes that a snapshot is due; the
+file is written by a background task, in a worker thread, or by `flush()`.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from twpm.core.base import Node
+from twpm.core.events import WorkflowEvent, WorkflowEventType
+from twpm.core.primitives.quiz.question_bank import QuestionBankNode
+
+logger = logging.getLogger(__name__)
+
+# Bucket of answers beyond max_answers distinct values per node
+OTHER_ANSWER = "(other)"
+
+_SCORE_SUFFIX = "_score_percentage"
+
+
+def _indices(value: str | None) -> list[int]:
+    """Parse the comma-separated indices stored by QuestionBankNode."""
+    return [int(index) for index in value.split(",")] if value else []
+
+
+class _Session:
+    """Progress of a session still running."""
+
+    __slots__ = ("node", "visited")
+
+    def __init__(self) -> None:
+        self.node: str | None = None
+        self.visited: set[str] = set()
+
+
+class WorkflowAnalytics:
+    """
+    Orchestrator listener aggregating funnel and quiz statistics.
+
+    Example:
+        ```python
+        analytics = WorkflowAnalytics(snapshot_path="analytics.json")
+
+        orchestrator = Orchestrator(container)
+        orchestrator.add_listener(analytics)
+
+        ...
+        analytics.dropoff().most_common(3)  # [("plan", 41), ...]
+        analytics.answers["color"]  # Counter({"Blue": 120, "Red": 87})
+
+        await analytics.flush()  # on shutdown
+        ```
+    """
+
+    def __init__(
+        self,
+        max_answers: int = 50,
+        score_bins: int = 10,
+        max_open_sessions: int = 100_000,
+        snapshot_path: str | Path | None = None,
+        snapshot_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a WorkflowAnalytics.
+
+        Args:
+            max_answers: Distinct answers counted per node, further answers
+                         are counted as OTHER_ANSWER
+            score_bins: Number of equal-width score histogram buckets
+                        between 0 and 100%
+            max_open_sessions: Sessions in progress tracked at once; when
+                               exceeded, the least recently active session
+                               is counted as abandoned
+            snapshot_path: JSON file the counters are saved to, if any
+            snapshot_interval: Minimum seconds between two automatic saves,
+                               which run in the background on the running
+                               event loop
+            clock: Monotonic time source, in seconds
+        """
+        if max_answers < 1 or score_bins < 1 or max_open_sessions < 1:
+            raise ValueError(
+                "max_answers, score_bins and max_open_sessions must be positive"
+            )
+
+        self.max_answers = max_answers
+        self.score_bins = score_bins
+        self.max_open_sessions = max_open_sessions
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.snapshot_interval = snapshot_interval
+        self._clock = clock
+        self._last_snapshot = clock()
+        # Counters changed since the last snapshot written to snapshot_path
+        self._dirty = False
+        self._saving: asyncio.Task | None = None
+
+        self.started = 0
+        self.finished = 0
+        self.reach: Counter[str] = Counter()
+        self.completed: Counter[str] = Counter()
+        self.failed: Counter[str] = Counter()
+        self.abandoned: Counter[str] = Counter()
+        self.answers: dict[str, Counter[str]] = {}
+        self.scores: dict[str, list[int]] = {}
+
+        self._sessions: OrderedDict[str | None, _Session] = OrderedDict()
+
+    def __call__(self, event: WorkflowEvent) -> None:
+        """Fold an orchestrator event into the counters."""
+        session_id = event.session_id
+
+        if event.type == WorkflowEventType.STARTED:
+            # A session started again is abandoned where it was
+            self._abandon(session_id)
+            self._open(session_id)
+            self.started += 1
+        elif event.type in (WorkflowEventType.FINISHED, WorkflowEventType.ERROR):
+            session = self._sessions.pop(session_id, None)
+            if event.type == WorkflowEventType.FINISHED and event.node is None:
+                self.finished += 1
+            elif session is not None and session.node is not None:
+                self.failed[session.node] += 1
+        else:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._open(session_id)
+            else:
+                self._sessions.move_to_end(session_id)
+
+            assert event.node is not None, "Node events always carry a node"
+            node_key = self._node_key(event.node)
+
+            if event.type == WorkflowEventType.NODE_ENTERED:
+                session.node = node_key
+                if node_key not in session.visited:
+                    session.visited.add(node_key)
+                    self.reach[node_key] += 1
+            elif event.type == WorkflowEventType.NODE_COMPLETED:
+                self.completed[node_key] += 1
+                self._record_outputs(event)
+
+        self._dirty = True
+        if (
+            self.snapshot_path is not None
+            and self._saving is None
+            and self._clock() - self._last_snapshot >= self.snapshot_interval
+        ):
+            self._schedule_save()
+
+    def dropoff(self) -> Counter[str]:
+        """
+        Sessions that stopped at each node: failed there, abandoned while
+        waiting there, or still waiting there now.
+        """
+        waiting = Counter(
+            session.node
+            for session in self._sessions.values()
+            if session.node is not None
+        )
+        return self.failed + self.abandoned + waiting
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the counters as JSON-serializable data."""
+        return {
+            "started": self.started,
+            "finished": self.finished,
+            "in_progress": len(self._sessions),
+            "reach": dict(self.reach),
+            "completed": dict(self.completed),
+            "failed": dict(self.failed),
+            "abandoned": dict(self.abandoned),
+            "dropoff": dict(self.dropoff()),
+            "answers": {key: dict(counts) for key, counts in self.answers.items()},
+            "scores": {key: list(bins) for key, bins in self.scores.items()},
+        }
+
+    def save(self, path: str | Path | None = None) -> None:
+        """
+        Write a snapshot to a JSON file, atomically.
+
+        Args:
+            path: Destination file, snapshot_path if None
+        """
+        path = Path(path) if path is not None else self.snapshot_path
+        if path is None:
+            raise ValueError("No snapshot path given")
+
+        if path == self.snapshot_path:
+            self._last_snapshot = self._clock()
+            self._dirty = False
+        self._write(path, self.snapshot())
+
+    async def flush(self) -> None:
+        """
+        Write the counters changed since the last snapshot to snapshot_path,
+        e.g. on shutdown. Waits for a background save in progress first.
+        The file is written in a worker thread.
+        """
+        if self._saving is not None:
+            await asyncio.shield(self._saving)
+        if self.snapshot_path is not None and self._dirty:
+            await self._save_snapshot()
+
+    def _schedule_save(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to save on: the counters stay dirty until flush()
+            return
+        self._saving = loop.create_task(self._save_snapshot())
+        self._saving.add_done_callback(self._saved)
+
+    def _saved(self, task: asyncio.Task) -> None:
+        if self._saving is task:
+            self._saving = None
+
+    async def _save_snapshot(self) -> None:
+        assert self.snapshot_path is not None
+        self._last_snapshot = self._clock()
+        self._dirty = False
+        # Taken on the loop, so the counters never change while writing
+        snapshot = self.snapshot()
+        await asyncio.to_thread(self._write, self.snapshot_path, snapshot)
+
+    @staticmethod
+    def _write(path: Path, snapshot: dict[str, Any]) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Saving analytics snapshot failed: {e}")
+            return
+
+        # Readers never see a partially written snapshot
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            Path(tmp_path).unlink(missing_ok=True)
+            logger.warning(f"Saving analytics snapshot failed: {e}")
+
+    def load(self, path: str | Path | None = None) -> None:
+        """
+        Add the counters of a saved snapshot to this aggregator, e.g. to
+        carry them over a restart. Sessions that were in progress are not
+        restored.
+
+        Args:
+            path: Snapshot file, snapshot_path if None
+        """
+        path = Path(path) if path is not None else self.snapshot_path
+        if path is None:
+            raise ValueError("No snapshot path given")
+
+        with path.open(encoding="utf-8") as f:
+            saved = json.load(f)
+
+        self.started += saved["started"]
+        self.finished += saved["finished"]
+        self.reach.update(saved["reach"])
+        self.completed.update(saved["completed"])
+        self.failed.update(saved["failed"])
+        self.abandoned.update(saved["abandoned"])
+        for key, counts in saved["answers"].items():
+            self.answers.setdefault(key, Counter()).update(counts)
+        for key, bins in saved["scores"].items():
+            current = self._bins(key)
+            for i, count in enumerate(bins[: self.score_bins]):
+                current[i] += count
+
+    def _open(self, session_id: str | None) -> _Session:
+        session = self._sessions[session_id] = _Session()
+        if len(self._sessions) > self.max_open_sessions:
+            self._abandon(next(iter(self._sessions)))
+        return session
+
+    def _abandon(self, session_id: str | None) -> None:
+        session = self._sessions.pop(session_id, None)
+        if session is not None and session.node is not None:
+            self.abandoned[session.node] += 1
+
+    def _record_outputs(self, event: WorkflowEvent) -> None:
+        node = event.node
+        assert node is not None, "Node events always carry a node"
+
+        if isinstance(node, QuestionBankNode):
+            # Every session answers its own sample: count per question
+            questions = _indices(event.data.get(f"{node.key}_questions"))
+            answers = _indices(event.data.get(f"{node.key}_answers"))
+            for index, answer in zip(questions, answers):
+                options = node.bank[index].options
+                self._count_answer(f"{node.key}[{index}]", options[answer])
+        elif hasattr(node, "options") and node.key and event.data.has(node.key):
+            self._count_answer(node.key, event.data[node.key])
+
+        for output_key in node.output_keys() or ():
+            if output_key.endswith(_SCORE_SUFFIX) and event.data.has(output_key):
+                try:
+                    percentage = float(event.data[output_key])
+                except ValueError:
+                    continue
+                bin_width = 100 / self.score_bins
+                index = min(max(int(percentage // bin_width), 0), self.score_bins - 1)
+                self._bins(output_key.removesuffix(_SCORE_SUFFIX))[index] += 1
+
+    def _count_answer(self, key: str, answer: str) -> None:
+        counts = self.answers.setdefault(key, Counter())
+        if answer not in counts and len(counts) >= self.max_answers:
+            answer = OTHER_ANSWER
+        counts[answer] += 1
+
+    def _bins(self, key: str) -> list[int]:
+        bins = self.scores.get(key)
+        if bins is None:
+            bins = self.scores[key] = [0] * self.score_bins
+        return bins
+
+    @staticmethod
+    def _node_key(node: Node) -> str:
+        return node.key or f"{node.__class__.__name__}@{id(node)}"
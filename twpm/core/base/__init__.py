@@ -10,7 +10,12 @@ Example:
 """
 
 from twpm.core.base.enums import NodeStatus
-from twpm.core.base.models import ListData, NodeResult
+from twpm.core.base.models import (
+    CompactListData,
+    ListData,
+    NodeResult,
+    SubworkflowCall,
+)
 from twpm.core.base.node import Node
 from twpm.core.base.types import NodeKey, Value
 
@@ -23,6 +28,8 @@ __all__ = [
     # Models
     "NodeResult",
     "ListData",
+    "CompactListData",
+    "SubworkflowCall",
     # Base classes
     "Node",
 ]
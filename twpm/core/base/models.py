@@ -5,10 +5,16 @@ This module contains all data classes and models used for passing information
 between nodes and managing workflow state.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from twpm.core.base.types import NodeKey, Value
 
+if TYPE_CHECKING:
+    from twpm.core.base.node import Node
+    from twpm.core.layout import DataLayout
+
 
 @dataclass
 class NodeResult:
@@ -23,12 +29,35 @@ class NodeResult:
         data: Dictionary of data produced by the node execution
         message: Optional message providing context about the execution
         is_awaiting_input: Whether the node is waiting for external input
+        next_node: Node to continue with instead of `next`, letting routing
+                   nodes jump without mutating the graph
+        call: Subworkflow to run before continuing with `next`
     """
 
     success: bool
     data: dict[str, str]
     message: str
     is_awaiting_input: bool = False
+    next_node: "Node | None" = None
+    call: "SubworkflowCall | None" = None
+
+
+@dataclass
+class SubworkflowCall:
+    """
+    Request to run another workflow and then return to the caller.
+
+    Attributes:
+        head: Head node of the called workflow
+        data: Data the called workflow runs on; the caller's own data for a
+              shared scope
+        outputs: Keys copied back into the caller's data when the call
+                 returns from a separate data scope; None copies every key
+    """
+
+    head: "Node"
+    data: "ListData"
+    outputs: tuple[NodeKey, ...] | None = None
 
 
 @dataclass
@@ -86,3 +115,110 @@ class ListData:
             True if the key exists, False otherwise
         """
         return key in self.data
+
+    def get_many(
+        self, keys: Iterable[NodeKey], default: Value | None = None
+    ) -> list[Value | None]:
+        """
+        Get several values at once, in the order of the given keys.
+
+        Args:
+            keys: The keys to look up
+            default: Value used for every key that doesn't exist
+
+        Returns:
+            List with one value (or the default) per key
+        """
+        get = self.data.get
+        return [get(key, default) for key in keys]
+
+
+_MISSING = object()
+
+
+class CompactListData(ListData):
+    """
+    ListData stored in a list of slots assigned by a DataLayout.
+
+    Keys known by the layout are kept in a flat list indexed by their slot,
+    keys that appear only at runtime go to a small overflow dictionary. The
+    public API is the same as ListData, so nodes don't need to know which
+    implementation they receive.
+
+    Attributes:
+        layout: The DataLayout that assigned the slots
+    """
+
+    def __init__(
+        self, layout: "DataLayout", data: dict[NodeKey, Value] | None = None
+    ) -> None:
+        self.layout = layout
+        self._slots = layout.slots
+        self._values: list = [_MISSING] * len(layout)
+        self._overflow: dict[NodeKey, Value] = {}
+
+        if data:
+            self.update(data)
+
+    @property
+    def data(self) -> dict[NodeKey, Value]:
+        """Snapshot of the stored values as a plain dictionary."""
+        result = {
+            key: value
+            for key, value in zip(self.layout.keys, self._values)
+            if value is not _MISSING
+        }
+        result.update(self._overflow)
+        return result
+
+    def __getitem__(self, key: NodeKey) -> Value:
+        slot = self._slots.get(key)
+        if slot is None:
+            return self._overflow[key]
+
+        value = self._values[slot]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: NodeKey, value: Value) -> None:
+        slot = self._slots.get(key)
+        if slot is None:
+            self._overflow[key] = value
+        else:
+            self._values[slot] = value
+
+    def get(self, key: NodeKey, default: Value | None = None):
+        slot = self._slots.get(key)
+        if slot is None:
+            return self._overflow.get(key, default)
+
+        value = self._values[slot]
+        return default if value is _MISSING else value
+
+    def update(self, new_data: dict[NodeKey, Value]) -> None:
+        for key, value in new_data.items():
+            self[key] = value
+
+    def has(self, key: NodeKey) -> bool:
+        slot = self._slots.get(key)
+        if slot is None:
+            return key in self._overflow
+        return self._values[slot] is not _MISSING
+
+    def get_many(
+        self, keys: Iterable[NodeKey], default: Value | None = None
+    ) -> list[Value | None]:
+        keys = tuple(keys)
+        values = self._values
+        overflow = self._overflow
+        result = []
+
+        for key, slot in zip(keys, self.layout.plan(keys)):
+            if slot is None:
+                result.append(overflow.get(key, default))
+            else:
+                value = values[slot]
+                result.append(default if value is _MISSING else value)
+
+        return result
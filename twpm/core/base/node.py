@@ -5,10 +5,13 @@ This module defines the core Node interface that all workflow nodes must impleme
 The Node class provides the basic structure for nodes in a linked list-based workflow.
 """
 
+import copy
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 
 from twpm.core.base.enums import NodeStatus
 from twpm.core.base.models import ListData, NodeResult
+from twpm.core.base.types import NodeKey
 
 
 class Node(ABC):
@@ -24,6 +27,8 @@ class Node(ABC):
         next: Reference to the next node in the workflow
         previous: Reference to the previous node in the workflow
         status: Current execution status of the node
+        verified: Whether the node passed build-time validation, letting it
+                  skip its per-execution checks
     """
 
     def __init__(self, key: str) -> None:
@@ -32,6 +37,7 @@ class Node(ABC):
         self.next: Node | None = None
         self.previous: Node | None = None
         self.status: NodeStatus = NodeStatus.DEFAULT
+        self.verified: bool = False
 
     @abstractmethod
     async def execute(self, data: ListData) -> NodeResult:
@@ -49,3 +55,102 @@ class Node(ABC):
             NodeResult containing execution status and any produced data
         """
         ...
+
+    def branches(self) -> list["Node"]:
+        """
+        Nodes this node may route to besides `next`.
+
+        Routing nodes (conditionals, switches) override this so structural
+        tools can reach every node of a workflow without executing it.
+
+        Returns:
+            List of branch head nodes, empty by default
+        """
+        return []
+
+    def bind(self, nodes: dict[NodeKey, "Node"]) -> None:
+        """
+        Resolve references to other nodes by key.
+
+        Called once the whole graph is built, so nodes can refer to nodes
+        that appear later or earlier in the workflow (e.g. loop targets).
+
+        Args:
+            nodes: Every node of the workflow, by key
+        """
+        return None
+
+    def clone(self) -> "Node":
+        """
+        Create an unlinked copy of this node for a new chain.
+
+        The copy is shallow: configuration (questions, options, compiled
+        templates, functions) is shared with this node, while links and
+        status start fresh. Per-session state is safe to share only as long
+        as nodes replace it rather than mutate it in place; nodes keeping
+        mutable state must override this method to copy it.
+
+        Returns:
+            The copy, with no `next` or `previous` link
+        """
+        clone = copy.copy(self)
+        clone.next = None
+        clone.previous = None
+        clone.status = NodeStatus.DEFAULT
+        return clone
+
+    def relink(self, clones: Mapping[int, "Node"]) -> None:
+        """
+        Point references to other nodes at their clones.
+
+        Called on every clone when a chain is copied (see ChainTemplate),
+        after `next` and `previous` have been relinked. Nodes holding
+        references besides those links (e.g. branches) override this.
+
+        Args:
+            clones: The clone of every copied node, by id() of the original
+        """
+        return None
+
+    def input_keys(self) -> tuple[NodeKey, ...]:
+        """
+        Keys this node reads from the shared ListData.
+
+        Returns:
+            Tuple of data keys, empty by default
+        """
+        return ()
+
+    def output_keys(self) -> tuple[NodeKey, ...] | None:
+        """
+        Keys this node writes to the shared ListData.
+
+        Returns:
+            Tuple of data keys, or None when the node may write arbitrary
+            keys (the default, since custom nodes can return any data)
+        """
+        return None
+
+    def data_keys(self) -> tuple[NodeKey, ...]:
+        """
+        Keys this node reads from or writes to the shared ListData.
+
+        Used to compile a DataLayout for a workflow. Keys not declared here
+        still work at runtime, they are just stored in the overflow area.
+
+        Returns:
+            Tuple of data keys
+        """
+        return self.input_keys() + (self.output_keys() or ())
+
+    def validate(self) -> list[str]:
+        """
+        Check that the node is fully configured.
+
+        Called once for every node by build-time validation. Nodes that are
+        verified skip the equivalent checks when executing.
+
+        Returns:
+            List of problems found, empty when the node is valid
+        """
+        return []
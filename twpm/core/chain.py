@@ -5,11 +5,126 @@ This module provides user-friendly ways to create node chains without
 requiring knowledge of doubly linked list structures.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from typing import NamedTuple
 
-from twpm.constants import DEFAULT_PROGRESS_NODE
+from twpm.core.analysis import validate as validate_workflow
 from twpm.core.base import Node
-from twpm.core.cursor import Cursor
+from twpm.core.cursor import Cursor, Segment
+
+# Which nodes an injection follows: a node type, a tuple of node types or a
+# filter function; None for every node
+NodeFilter = type | tuple[type, ...] | Callable[[Node], bool] | None
+
+
+def _as_filter(after_each: NodeFilter) -> Callable[[Node], bool] | None:
+    """Turn a node filter specification into a filter function."""
+    if isinstance(after_each, (type, tuple)):
+        types = after_each
+
+        def filter_fn(node: Node) -> bool:
+            return isinstance(node, types)
+
+        return filter_fn
+    if callable(after_each):
+        return after_each
+    return None
+
+
+class _Injection(NamedTuple):
+    """A node factory applied after each node matching a filter."""
+
+    filter_fn: Callable[[Node], bool] | None
+    node_factory: Callable[[Node], Node] | None
+    # Progress tracking fields, used when node_factory is None
+    fields: list[tuple[str, str]] | None = None
+
+
+class CompiledChain:
+    """
+    A built chain, with its nodes indexed by type and by key.
+
+    Produced by Chain.compile(). The index covers the nodes of the chain
+    itself, injected nodes included; nodes reachable only through the
+    branches of routing nodes are in `nodes` but not in the type index.
+
+    Example:
+        ```python
+        compiled = Chain(welcome, name, email).with_progress(fields).compile()
+        orchestrator.start(session_id, compiled.head)
+        questions = compiled.find_by_type(QuestionNode)
+        ```
+    """
+
+    __slots__ = (
+        "head",
+        "tail",
+        "length",
+        "nodes",
+        "_by_type",
+        "_queries",
+        "_positions",
+    )
+
+    def __init__(self, segment: Segment, nodes: dict[str, Node]):
+        """
+        Index a linked chain.
+
+        Args:
+            segment: The linked chain
+            nodes: Every node reachable from the head, by key (see Cursor.bind)
+        """
+        assert segment.head is not None and segment.tail is not None
+
+        self.head: Node = segment.head
+        self.tail: Node = segment.tail
+        self.length = len(segment)
+        self.nodes = nodes
+
+        # Exact node type -> its nodes in chain order
+        self._by_type: dict[type, list[Node]] = {}
+        # Queried type(s) -> matching nodes, filled on first query
+        self._queries: dict[type | tuple[type, ...], list[Node]] = {}
+        self._positions: dict[int, int] = {}
+        for position, node in enumerate(segment):
+            self._by_type.setdefault(type(node), []).append(node)
+            self._positions[id(node)] = position
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[Node]:
+        current: Node | None = self.head
+        for _ in range(self.length):
+            assert current is not None
+            yield current
+            current = current.next
+
+    def find_by_type(self, node_type: type | tuple[type, ...]) -> list[Node]:
+        """
+        Find the nodes of the chain that are instances of node_type.
+
+        A dictionary lookup; the first query for a given type or tuple of
+        types merges the matching indexed types once and caches the result.
+
+        Args:
+            node_type: A node type or a tuple of node types
+
+        Returns:
+            Matching nodes in chain order
+        """
+        found = self._queries.get(node_type)
+        if found is None:
+            matching = [
+                nodes
+                for indexed_type, nodes in self._by_type.items()
+                if issubclass(indexed_type, node_type)
+            ]
+            found = [node for nodes in matching for node in nodes]
+            if len(matching) > 1:
+                found.sort(key=lambda node: self._positions[id(node)])
+            self._queries[node_type] = found
+        return list(found)
 
 
 class Chain:
@@ -57,7 +172,9 @@ class Chain:
             ```
         """
         self._nodes: list[Node] = list(nodes)
-        self._progress_config: dict | None = None
+        self._injections: list[_Injection] = []
+        # Position of the progress tracking injection in _injections
+        self._progress_position: int | None = None
 
     def add(self, node: Node) -> "Chain":
         """
@@ -117,17 +234,47 @@ class Chain:
             self._nodes.append(node)
         return self
 
+    def inject_after(
+        self,
+        after_each: NodeFilter,
+        node_factory: Callable[[Node], Node],
+    ) -> "Chain":
+        """
+        Insert a node after each matching node when the chain is built.
+
+        Every injection is applied in the same pass that links the chain.
+        Injected nodes are never matched themselves, and nodes injected
+        after the same node follow it in the order the injections were
+        configured.
+
+        Args:
+            after_each: Node type(s) to insert after, or a filter function.
+                        If None, inserts after every node.
+            node_factory: Function creating the injected node, receives the
+                          node it follows
+
+        Returns:
+            Self for method chaining
+
+        Example:
+            ```python
+            builder.inject_after(PoolNode, lambda node: AuditNode(node.key))
+            ```
+        """
+        self._injections.append(_Injection(_as_filter(after_each), node_factory))
+        return self
+
     def with_progress(
         self,
         fields: list[tuple[str, str]],
-        after_each: type | tuple[type, ...] | Callable[[Node], bool] | None = None,
+        after_each: NodeFilter = None,
         node_factory: Callable[[Node], Node] | None = None,
     ) -> "Chain":
         """
         Configure automatic progress tracking injection.
 
         This will automatically insert progress nodes after specified node types
-        when build() is called.
+        when build() is called. Calling it again replaces the configuration.
 
         Args:
             fields: List of (label, data_key) tuples for progress tracking
@@ -147,116 +294,243 @@ class Chain:
             )
             ```
         """
-        self._progress_config = {
-            "fields": fields,
-            "after_each": after_each,
-            "node_factory": node_factory,
-        }
+        injection = _Injection(_as_filter(after_each), node_factory, fields)
+        if self._progress_position is None:
+            self._progress_position = len(self._injections)
+            self._injections.append(injection)
+        else:
+            self._injections[self._progress_position] = injection
         return self
 
-    def build(self) -> Node:
+    def build(self, validate: bool = True, known_keys: Iterable[str] = ()) -> Node:
         """
         Build and return the final chain.
 
         Links all nodes together and applies any configured operations
-        like progress tracking injection.
+        like progress tracking injection, then validates the whole graph
+        (see twpm.core.analysis) and marks its nodes as verified.
+
+        Args:
+            validate: Whether to run build-time validation
+            known_keys: Keys supplied from outside the workflow, such as
+                        fields of the initial ListData, that nodes may read
+                        without any node writing them
 
         Returns:
             The head node of the built chain
 
         Raises:
             ValueError: If no nodes have been added
+            WorkflowValidationError: If validation finds any problem
+
+        Note:
+            Validation is on by default. Chains whose nodes read fields
+            of the initial ListData must list those fields in known_keys
+            (or pass validate=False), otherwise they are reported as read
+            but never written.
 
         Example:
             ```python
-            head = chain.build()
-            orchestrator.start(head)
+            head = chain.build(known_keys=["user_id"])
+            orchestrator.start(session_id, head, ListData(data={"user_id": "42"}))
             ```
         """
+        return self.compile(validate, known_keys).head
+
+    def compile(
+        self, validate: bool = True, known_keys: Iterable[str] = ()
+    ) -> CompiledChain:
+        """
+        Build the chain and index its nodes.
+
+        Linking and every injection (see inject_after and with_progress)
+        happen in a single linear pass over the nodes.
+
+        Args:
+            validate: Whether to run build-time validation
+            known_keys: Keys supplied from outside the workflow, such as
+                        fields of the initial ListData, that nodes may read
+                        without any node writing them
+
+        Returns:
+            The built chain with its node indexes
+
+        Raises:
+            ValueError: If no nodes have been added
+            WorkflowValidationError: If validation finds any problem
+        """
         if not self._nodes:
             raise ValueError("Cannot build empty chain. Add at least one node.")
 
-        # Link all nodes together
-        head = self._link_nodes()
+        injections = [
+            (injection.filter_fn, self._factory(injection))
+            for injection in self._injections
+        ]
+
+        segment = Segment()
+        for node in self._nodes_to_link():
+            node.next = None
+            segment.append(node)
+            for filter_fn, node_factory in injections:
+                if filter_fn is None or filter_fn(node):
+                    segment.append(node_factory(node))
+
+        head = segment.head
+        assert head is not None, "A non-empty chain has a head"
 
-        # Apply progress tracking if configured
-        if self._progress_config:
-            self._apply_progress_tracking(head)
+        nodes = Cursor.bind(head)
 
-        return head
+        if validate:
+            validate_workflow(head, known_keys)
 
-    def _link_nodes(self) -> Node:
+        return CompiledChain(segment, nodes)
+
+    def template(
+        self, validate: bool = True, known_keys: Iterable[str] = ()
+    ) -> "ChainTemplate":
         """
-        Link all nodes in the chain together.
+        Build the chain once and return a template instantiating copies of it.
+
+        The nodes given to this chain become the template's definitions and
+        must not be executed themselves.
+
+        Args:
+            validate: Whether to run build-time validation
+            known_keys: Keys supplied from outside the workflow, such as
+                        fields of the initial ListData, that nodes may read
+                        without any node writing them
 
         Returns:
-            The head node of the linked chain
+            A ChainTemplate of the built chain
+
+        Example:
+            ```python
+            onboarding = Chain(welcome, name, email).with_progress(fields).template()
+
+            head = onboarding.build()  # for each new session
+            ```
         """
-        if len(self._nodes) == 1:
-            return self._nodes[0]
+        return ChainTemplate(self.compile(validate, known_keys).head)
 
-        # Link nodes together
-        for i in range(len(self._nodes) - 1):
-            current = self._nodes[i]
-            next_node = self._nodes[i + 1]
+    def _nodes_to_link(self) -> Iterator[Node]:
+        """
+        Yield the nodes of the chain in order.
 
-            current.next = next_node
-            next_node.previous = current
+        The last node keeps its `next` links, so a prebuilt chain can end
+        a workflow.
+        """
+        yield from self._nodes[:-1]
+
+        current: Node | None = self._nodes[-1]
+        while current is not None:
+            # Read the link before the node is relinked
+            next_node = current.next
+            yield current
+            current = next_node
+
+    @staticmethod
+    def _factory(injection: _Injection) -> Callable[[Node], Node]:
+        """Get the node factory of an injection, fresh for every build."""
+        if injection.node_factory is not None:
+            return injection.node_factory
+
+        # Imported here so building a chain without progress tracking
+        # doesn't load the primitives
+        from twpm.constants import DEFAULT_PROGRESS_NODE
+
+        fields = injection.fields
+        counter = 0
+
+        def node_factory(node: Node) -> Node:
+            nonlocal counter
+            counter += 1
+            return DEFAULT_PROGRESS_NODE(
+                fields=fields, title=None, key=f"progress_{counter}"
+            )
 
-        return self._nodes[0]
+        return node_factory
+
+
+class ChainTemplate:
+    """
+    A built workflow graph that can be instantiated many times.
 
-    def _apply_progress_tracking(self, head: Node) -> None:
+    Chain.build() links the node instances it is given, so a set of nodes
+    can only serve one session or one chain. A template keeps a built graph
+    as a read-only definition; build() shallow-copies its nodes (see
+    Node.clone), sharing their configuration, and relinks the copies along
+    precomputed positions. Copies of validated nodes are marked as verified
+    without validating them again.
+
+    Example:
+        ```python
+        address = Chain(street, city, zip_code).template()
+
+        shipping_head = address.build()
+        billing_head = address.build()
+        ```
+    """
+
+    __slots__ = ("_nodes", "_links")
+
+    def __init__(self, head: Node):
         """
-        Apply automatic progress tracking to the chain.
+        Create a template from the head of a built graph.
 
         Args:
-            head: The head node of the chain
+            head: Head of a built graph, including nodes reachable through
+                  branches; its nodes must not be executed afterwards
         """
-        config = self._progress_config
-        fields = config["fields"]
-        after_each = config["after_each"]
-        custom_factory = config["node_factory"]
-
-        # Import here to avoid circular dependency
-
-        # Determine filter function
-        if after_each is None:
-            filter_fn = None
-        elif isinstance(after_each, type):
-
-            def filter_fn(n):
-                return isinstance(n, after_each)
-        elif isinstance(after_each, tuple):
-
-            def filter_fn(n):
-                return isinstance(n, after_each)
-        elif callable(after_each):
-            filter_fn = after_each
-        else:
-            filter_fn = None
-
-        if custom_factory:
-            node_factory = custom_factory
-        else:
-            counter = 0
-
-            def node_factory(node: Node) -> Node:
-                nonlocal counter
-                counter += 1
-                return DEFAULT_PROGRESS_NODE(
-                    fields=fields, title=None, key=f"progress_{counter}"
-                )
-
-        # Find the last node in the chain
-        last_node = head
-        while last_node.next is not None:
-            last_node = last_node.next
-
-        # Apply progress tracking
-        Cursor.add_after_each(
-            begin=head, end=last_node, node_factory=node_factory, filter_fn=filter_fn
+        self._nodes: tuple[Node, ...] = tuple(Cursor.walk(head))
+
+        positions = {id(node): position for position, node in enumerate(self._nodes)}
+        # Position of each node's next and previous node, -1 for none
+        self._links: tuple[tuple[int, int], ...] = tuple(
+            (
+                positions.get(id(node.next), -1) if node.next is not None else -1,
+                positions.get(id(node.previous), -1)
+                if node.previous is not None
+                else -1,
+            )
+            for node in self._nodes
         )
 
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def head(self) -> Node:
+        """The template's own head node, for inspection only."""
+        return self._nodes[0]
+
+    def build(self) -> Node:
+        """
+        Instantiate a fresh copy of the graph.
+
+        Returns:
+            The head node of the copy
+        """
+        clones = [node.clone() for node in self._nodes]
+
+        for clone, (next_position, previous_position) in zip(clones, self._links):
+            if next_position >= 0:
+                clone.next = clones[next_position]
+            if previous_position >= 0:
+                clone.previous = clones[previous_position]
+
+        by_original = {
+            id(node): clone for node, clone in zip(self._nodes, clones, strict=True)
+        }
+        nodes: dict[str, Node] = {}
+        for clone in clones:
+            clone.relink(by_original)
+            nodes.setdefault(clone.key, clone)
+
+        for clone in clones:
+            clone.bind(nodes)
+
+        return clones[0]
+
 
 def chain(*nodes: Node) -> Node:
     """
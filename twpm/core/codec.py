@@ -0,0 +1,664 @@
+"""
+Compact binary encoding of compiled workflows and session snapshots.
+
+Every message starts with a header: the magic bytes b"TWPM", a format
+version and the kind of payload. The payload then holds:
+
+    - a table of interned strings (dictionary keys, node types), each
+      written once and referenced by index afterwards
+    - the body, where integers are LEB128 varints (zigzag-encoded when
+      signed) and strings are length-prefixed UTF-8. Dictionaries and
+      lists holding only strings, such as most session data, are packed
+      as arrays of key indices and lengths followed by one UTF-8 blob
+
+Values nested deeper than MAX_DEPTH are rejected on both sides.
+
+Session snapshots can also share a key table known to both sides, such as
+the keys of a DataLayout: keys found in it are written as their index and
+never stored in the snapshot at all. A checksum of the shared table is
+stored so decoding with a different table fails instead of mislabeling
+values.
+
+Example:
+    ```python
+    blob = encode_session(snapshot, keys=layout.keys)
+    snapshot = decode_session(blob, keys=layout.keys)
+    ```
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
+from itertools import accumulate, pairwise
+from typing import Any, NamedTuple
+
+from twpm.core.definitions import CompiledWorkflow, NodeSpec
+
+MAGIC = b"TWPM"
+FORMAT_VERSION = 2
+
+KIND_WORKFLOW = 1
+KIND_SESSION = 2
+
+_HEADER = struct.Struct("<4sBB")
+_FLOAT = struct.Struct("<d")
+
+# Value tags
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT_TAG = 4
+_STR = 5
+_LIST = 6
+_DICT = 7
+_TUPLE = 8
+# Containers of strings only, packed as an array of key indices and an
+# array of lengths followed by a single UTF-8 blob, so decoding splits
+# them with a few C calls instead of one call per item
+_STR_DICT = 9
+_STR_LIST = 10
+_STR_TUPLE = 11
+
+_SEQUENCES = frozenset({_LIST, _TUPLE, _STR_LIST, _STR_TUPLE})
+_STR_TYPE = {str}
+# Smaller string containers are written item by item
+_PACK_MIN = 4
+
+# Array typecodes of packed integers by item size, in little-endian order
+_TYPECODES = {1: "B", 2: "H", 4: "I"}
+_ITEMSIZE = {typecode: size for size, typecode in _TYPECODES.items()}
+_BIG_ENDIAN = sys.byteorder == "big"
+
+# Lists, tuples and dictionaries nested deeper are rejected, so crafted
+# messages fail with a CodecError instead of exhausting the stack
+MAX_DEPTH = 100
+
+# Encoded tag and length of short strings, and tag and value of small
+# non-negative integers, appended as one chunk
+_SHORT_STR = tuple(bytes((_STR, size)) for size in range(0x80))
+_SMALL_INT = tuple(bytes((_INT, value << 1)) for value in range(0x40))
+
+
+class CodecError(ValueError):
+    """Raised when a message cannot be decoded."""
+
+
+class CallSnapshot(NamedTuple):
+    """
+    A caller waiting for a subworkflow to return.
+
+    Attributes:
+        workflow: Name of the calling workflow
+        version: Version of the calling workflow
+        return_to: Key of the node the caller continues with, None when
+                   the call was its last node
+        data: The caller's data, None when the subworkflow shares it
+        outputs: Keys copied back to the caller on return, None for all
+    """
+
+    workflow: str
+    version: str
+    return_to: str | None
+    data: Mapping[str, Any] | None
+    outputs: tuple[str, ...] | None
+
+
+class SessionSnapshot(NamedTuple):
+    """
+    State of a session between two turns.
+
+    Attributes:
+        session_id: Identifier of the session
+        workflow: Name of the workflow the session is waiting in, the
+                  innermost subworkflow when calls is not empty
+        version: Version of that workflow
+        node: Key of the node the session is waiting at, None when finished
+        data: The data of that workflow, e.g. ListData.data
+        calls: Callers of the running subworkflows, outermost first
+    """
+
+    session_id: str
+    workflow: str
+    version: str
+    node: str | None
+    data: Mapping[str, Any]
+    calls: tuple[CallSnapshot, ...] = ()
+
+
+def _too_deep() -> CodecError:
+    return CodecError(f"Values are nested deeper than {MAX_DEPTH} levels")
+
+
+# -- encoding --
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _only_strings(items: Iterable[Any]) -> bool:
+    return set(map(type, items)) == _STR_TYPE
+
+
+class _Writer:
+    __slots__ = (
+        "body",
+        "strings",
+        "references",
+        "shared",
+        "positions",
+        "offset",
+    )
+
+    def __init__(self, shared: tuple[str, ...] = ()):
+        self.body = bytearray()
+        # String -> index in the message's table
+        self.strings: dict[str, int] = {}
+        # String -> encoded reference into the message's table
+        self.references: dict[str, bytes] = {}
+        # String -> encoded reference and index into the shared key table
+        self.shared, self.positions, _ = _key_table(shared)
+        # Message strings follow every shared key, duplicates included, in
+        # the decoder's table
+        self.offset = len(shared)
+
+    def varint(self, value: int) -> None:
+        out = self.body
+        if value < 0x80:
+            out.append(value)
+            return
+        while value > 0x7F:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    def signed(self, value: int) -> None:
+        self.varint(value << 1 if value >= 0 else (-value << 1) - 1)
+
+    def string(self, value: str) -> None:
+        encoded = value.encode()
+        size = len(encoded)
+        if size < 0x80:
+            self.body.append(size)
+        else:
+            self.varint(size)
+        self.body += encoded
+
+    def intern(self, value: str) -> int:
+        """Add a string to the message's table, returning its index."""
+        index = self.strings.get(value)
+        if index is None:
+            if not isinstance(value, str):
+                raise CodecError(f"Dictionary keys must be strings, got {value!r}")
+            index = self.strings[value] = len(self.strings)
+            self.references[value] = _varint(index << 1)
+        return index
+
+    def interned(self, value: str) -> None:
+        """Write an interned string: shared keys first, then the table."""
+        reference = self.shared.get(value) or self.references.get(value)
+        if reference is None:
+            self.intern(value)
+            reference = self.references[value]
+        self.body += reference
+
+    def packed(self, numbers: list[int]) -> None:
+        """Write non-negative integers as one array of the narrowest width."""
+        top = max(numbers)
+        typecode = "B" if top < 0x100 else "H" if top < 0x10000 else "I"
+        packed = array(typecode, numbers)
+        if _BIG_ENDIAN:
+            packed.byteswap()
+        self.body.append(packed.itemsize)
+        self.body += packed
+
+    def text(self, values: list[str]) -> None:
+        """Write strings as their lengths and a single UTF-8 blob."""
+        self.packed(list(map(len, values)))
+        self.string("".join(values))
+
+    def value(self, value: Any, depth: int = 0) -> None:
+        out = self.body
+        cls = type(value)
+        # Most frequent types first, each found with a single comparison
+        if cls is str:
+            encoded = value.encode()
+            size = len(encoded)
+            if size < 0x80:
+                out += _SHORT_STR[size]
+            else:
+                out.append(_STR)
+                self.varint(size)
+            out += encoded
+        elif cls is dict:
+            if depth >= MAX_DEPTH:
+                raise _too_deep()
+            if len(value) >= _PACK_MIN and _only_strings(value.values()):
+                out.append(_STR_DICT)
+                self.varint(len(value))
+                positions = self.positions
+                offset = self.offset
+                self.packed(
+                    [
+                        positions[key]
+                        if key in positions
+                        else offset + self.intern(key)
+                        for key in value
+                    ]
+                )
+                self.text(list(value.values()))
+                return
+
+            out.append(_DICT)
+            self.varint(len(value))
+            depth += 1
+            for key, item in value.items():
+                self.interned(key)
+                self.value(item, depth)
+        elif cls is list or cls is tuple:
+            if depth >= MAX_DEPTH:
+                raise _too_deep()
+            if len(value) >= _PACK_MIN and _only_strings(value):
+                out.append(_STR_LIST if cls is list else _STR_TUPLE)
+                self.varint(len(value))
+                self.text(list(value))
+                return
+
+            out.append(_LIST if cls is list else _TUPLE)
+            self.varint(len(value))
+            depth += 1
+            for item in value:
+                self.value(item, depth)
+        elif value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif cls is int:
+            if 0 <= value < 0x40:
+                out += _SMALL_INT[value]
+            else:
+                out.append(_INT)
+                self.signed(value)
+        elif cls is float:
+            out.append(_FLOAT_TAG)
+            out += _FLOAT.pack(value)
+        # Subclasses (IntEnum, NamedTuple, OrderedDict...) as their base
+        elif isinstance(value, int):
+            self.value(int(value), depth)
+        elif isinstance(value, float):
+            self.value(float(value), depth)
+        elif isinstance(value, str):
+            self.value(str.__str__(value), depth)
+        elif isinstance(value, list):
+            self.value(list(value), depth)
+        elif isinstance(value, tuple):
+            self.value(tuple(value), depth)
+        elif isinstance(value, dict):
+            self.value(dict(value), depth)
+        else:
+            raise CodecError(f"Cannot encode value of type {cls.__name__}")
+
+    def finish(self, kind: int, shared: tuple[str, ...] = ()) -> bytes:
+        header = _Writer()
+        header.body += _HEADER.pack(MAGIC, FORMAT_VERSION, kind)
+        header.varint(len(shared))
+        header.varint(_key_table(shared)[2])
+        header.varint(len(self.strings))
+        if self.strings:
+            header.text(list(self.strings))
+        return bytes(header.body + self.body)
+
+
+@lru_cache(maxsize=64)
+def _key_table(
+    keys: tuple[str, ...],
+) -> tuple[dict[str, bytes], dict[str, int], int]:
+    """
+    Encoded references, indices and checksum of a shared key table,
+    computed once per table.
+    """
+    positions = {key: position for position, key in enumerate(keys)}
+    references = {
+        key: _varint(position << 1 | 1) for key, position in positions.items()
+    }
+    checksum = zlib.crc32("\0".join(keys).encode()) if keys else 0
+    return references, positions, checksum
+
+
+def encode_workflow(workflow: CompiledWorkflow) -> bytes:
+    """
+    Encode a compiled workflow.
+
+    Args:
+        workflow: The workflow to encode
+
+    Returns:
+        The encoded message
+    """
+    writer = _Writer()
+    writer.string(workflow.name)
+    writer.string(workflow.version)
+    writer.string(workflow.digest)
+    writer.varint(workflow.head)
+    writer.varint(len(workflow.specs))
+
+    for spec in workflow.specs:
+        writer.interned(spec.type)
+        writer.value(spec.params)
+        writer.varint(0 if spec.next is None else spec.next + 1)
+        writer.varint(len(spec.branches))
+        for branch, index in spec.branches.items():
+            writer.interned(branch)
+            writer.varint(index)
+
+    return writer.finish(KIND_WORKFLOW)
+
+
+def encode_session(snapshot: SessionSnapshot, keys: Sequence[str] = ()) -> bytes:
+    """
+    Encode a session snapshot.
+
+    Args:
+        snapshot: The snapshot to encode
+        keys: Key table shared with the decoder, e.g. DataLayout.keys
+
+    Returns:
+        The encoded message
+    """
+    keys = tuple(keys)
+    writer = _Writer(keys)
+    writer.string(snapshot.session_id)
+    writer.interned(snapshot.workflow)
+    writer.interned(snapshot.version)
+    writer.value(snapshot.node)
+    writer.value(dict(snapshot.data))
+
+    writer.varint(len(snapshot.calls))
+    for call in snapshot.calls:
+        writer.interned(call.workflow)
+        writer.interned(call.version)
+        writer.value(call.return_to)
+        writer.value(None if call.data is None else dict(call.data))
+        writer.value(None if call.outputs is None else tuple(call.outputs))
+
+    return writer.finish(KIND_SESSION, keys)
+
+
+# -- decoding --
+
+
+class _Reader:
+    __slots__ = ("buffer", "position", "strings", "shared", "table")
+
+    def __init__(self, buffer: bytes, kind: int, shared: tuple[str, ...] = ()):
+        if len(buffer) < _HEADER.size:
+            raise CodecError("Message is truncated")
+
+        magic, version, message_kind = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise CodecError("Not a twpm message")
+        if version != FORMAT_VERSION:
+            raise CodecError(f"Unsupported format version {version}")
+        if message_kind != kind:
+            raise CodecError(f"Expected message kind {kind}, got {message_kind}")
+
+        self.buffer = buffer
+        self.position = _HEADER.size
+        self.shared = shared
+
+        if self.varint() != len(shared) or self.varint() != _key_table(shared)[2]:
+            raise CodecError("Message was encoded with a different key table")
+
+        count = self.varint()
+        self.strings = self.text(count) if count else []
+        # Packed dictionaries index the shared keys and the message's
+        # strings as one table
+        self.table = [*shared, *self.strings]
+
+    def varint(self) -> int:
+        buffer = self.buffer
+        position = self.position
+        if position < len(buffer) and buffer[position] < 0x80:
+            self.position = position + 1
+            return buffer[position]
+
+        result = 0
+        shift = 0
+        try:
+            while True:
+                byte = buffer[position]
+                position += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    self.position = position
+                    return result
+                shift += 7
+        except IndexError:
+            raise CodecError("Message is truncated") from None
+
+    def signed(self) -> int:
+        value = self.varint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def string(self) -> str:
+        start = self.position
+        buffer = self.buffer
+        if start < len(buffer) and buffer[start] < 0x80:
+            size = buffer[start]
+            start += 1
+        else:
+            size = self.varint()
+            start = self.position
+        end = start + size
+        if end > len(buffer):
+            raise CodecError("Message is truncated")
+        try:
+            value = buffer[start:end].decode()
+        except UnicodeDecodeError as e:
+            raise CodecError(f"Invalid string: {e}") from None
+        self.position = end
+        return value
+
+    def interned(self) -> str:
+        buffer = self.buffer
+        position = self.position
+        if position < len(buffer) and buffer[position] < 0x80:
+            reference = buffer[position]
+            self.position = position + 1
+        else:
+            reference = self.varint()
+        try:
+            if reference & 1:
+                return self.shared[reference >> 1]
+            return self.strings[reference >> 1]
+        except IndexError:
+            raise CodecError("Invalid string reference") from None
+
+    def packed(self, count: int) -> array:
+        try:
+            typecode = _TYPECODES[self.buffer[self.position]]
+        except (IndexError, KeyError):
+            raise CodecError("Invalid packed integers") from None
+        start = self.position + 1
+        end = start + count * _ITEMSIZE[typecode]
+        if end > len(self.buffer):
+            raise CodecError("Message is truncated")
+
+        numbers = array(typecode, self.buffer[start:end])
+        if _BIG_ENDIAN:
+            numbers.byteswap()
+        self.position = end
+        return numbers
+
+    def text(self, count: int) -> list[str]:
+        lengths = self.packed(count)
+        text = self.string()
+        if sum(lengths) != len(text):
+            raise CodecError("Invalid string lengths")
+        return [
+            text[start:end] for start, end in pairwise(accumulate(lengths, initial=0))
+        ]
+
+    def value(self, depth: int = 0) -> Any:
+        buffer = self.buffer
+        position = self.position
+        try:
+            tag = buffer[position]
+            # Short strings, the most frequent values, are read inline
+            if tag == _STR and buffer[position + 1] < 0x80:
+                start = position + 2
+                end = start + buffer[position + 1]
+                if end <= len(buffer):
+                    self.position = end
+                    return buffer[start:end].decode()
+        except IndexError:
+            raise CodecError("Message is truncated") from None
+        except UnicodeDecodeError as e:
+            raise CodecError(f"Invalid string: {e}") from None
+        self.position = position + 1
+
+        if tag == _STR:
+            return self.string()
+        if tag == _DICT or tag == _STR_DICT:
+            if depth >= MAX_DEPTH:
+                raise _too_deep()
+            count = self.varint()
+            if tag == _STR_DICT:
+                table = self.table
+                try:
+                    keys = [table[index] for index in self.packed(count)]
+                except IndexError:
+                    raise CodecError("Invalid string reference") from None
+                return dict(zip(keys, self.text(count)))
+
+            interned = self.interned
+            value = self.value
+            depth += 1
+            return {interned(): value(depth) for _ in range(count)}
+        if tag in _SEQUENCES:
+            if depth >= MAX_DEPTH:
+                raise _too_deep()
+            count = self.varint()
+            if tag == _STR_LIST:
+                return self.text(count)
+            if tag == _STR_TUPLE:
+                return tuple(self.text(count))
+
+            value = self.value
+            depth += 1
+            items = [value(depth) for _ in range(count)]
+            return items if tag == _LIST else tuple(items)
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _INT:
+            return self.signed()
+        if tag == _FLOAT_TAG:
+            try:
+                (value,) = _FLOAT.unpack_from(buffer, self.position)
+            except struct.error:
+                raise CodecError("Message is truncated") from None
+            self.position += _FLOAT.size
+            return value
+        raise CodecError(f"Unknown value tag {tag}")
+
+    def done(self) -> None:
+        if self.position != len(self.buffer):
+            raise CodecError("Unexpected data after the message")
+
+
+def decode_workflow(buffer: bytes) -> CompiledWorkflow:
+    """
+    Decode a compiled workflow.
+
+    Args:
+        buffer: A message produced by encode_workflow()
+
+    Returns:
+        The compiled workflow
+
+    Raises:
+        CodecError: If the message is invalid or of another kind or version
+    """
+    reader = _Reader(buffer, KIND_WORKFLOW)
+    name = reader.string()
+    version = reader.string()
+    digest = reader.string()
+    head = reader.varint()
+
+    specs = []
+    for _ in range(reader.varint()):
+        node_type = reader.interned()
+        params = reader.value()
+        next_index = reader.varint()
+        branches = {reader.interned(): reader.varint() for _ in range(reader.varint())}
+        specs.append(
+            NodeSpec(
+                node_type,
+                params,
+                next_index - 1 if next_index else None,
+                branches,
+            )
+        )
+
+    reader.done()
+    return CompiledWorkflow(name, version, digest, tuple(specs), head)
+
+
+def decode_session(buffer: bytes, keys: Sequence[str] = ()) -> SessionSnapshot:
+    """
+    Decode a session snapshot.
+
+    Args:
+        buffer: A message produced by encode_session()
+        keys: The key table given to encode_session()
+
+    Returns:
+        The session snapshot
+
+    Raises:
+        CodecError: If the message is invalid, of another kind or version,
+                    or was encoded with a different key table
+    """
+    reader = _Reader(buffer, KIND_SESSION, tuple(keys))
+    session_id = reader.string()
+    workflow = reader.interned()
+    version = reader.interned()
+    node = reader.value()
+
+    data = _mapping(reader.value())
+
+    calls = []
+    for _ in range(reader.varint()):
+        calls.append(
+            CallSnapshot(
+                reader.interned(),
+                reader.interned(),
+                reader.value(),
+                None if (call_data := reader.value()) is None else _mapping(call_data),
+                reader.value(),
+            )
+        )
+
+    reader.done()
+    return SessionSnapshot(session_id, workflow, version, node, data, tuple(calls))
+
+
+def _mapping(value: Any) -> dict[str, Any]:
+    if not isinstance(value, dict):
+        raise CodecError("Session data must be a dictionary")
+    return value
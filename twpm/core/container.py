@@ -1,12 +1,16 @@
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable
 
+from twpm.core.resource_pool import ResourcePool
+
 
 # TODO: Add life cycle scopes like SCOPED for request-based lifetimes.
 class ServiceScope(Enum):
     SINGLETON = "singleton"
     TRANSIENT = "transient"
+    POOLED = "pooled"
     # SCOPED = "scoped"
 
 
@@ -18,14 +22,43 @@ class Provider:
     scope: ServiceScope
     default_factory: Factory
     instance: Any = None
+    pool: ResourcePool | None = None
 
 
 class Container:
     def __init__(self) -> None:
         self.providers: dict[Any, Provider] = {}
 
-    def register(self, key: Any, default_factory: Factory, scope: ServiceScope) -> None:
-        self.providers[key] = Provider(scope=scope, default_factory=default_factory)
+    def register(
+        self,
+        key: Any,
+        default_factory: Factory,
+        scope: ServiceScope,
+        **pool_options: Any,
+    ) -> None:
+        """
+        Register a service.
+
+        Args:
+            key: Key used to resolve the service, usually its type
+            default_factory: Creates the service; may be async for POOLED services
+            scope: Lifetime of the service
+            **pool_options: Options forwarded to ResourcePool for POOLED
+                            services (max_size, health_check, idle_timeout, close)
+        """
+        pool = None
+        if scope == ServiceScope.POOLED:
+            pool = ResourcePool(default_factory, **pool_options)
+        elif pool_options:
+            raise ValueError("Pool options are only valid for POOLED services")
+
+        self.providers[key] = Provider(
+            scope=scope, default_factory=default_factory, pool=pool
+        )
+
+    def is_pooled(self, key: Any) -> bool:
+        p = self.providers.get(key)
+        return p is not None and p.scope == ServiceScope.POOLED
 
     def resolve(self, key: Any) -> Any:
         p = self.providers[key]
@@ -35,4 +68,35 @@ class Container:
                 p.instance = p.default_factory()
             return p.instance
 
+        if p.scope == ServiceScope.POOLED:
+            raise ValueError(
+                f"Pooled service {key!r} must be acquired with Container.acquire()"
+            )
+
         return p.default_factory()
+
+    def acquire(self, key: Any) -> AbstractAsyncContextManager[Any]:
+        """
+        Lease an instance of a POOLED service.
+
+        Example:
+            ```python
+            async with container.acquire(Database) as db:
+                await db.fetch(...)
+            ```
+        """
+        p = self.providers[key]
+        if p.pool is None:
+            raise ValueError(f"Service {key!r} is not pooled")
+        return p.pool.lease()
+
+    async def shutdown(self, timeout: float | None = None) -> None:
+        """
+        Gracefully close every pooled service.
+
+        Args:
+            timeout: Seconds to wait for each pool's leased instances
+        """
+        for p in self.providers.values():
+            if p.pool is not None:
+                await p.pool.close(timeout)
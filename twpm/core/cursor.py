@@ -1,8 +1,154 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 
 from twpm.core.base import Node
 
 
+def _splice(target: Node, head: Node, tail: Node) -> None:
+    """Link the run of nodes head..tail right after target."""
+    target_next = target.next
+
+    target.next = head
+    head.previous = target
+    tail.next = target_next
+    if target_next is not None:
+        target_next.previous = tail
+
+
+class Segment:
+    """
+    A run of linked nodes that knows its head, tail and length.
+
+    Appending, extending and splicing only touch the nodes at the seams, so
+    each is O(1) whatever the size of the segments involved, and both
+    `next` and `previous` stay consistent. Build long workflows with a
+    Segment instead of relinking or walking chains to find their ends.
+
+    Example:
+        ```python
+        segment = Segment(welcome, name, email)
+        segment.append(summary)
+        segment.insert_after(name, Segment(phone, address))
+        head = segment.head  # welcome -> name -> phone -> address -> email -> summary
+        ```
+    """
+
+    __slots__ = ("head", "tail", "length")
+
+    def __init__(self, *nodes: Node):
+        """
+        Link nodes in order into a new segment.
+
+        Args:
+            *nodes: Unlinked nodes, in order; their `next` links are replaced
+        """
+        self.head: Node | None = None
+        self.tail: Node | None = None
+        self.length = 0
+
+        for node in nodes:
+            node.next = None
+            self.append(node)
+
+    @classmethod
+    def from_head(cls, head: Node) -> "Segment":
+        """
+        Wrap an already linked chain, walking it once to find its tail.
+
+        Args:
+            head: First node of the chain
+
+        Returns:
+            A Segment spanning head to the end of its `next` links
+        """
+        segment = cls()
+        segment.head = segment.tail = head
+        segment.length = 1
+
+        while segment.tail.next is not None:
+            segment.tail.next.previous = segment.tail
+            segment.tail = segment.tail.next
+            segment.length += 1
+
+        return segment
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[Node]:
+        current = self.head
+        for _ in range(self.length):
+            assert current is not None, "Segment is shorter than its length"
+            yield current
+            current = current.next
+
+    def append(self, item: "Node | Segment") -> "Segment":
+        """
+        Add a single node or a whole segment at the end, in O(1).
+
+        Args:
+            item: A node with no `next` link, or a segment whose nodes are
+                  moved into this one
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If a node still links to a following node; wrap
+                        linked chains with Segment.from_head()
+        """
+        head, tail, length = self._ends(item)
+        if head is None or tail is None:
+            return self
+
+        if self.tail is None:
+            head.previous = None
+            self.head = head
+        else:
+            _splice(self.tail, head, tail)
+        self.tail = tail
+        self.length += length
+        return self
+
+    def insert_after(self, target: Node, item: "Node | Segment") -> "Segment":
+        """
+        Splice a single node or a whole segment right after target, in O(1).
+
+        Args:
+            target: A node of this segment
+            item: A node with no `next` link, or a segment whose nodes are
+                  moved into this one
+
+        Returns:
+            Self for method chaining
+        """
+        if target is self.tail:
+            return self.append(item)
+
+        head, tail, length = self._ends(item)
+        if head is None or tail is None:
+            return self
+
+        _splice(target, head, tail)
+        self.length += length
+        return self
+
+    @staticmethod
+    def _ends(item: "Node | Segment") -> tuple[Node | None, Node | None, int]:
+        if isinstance(item, Segment):
+            head, tail, length = item.head, item.tail, item.length
+            # The nodes now belong to the receiving segment
+            item.head = item.tail = None
+            item.length = 0
+            return head, tail, length
+
+        if item.next is not None:
+            raise ValueError(
+                f"Node '{item.key}' is linked to '{item.next.key}'; "
+                "use Segment.from_head() to add a linked chain"
+            )
+        return item, item, 1
+
+
 class Cursor:
     @staticmethod
     def get_end(node: Node) -> Node:
@@ -22,20 +168,58 @@ class Cursor:
         return current
 
     @staticmethod
-    def insert(target: Node, new_node: Node) -> None:
+    def insert(
+        target: Node, new_node: "Node | Segment", end: Node | None = None
+    ) -> None:
         """
-        The new node is a part of linked list, this method should interate in the new_node and get
-        the end, and connect with the target
+        Splice a chain of nodes right after target, keeping `next` and
+        `previous` links consistent.
+
         target             target_next
             []<->       <->[]
                  []<->[]
            new_node   new_node_end
+
+        Args:
+            target: Node to insert after
+            new_node: Head of a linked chain, or a Segment, spliced in O(1)
+            end: Last node of the chain when the caller knows it, so the
+                 chain is spliced in O(1); its inner `previous` links must
+                 already be set. If omitted, the end is found by walking
+                 the chain.
         """
-        new_node_end = Cursor.get_end(new_node)
-        target_next = target.next
+        if isinstance(new_node, Segment):
+            head, tail = new_node.head, new_node.tail
+        elif end is not None or new_node.next is None:
+            head, tail = new_node, end or new_node
+        else:
+            segment = Segment.from_head(new_node)
+            head, tail = segment.head, segment.tail
 
-        target.next = new_node
-        new_node_end.next = target_next
+        if head is not None and tail is not None:
+            _splice(target, head, tail)
+
+    @staticmethod
+    def link_branches(router: Node) -> None:
+        """
+        Link the end of every branch of a router to the router's next node.
+
+        Equivalent to Cursor.insert for each branch, done once up front:
+        afterwards the router only has to point `next` at the chosen branch,
+        so it can run again (e.g. inside a loop) without splicing a branch
+        in front of one inserted earlier.
+
+        Args:
+            router: Node whose branches() rejoin the chain after it
+        """
+        continuation = router.next
+        linked: set[int] = set()
+
+        for branch in router.branches():
+            if id(branch) in linked:
+                continue
+            linked.add(id(branch))
+            Cursor.get_end(branch).next = continuation
 
     @staticmethod
     def get_range(begin: Node, end: Node) -> list[Node]:
@@ -80,9 +264,21 @@ class Cursor:
         Example:
             questions = Cursor.find_by_type(start, end, QuestionNode)
             # Returns all QuestionNode instances in the range
+
+        For repeated queries on a built chain, use
+        CompiledChain.find_by_type (see twpm.core.chain), a dictionary lookup.
         """
-        nodes = Cursor.get_range(begin, end)
-        return [node for node in nodes if isinstance(node, node_type)]
+        nodes = []
+        current: Node | None = begin
+
+        while current is not None:
+            if isinstance(current, node_type):
+                nodes.append(current)
+            if current is end:
+                break
+            current = current.next
+
+        return nodes
 
     @staticmethod
     def add_after_each(
@@ -139,3 +335,50 @@ class Cursor:
             # Stop if we reached the original end node
             if is_end:
                 break
+
+    @staticmethod
+    def walk(head: Node) -> Iterator[Node]:
+        """
+        Yield every node reachable from head exactly once.
+
+        Follows `next` links and the branches declared by routing nodes
+        (see Node.branches), in depth-first order starting with the main path.
+
+        Args:
+            head: The node to start walking from
+
+        Example:
+            keys = [node.key for node in Cursor.walk(head)]
+        """
+        seen: set[int] = set()
+        stack = [head]
+
+        while stack:
+            current = stack.pop()
+
+            while current is not None and id(current) not in seen:
+                seen.add(id(current))
+                yield current
+                stack.extend(reversed(current.branches()))
+                current = current.next
+
+    @staticmethod
+    def bind(head: Node) -> dict[str, Node]:
+        """
+        Index every node reachable from head by key and let nodes resolve
+        their references to other nodes (see Node.bind).
+
+        Args:
+            head: The head node of a built chain
+
+        Returns:
+            The index of nodes by key; the first node wins for duplicate keys
+        """
+        nodes: dict[str, Node] = {}
+        for node in Cursor.walk(head):
+            nodes.setdefault(node.key, node)
+
+        for node in Cursor.walk(head):
+            node.bind(nodes)
+
+        return nodes
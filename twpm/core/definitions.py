@@ -0,0 +1,745 @@
+"""
+Declarative workflow definitions.
+
+Workflows can be described as JSON documents instead of Python modules:
+
+```json
+{
+  "name": "onboarding",
+  "version": "1",
+  "nodes": [
+    {"type": "message", "key": "welcome", "message": "Welcome!"},
+    {"type": "question", "key": "user_name", "question": "Your name"},
+    {"type": "pool", "key": "plan", "question": "Plan",
+     "options": ["Free", {"text": "Premium", "value": "premium"}]},
+    {"type": "conditional", "key": "is_premium", "condition": "plan == 'premium'",
+     "true": [{"type": "message", "key": "thanks",
+               "message": {"template": "Thanks, {user_name}!"}}],
+     "false": [{"type": "task", "key": "offer", "function": "send_offer"}]}
+  ],
+  "progress": {"fields": [["Name", "user_name"]], "after_each": ["question"]}
+}
+```
+
+A definition is compiled once into a CompiledWorkflow: a flat, validated
+table of node specs with progress nodes already injected. Building a
+chain from it only instantiates and links nodes. Python callables (tasks,
+dynamic options, message functions) are referenced by name and supplied
+at build time through a `functions` mapping. Messages, questions and
+titles are shown as written unless given as `{"template": text}`, which
+renders placeholders (see twpm.core.template).
+
+Compiled workflows can be cached on disk, keyed by the content hash of
+the definition file, so restarts skip parsing and validation.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import zlib
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from twpm.core.analysis import validate
+from twpm.core.base import Node
+from twpm.core.cursor import Cursor
+from twpm.core.expressions import ExpressionError, compile_expression
+from twpm.core.layout import DataLayout
+from twpm.core.primitives import (
+    ConditionalNode,
+    DisplayMessageNode,
+    GotoNode,
+    LoopNode,
+    PagedPoolNode,
+    PoolNode,
+    PoolOption,
+    ProgressNode,
+    QuestionNode,
+    QuizNode,
+    QuizSummaryNode,
+    SummaryNode,
+    SwitchNode,
+    TaskNode,
+)
+from twpm.core.template import Template, TemplateError
+
+# Bump when the compiled representation changes to invalidate disk caches
+COMPILED_FORMAT = 2
+
+_CACHE_SUFFIX = ".twpmc"
+
+# Cache entries start with the CRC-32 of the encoded workflow
+_CHECKSUM = struct.Struct("<I")
+
+Functions = dict[str, Callable]
+
+
+class DefinitionError(ValueError):
+    """Raised when a workflow definition is invalid."""
+
+
+class NodeSpec(NamedTuple):
+    """
+    Compiled description of a single node.
+
+    Attributes:
+        type: Node type name, e.g. "question"
+        params: Constructor parameters, JSON values only
+        next: Index of the next node in the compiled table, or None
+        branches: Branch name to branch head index, for routing nodes
+    """
+
+    type: str
+    params: dict[str, Any]
+    next: int | None
+    branches: dict[str, int]
+
+
+# -- node builders --
+
+
+def _function(functions: Functions, name: str, key: str) -> Callable:
+    try:
+        return functions[name]
+    except KeyError:
+        raise DefinitionError(
+            f"Node '{key}' references unknown function '{name}'"
+        ) from None
+
+
+def _text(value: Any) -> Any:
+    """Plain text is shown as written, {"template": ...} is rendered."""
+    if isinstance(value, dict):
+        return Template(value["template"])
+    return value
+
+
+def _build_message(params: dict, functions: Functions) -> Node:
+    if "message_function" in params:
+        return DisplayMessageNode(
+            key=params["key"],
+            message_func=_function(
+                functions, params["message_function"], params["key"]
+            ),
+        )
+    return DisplayMessageNode(key=params["key"], message=_text(params["message"]))
+
+
+def _build_question(params: dict, functions: Functions) -> Node:
+    return QuestionNode(question=_text(params["question"]), key=params["key"])
+
+
+def _build_pool(params: dict, functions: Functions) -> Node:
+    options = params["options"]
+    if isinstance(options, str):
+        options = _function(functions, options, params["key"])
+    else:
+        options = [PoolOption(text, value) for text, value in options]
+    return PoolNode(
+        question=_text(params["question"]), options=options, key=params["key"]
+    )
+
+
+def _build_paged_pool(params: dict, functions: Functions) -> Node:
+    return PagedPoolNode(
+        question=_text(params["question"]),
+        key=params["key"],
+        fetch_page=_function(functions, params["fetch_page"], params["key"]),
+        page_size=params.get("page_size", 10),
+    )
+
+
+def _build_quiz(params: dict, functions: Functions) -> Node:
+    return QuizNode(
+        question=_text(params["question"]),
+        options=list(params["options"]),
+        expected_answer=params["expected_answer"],
+        key=params["key"],
+    )
+
+
+def _build_quiz_summary(params: dict, functions: Functions) -> Node:
+    return QuizSummaryNode(
+        title=_text(params["title"]),
+        quiz_keys=list(params["quiz_keys"]),
+        key=params["key"],
+    )
+
+
+def _build_progress(params: dict, functions: Functions) -> Node:
+    return ProgressNode(
+        fields=list(params["fields"]),
+        title=_text(params.get("title")),
+        key=params["key"],
+    )
+
+
+def _build_summary(params: dict, functions: Functions) -> Node:
+    return SummaryNode(
+        title=_text(params["title"]), fields=list(params["fields"]), key=params["key"]
+    )
+
+
+def _build_task(params: dict, functions: Functions) -> Node:
+    return TaskNode(
+        task=_function(functions, params["function"], params["key"]),
+        key=params["key"],
+    )
+
+
+def _build_conditional(params: dict, functions: Functions) -> Node:
+    return ConditionalNode(key=params["key"])
+
+
+def _build_switch(params: dict, functions: Functions) -> Node:
+    return SwitchNode(key=params["key"])
+
+
+def _build_goto(params: dict, functions: Functions) -> Node:
+    return GotoNode(
+        target=params["target"],
+        condition=params.get("condition"),
+        max_iterations=params.get("max_iterations", 10),
+        key=params["key"],
+    )
+
+
+def _build_loop(params: dict, functions: Functions) -> Node:
+    return LoopNode(
+        target=params["target"],
+        until=params["until"],
+        max_iterations=params.get("max_iterations", 10),
+        key=params["key"],
+    )
+
+
+def _build_subworkflow(params: dict, functions: Functions) -> Node:
+    # Imported here: subworkflows depend on the registry, which loads definitions
+    from twpm.core.primitives.subworkflow import SubworkflowNode
+
+    return SubworkflowNode(
+        workflow=params["workflow"],
+        scope=params.get("scope", "isolated"),
+        inputs=params.get("inputs", ()),
+        outputs=params.get("outputs"),
+        key=params["key"],
+    )
+
+
+_BUILDERS: dict[str, Callable[[dict, Functions], Node]] = {
+    "message": _build_message,
+    "question": _build_question,
+    "pool": _build_pool,
+    "paged_pool": _build_paged_pool,
+    "quiz": _build_quiz,
+    "quiz_summary": _build_quiz_summary,
+    "progress": _build_progress,
+    "summary": _build_summary,
+    "task": _build_task,
+    "conditional": _build_conditional,
+    "switch": _build_switch,
+    "goto": _build_goto,
+    "loop": _build_loop,
+    "subworkflow": _build_subworkflow,
+}
+
+# Required parameters of each node type, besides "type" and "key"
+_REQUIRED: dict[str, tuple[str, ...]] = {
+    "message": (),
+    "question": ("question",),
+    "pool": ("question", "options"),
+    "paged_pool": ("question", "fetch_page"),
+    "quiz": ("question", "options", "expected_answer"),
+    "quiz_summary": ("title", "quiz_keys"),
+    "progress": ("fields",),
+    "summary": ("title", "fields"),
+    "task": ("function",),
+    "conditional": ("condition", "true", "false"),
+    "switch": ("switch", "cases", "default"),
+    "goto": ("target",),
+    "loop": ("target", "until"),
+    "subworkflow": ("workflow",),
+}
+
+# Parameters holding text shown to the user, plain or {"template": text}
+_TEXT_PARAMS = ("message", "question", "title")
+
+# Node types without an obvious key get one derived from their type
+_DEFAULT_KEYS = {
+    "quiz_summary": "quiz_summary",
+    "progress": "progress",
+    "summary": "summary",
+    "conditional": "conditional",
+    "switch": "switch",
+    "goto": "goto",
+    "loop": "loop",
+    "subworkflow": "subworkflow",
+}
+
+
+class CompiledWorkflow:
+    """
+    A validated workflow definition flattened into a table of node specs.
+
+    Compiled workflows only hold plain data, so they can be encoded (see
+    twpm.core.codec) and cached. Every call to build() creates a fresh, linked set of nodes.
+
+    Attributes:
+        name: Workflow name from the definition
+        version: Workflow version from the definition
+        digest: Content hash of the source definition
+        specs: Flat table of compiled node specs
+        head: Index of the head node in specs
+    """
+
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        digest: str,
+        specs: tuple[NodeSpec, ...],
+        head: int,
+    ):
+        self.name = name
+        self.version = version
+        self.digest = digest
+        self.specs = specs
+        self.head = head
+        self._layout: DataLayout | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_layout"] = None
+        return state
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def build(self, functions: Functions | None = None) -> Node:
+        """
+        Instantiate and link the nodes of this workflow.
+
+        Args:
+            functions: Mapping of the function names used by the definition
+                       to their Python callables
+
+        Returns:
+            The head node of a freshly built chain
+
+        Raises:
+            DefinitionError: If a referenced function is not provided
+            WorkflowValidationError: If the workflow fails validation
+        """
+        if functions is None:
+            functions = {}
+        nodes = [_BUILDERS[spec.type](spec.params, functions) for spec in self.specs]
+
+        for node, spec in zip(nodes, self.specs):
+            if spec.next is not None:
+                next_node = nodes[spec.next]
+                node.next = next_node
+                next_node.previous = node
+
+            if spec.type == "conditional":
+                node.set_condition(
+                    spec.params["condition"],
+                    nodes[spec.branches["true"]],
+                    nodes[spec.branches["false"]],
+                )
+            elif spec.type == "switch":
+                node.set_switch(
+                    spec.params["switch"],
+                    {
+                        case: nodes[index]
+                        for case, index in spec.branches.items()
+                        if case != "default"
+                    },
+                    nodes[spec.branches["default"]],
+                )
+
+        head = nodes[self.head]
+        Cursor.bind(head)
+
+        if self._layout is None:
+            # The first build validates the graph, later builds produce the
+            # same graph and are marked as verified directly
+            validate(head)
+            self._layout = DataLayout.from_chain(head)
+        else:
+            for node in nodes:
+                node.verified = True
+        return head
+
+    @property
+    def layout(self) -> DataLayout:
+        """Data layout of the workflow, compiled on first use."""
+        if self._layout is None:
+            self.build(_PlaceholderFunctions())
+        assert self._layout is not None
+        return self._layout
+
+
+class _PlaceholderFunctions(dict):
+    """Functions mapping that resolves every name to a placeholder."""
+
+    def __missing__(self, name: str) -> Callable:
+        return _placeholder
+
+
+async def _placeholder(*args: Any) -> Any:
+    raise DefinitionError("Placeholder function called")
+
+
+# -- compilation --
+
+
+class _Compiler:
+    def __init__(self) -> None:
+        self.specs: list[NodeSpec | None] = []
+
+    def sequence(self, nodes: Any, path: str) -> int:
+        """Compile a list of node definitions, returning the head index."""
+        if not isinstance(nodes, list) or not nodes:
+            raise DefinitionError(f"{path}: expected a non-empty list of nodes")
+
+        indexes = [self.node(node, f"{path}[{i}]") for i, node in enumerate(nodes)]
+        for current, following in zip(indexes, indexes[1:]):
+            self.specs[current] = self.specs[current]._replace(next=following)
+        return indexes[0]
+
+    def node(self, node: Any, path: str) -> int:
+        if not isinstance(node, dict):
+            raise DefinitionError(f"{path}: expected an object")
+
+        node_type = node.get("type")
+        if node_type not in _BUILDERS:
+            raise DefinitionError(f"{path}: unknown node type {node_type!r}")
+
+        key = node.get("key", _DEFAULT_KEYS.get(node_type))
+        if not isinstance(key, str) or not key:
+            raise DefinitionError(f"{path}: missing 'key'")
+
+        for name in _REQUIRED[node_type]:
+            if name not in node:
+                raise DefinitionError(f"{path}: '{node_type}' requires '{name}'")
+
+        params = {name: value for name, value in node.items() if name != "type"}
+        params["key"] = key
+
+        for name in _TEXT_PARAMS:
+            if params.get(name) is not None:
+                _check_text(params[name], f"{path}.{name}")
+
+        index = len(self.specs)
+        self.specs.append(None)
+        branches = self._params(node_type, params, path)
+        self.specs[index] = NodeSpec(node_type, params, None, branches)
+        return index
+
+    def _params(self, node_type: str, params: dict, path: str) -> dict[str, int]:
+        """Normalize type-specific parameters and compile branches."""
+        branches: dict[str, int] = {}
+
+        if node_type == "message":
+            if "message" not in params and "message_function" not in params:
+                raise DefinitionError(
+                    f"{path}: 'message' requires 'message' or 'message_function'"
+                )
+        elif node_type == "pool":
+            options = params["options"]
+            if isinstance(options, dict) and "function" in options:
+                params["options"] = options["function"]
+            elif isinstance(options, list):
+                params["options"] = tuple(
+                    _pool_option(option, f"{path}.options") for option in options
+                )
+            else:
+                raise DefinitionError(
+                    f"{path}: 'options' must be a list or {{'function': name}}"
+                )
+        elif node_type in ("progress", "summary"):
+            params["fields"] = _fields(params["fields"], f"{path}.fields")
+        elif node_type == "conditional":
+            _check_expression(params["condition"], path)
+            branches["true"] = self.sequence(params.pop("true"), f"{path}.true")
+            branches["false"] = self.sequence(params.pop("false"), f"{path}.false")
+        elif node_type == "switch":
+            _check_expression(params["switch"], path)
+            cases = params.pop("cases")
+            if not isinstance(cases, dict):
+                raise DefinitionError(f"{path}.cases: expected an object")
+            for case, nodes in cases.items():
+                if case == "default":
+                    raise DefinitionError(f"{path}.cases: 'default' is reserved")
+                branches[case] = self.sequence(nodes, f"{path}.cases.{case}")
+            branches["default"] = self.sequence(
+                params.pop("default"), f"{path}.default"
+            )
+        elif node_type in ("goto", "loop"):
+            if "condition" in params:
+                _check_expression(params["condition"], path)
+            if "until" in params:
+                _check_expression(params["until"], path)
+            max_iterations = params.get("max_iterations", 10)
+            if not isinstance(max_iterations, int) or max_iterations < 1:
+                raise DefinitionError(
+                    f"{path}: 'max_iterations' must be a positive integer"
+                )
+        elif node_type == "subworkflow":
+            if params.get("scope", "isolated") not in ("isolated", "shared"):
+                raise DefinitionError(f"{path}: 'scope' must be 'isolated' or 'shared'")
+            for name in ("inputs", "outputs"):
+                if name in params:
+                    params[name] = tuple(params[name])
+
+        return branches
+
+
+def _pool_option(option: Any, path: str) -> tuple[str, str]:
+    if isinstance(option, str):
+        return (option, option)
+    if isinstance(option, dict) and "text" in option:
+        return (option["text"], option.get("value", option["text"]))
+    raise DefinitionError(f"{path}: options must be strings or {{'text', 'value'}}")
+
+
+def _fields(fields: Any, path: str) -> tuple[tuple[str, str], ...]:
+    if not isinstance(fields, list) or not all(
+        isinstance(field, list) and len(field) == 2 for field in fields
+    ):
+        raise DefinitionError(f"{path}: expected a list of [label, key] pairs")
+    return tuple((label, key) for label, key in fields)
+
+
+def _check_text(value: Any, path: str) -> None:
+    if isinstance(value, str):
+        return
+    if not isinstance(value, dict) or not isinstance(value.get("template"), str):
+        raise DefinitionError(f"{path}: expected a string or {{'template': text}}")
+    try:
+        Template(value["template"])
+    except TemplateError as e:
+        raise DefinitionError(f"{path}: {e}") from e
+
+
+def _check_expression(source: Any, path: str) -> None:
+    if not isinstance(source, str):
+        raise DefinitionError(f"{path}: expressions must be strings")
+    try:
+        compile_expression(source)
+    except ExpressionError as e:
+        raise DefinitionError(f"{path}: {e}") from e
+
+
+def _inject_progress(definition: dict) -> list:
+    """Return the main node list with progress nodes injected."""
+    nodes = definition.get("nodes")
+    progress = definition.get("progress")
+    if not progress or not isinstance(nodes, list):
+        return nodes
+
+    after_each = progress.get("after_each")
+    if isinstance(after_each, str):
+        after_each = [after_each]
+
+    result = []
+    counter = 0
+    for node in nodes:
+        result.append(node)
+        if after_each is None or (
+            isinstance(node, dict) and node.get("type") in after_each
+        ):
+            counter += 1
+            result.append(
+                {
+                    "type": "progress",
+                    "key": f"progress_{counter}",
+                    "fields": progress["fields"],
+                    "title": progress.get("title"),
+                }
+            )
+    return result
+
+
+def compile_definition(definition: dict, digest: str | None = None) -> CompiledWorkflow:
+    """
+    Validate a workflow definition and compile it.
+
+    Args:
+        definition: The parsed JSON definition
+        digest: Content hash of the source, computed from the definition if omitted
+
+    Returns:
+        The CompiledWorkflow
+
+    Raises:
+        DefinitionError: If the definition is invalid
+    """
+    if not isinstance(definition, dict):
+        raise DefinitionError("Workflow definition must be a JSON object")
+
+    if digest is None:
+        digest = _digest(json.dumps(definition, sort_keys=True).encode())
+
+    compiler = _Compiler()
+    head = compiler.sequence(_inject_progress(definition), "nodes")
+
+    return CompiledWorkflow(
+        name=str(definition.get("name", "workflow")),
+        version=str(definition.get("version", digest[:12])),
+        digest=digest,
+        specs=tuple(compiler.specs),
+        head=head,
+    )
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def loads_definition(
+    content: str | bytes, cache_dir: str | Path | None = None
+) -> CompiledWorkflow:
+    """
+    Compile a JSON workflow definition, using the on-disk cache if given.
+
+    Args:
+        content: The JSON document
+        cache_dir: Optional directory for compiled workflows, keyed by the
+                   content hash of the document
+
+    Returns:
+        The CompiledWorkflow
+
+    Raises:
+        DefinitionError: If the definition is invalid
+    """
+    if isinstance(content, str):
+        content = content.encode()
+
+    digest = _digest(content)
+    cache_file = None
+
+    if cache_dir is not None:
+        cache_file = Path(cache_dir) / f"{digest}-{COMPILED_FORMAT}{_CACHE_SUFFIX}"
+        compiled = _read_cache(cache_file)
+        if compiled is not None:
+            return compiled
+
+    try:
+        definition = json.loads(content)
+    except json.JSONDecodeError as e:
+        raise DefinitionError(f"Invalid JSON: {e}") from e
+
+    compiled = compile_definition(definition, digest=digest)
+
+    if cache_file is not None:
+        _write_cache(cache_file, compiled)
+
+    return compiled
+
+
+def load_definition(
+    path: str | Path, cache_dir: str | Path | None = None
+) -> CompiledWorkflow:
+    """
+    Load and compile a JSON workflow definition file.
+
+    Args:
+        path: Path of the JSON file
+        cache_dir: Optional directory for compiled workflows
+
+    Returns:
+        The CompiledWorkflow
+
+    Example:
+        ```python
+        compiled = load_definition("workflows/onboarding.json", cache_dir=".twpm")
+        head = compiled.build(functions={"send_offer": send_offer})
+        orchestrator.start(session_id, head, data=compiled.layout.new_data())
+        ```
+    """
+    return loads_definition(Path(path).read_bytes(), cache_dir=cache_dir)
+
+
+def load_workflow(
+    path: str | Path,
+    functions: Functions | None = None,
+    cache_dir: str | Path | None = None,
+) -> Node:
+    """
+    Load a JSON workflow definition file and build it.
+
+    Args:
+        path: Path of the JSON file
+        functions: Mapping of function names used by the definition
+        cache_dir: Optional directory for compiled workflows
+
+    Returns:
+        The head node of the built chain
+    """
+    return load_definition(path, cache_dir=cache_dir).build(functions)
+
+
+def _read_cache(cache_file: Path) -> CompiledWorkflow | None:
+    # Imported here: the codec depends on this module
+    from twpm.core.codec import decode_workflow
+
+    try:
+        entry = cache_file.read_bytes()
+        (checksum,) = _CHECKSUM.unpack_from(entry)
+        blob = entry[_CHECKSUM.size :]
+        if checksum != zlib.crc32(blob):
+            return None
+        compiled = decode_workflow(blob)
+    except (
+        OSError,
+        ValueError,
+        OverflowError,
+        RecursionError,
+        MemoryError,
+        struct.error,
+    ):
+        # Unreadable or corrupted entries are recompiled and overwritten
+        return None
+
+    return compiled if _is_consistent(compiled, cache_file) else None
+
+
+def _is_consistent(compiled: CompiledWorkflow, cache_file: Path) -> bool:
+    """Check that a decoded cache entry can be built, rejecting damaged ones."""
+    if not cache_file.name.startswith(f"{compiled.digest}-"):
+        return False
+
+    size = len(compiled.specs)
+    if not 0 <= compiled.head < size:
+        return False
+    for spec in compiled.specs:
+        if spec.type not in _BUILDERS or not isinstance(spec.params, dict):
+            return False
+        if spec.next is not None and not 0 <= spec.next < size:
+            return False
+        if not all(0 <= index < size for index in spec.branches.values()):
+            return False
+    return True
+
+
+def _write_cache(cache_file: Path, compiled: CompiledWorkflow) -> None:
+    from twpm.core.codec import encode_workflow
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first so concurrent workers never read a
+    # partially written cache entry
+    fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            blob = encode_workflow(compiled)
+            f.write(_CHECKSUM.pack(zlib.crc32(blob)))
+            f.write(blob)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        Path(tmp_path).unlink(missing_ok=True)
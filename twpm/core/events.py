@@ -0,0 +1,46 @@
+"""
+Events emitted by the Orchestrator while it runs a workflow.
+
+Listeners are plain callables registered with Orchestrator.add_listener().
+They are called synchronously from the processing loop, so they must be
+cheap and must not block: aggregate in memory and defer any I/O.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+
+from twpm.core.base import ListData, Node
+
+
+class WorkflowEventType(Enum):
+    STARTED = "started"
+    NODE_ENTERED = "node_entered"
+    NODE_COMPLETED = "node_completed"
+    NODE_FAILED = "node_failed"
+    AWAITING_INPUT = "awaiting_input"
+    FINISHED = "finished"
+    ERROR = "error"
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowEvent:
+    """
+    Something that happened while processing a session.
+
+    Attributes:
+        type: What happened
+        session_id: The session being processed
+        node: The node concerned; for FINISHED, None when every node
+              completed and the failed node otherwise
+        data: The workflow data at the time of the event. Listeners must
+              read what they need right away, the data keeps changing.
+    """
+
+    type: WorkflowEventType
+    session_id: str | None
+    node: Node | None
+    data: ListData
+
+
+EventListener = Callable[[WorkflowEvent], None]
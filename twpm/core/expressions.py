@@ -0,0 +1,247 @@
+"""
+Serializable condition expressions.
+
+Expressions are small Python-like formulas over ListData fields, such as
+`int(quiz_summary_score) == int(quiz_summary_total)` or
+`company_type in ["Petshop", "Outro"]`. They are parsed and validated
+once, then compiled into a plain Python function, so they can be used
+anywhere a ConditionalFunc or SwitchFunc is accepted while still being
+stored as text in configuration files.
+
+Supported syntax:
+    - Field references: bare names (`user_name`) or `field("some-key")`
+    - Literals: strings, numbers, True, False, None, lists, tuples, sets
+    - Boolean logic: and, or, not
+    - Comparisons: ==, !=, <, <=, >, >=, in, not in (chained too)
+    - Arithmetic: +, -, *, /, //, %, unary - and +
+    - Conditional expressions: `a if condition else b`
+    - Function calls: int, float, str, bool, len, abs, min, max, round,
+      lower, upper, strip
+
+Missing fields evaluate to None.
+"""
+
+import ast
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+from twpm.core.base import ListData, NodeKey
+
+_FIELD_FUNC = "field"
+
+
+def _lower(value: Any) -> str:
+    return str(value).lower() if value is not None else ""
+
+
+def _upper(value: Any) -> str:
+    return str(value).upper() if value is not None else ""
+
+
+def _strip(value: Any) -> str:
+    return str(value).strip() if value is not None else ""
+
+
+_FUNCTIONS: dict[str, Callable] = {
+    "int": int,
+    "float": float,
+    "str": str,
+    "bool": bool,
+    "len": len,
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "round": round,
+    "lower": _lower,
+    "upper": _upper,
+    "strip": _strip,
+}
+
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.USub,
+    ast.UAdd,
+    ast.BinOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.In,
+    ast.NotIn,
+    ast.IfExp,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+    ast.List,
+    ast.Tuple,
+    ast.Set,
+)
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression is invalid or uses unsupported syntax."""
+
+
+class _FieldRewriter(ast.NodeTransformer):
+    """Replace field references with `data.get(<key>)` calls."""
+
+    def __init__(self) -> None:
+        self.names: list[NodeKey] = []
+
+    def _lookup(self, key: NodeKey, node: ast.AST) -> ast.AST:
+        self.names.append(key)
+        call = ast.Call(
+            func=ast.Attribute(
+                value=ast.Name(id="data", ctx=ast.Load()), attr="get", ctx=ast.Load()
+            ),
+            args=[ast.Constant(value=key)],
+            keywords=[],
+        )
+        return ast.copy_location(call, node)
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return self._lookup(node.id, node)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if node.func.id == _FIELD_FUNC:
+            return self._lookup(node.args[0].value, node)
+
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+
+def _validate(tree: ast.AST, source: str) -> None:
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ExpressionError(
+                f"Unsupported syntax '{type(node).__name__}' in expression: {source}"
+            )
+
+        if isinstance(node, ast.Name) and node.id.startswith("__"):
+            raise ExpressionError(f"Invalid field name '{node.id}' in: {source}")
+
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.keywords:
+                raise ExpressionError(f"Unsupported function call in: {source}")
+
+            name = node.func.id
+            if name == _FIELD_FUNC:
+                if len(node.args) != 1 or not (
+                    isinstance(node.args[0], ast.Constant)
+                    and isinstance(node.args[0].value, str)
+                ):
+                    raise ExpressionError(
+                        f"field() takes a single string literal in: {source}"
+                    )
+            elif name not in _FUNCTIONS:
+                raise ExpressionError(f"Unknown function '{name}' in: {source}")
+
+
+class Expression:
+    """
+    A compiled expression evaluated against ListData.
+
+    Instances are callables taking a ListData, so they can be passed to
+    ConditionalNode.set_condition and SwitchNode.set_switch directly. They
+    pickle and compare by their source text.
+
+    Attributes:
+        source: The expression text
+        names: Field keys referenced by the expression
+
+    Example:
+        ```python
+        all_correct = Expression("quiz_summary_score == quiz_summary_total")
+        condition_node.set_condition(all_correct, success_node, retry_node)
+        ```
+    """
+
+    __slots__ = ("source", "names", "_func")
+
+    def __init__(self, source: str):
+        """
+        Parse, validate and compile an expression.
+
+        Args:
+            source: The expression text
+
+        Raises:
+            ExpressionError: If the text is not a valid expression
+        """
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as e:
+            raise ExpressionError(f"Invalid expression '{source}': {e.msg}") from e
+
+        _validate(tree, source)
+
+        rewriter = _FieldRewriter()
+        body = rewriter.visit(tree.body)
+        func_tree = ast.Expression(
+            body=ast.Lambda(
+                args=ast.arguments(
+                    posonlyargs=[],
+                    args=[ast.arg(arg="data")],
+                    kwonlyargs=[],
+                    kw_defaults=[],
+                    defaults=[],
+                ),
+                body=body,
+            )
+        )
+        ast.fix_missing_locations(func_tree)
+        code = compile(func_tree, f"<expression: {source}>", "eval")
+
+        self.source = source
+        self.names: tuple[NodeKey, ...] = tuple(dict.fromkeys(rewriter.names))
+        self._func: Callable[[ListData], Any] = eval(
+            code, {"__builtins__": {}, **_FUNCTIONS}
+        )
+
+    def __call__(self, data: ListData) -> Any:
+        return self._func(data)
+
+    def __reduce__(self):
+        return (compile_expression, (self.source,))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Expression) and other.source == self.source
+
+    def __hash__(self) -> int:
+        return hash(self.source)
+
+    def __repr__(self) -> str:
+        return f"Expression({self.source!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(source: str) -> Expression:
+    """
+    Compile an expression, reusing previously compiled instances.
+
+    Args:
+        source: The expression text
+
+    Returns:
+        The compiled Expression
+
+    Raises:
+        ExpressionError: If the text is not a valid expression
+    """
+    return Expression(source)
@@ -0,0 +1,479 @@
+"""
+Asyncio HTTP/1.1 webhook gateway that drives workflow sessions.
+
+Messaging providers deliver user messages as HTTP webhooks and expect a
+quick answer. WebhookGateway accepts them with a small HTTP/1.1 server
+built on asyncio streams (keep-alive and pipelining included), maps each
+JSON payload to a session and answers 202 right away. The message is then
+processed in the background by the session's own Orchestrator, and
+replies go out through an Output adapter created for that session.
+
+Each session runs on a fresh instance of the workflow, since nodes keep
+per-session state; ChainTemplate.build is a convenient factory. Messages
+of one session are processed in order, one at a time, while different
+sessions progress concurrently. The first message of a session starts the
+workflow; its text is not used as an answer. Finished sessions are
+dropped, so the next message starts over.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from http import HTTPStatus
+from itertools import islice
+from typing import Any, NamedTuple
+
+from twpm.core.base import ListData, Node
+from twpm.core.container import Container
+from twpm.core.depedencies import Output
+from twpm.core.events import EventListener
+from twpm.core.orchestrator import DEFAULT_MAX_STEPS, Orchestrator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = "/webhook"
+
+
+class InboundMessage(NamedTuple):
+    """
+    A user message extracted from a webhook payload.
+
+    Attributes:
+        session_id: Identifier of the conversation, e.g. a chat id
+        text: Text sent by the user; None only starts the session
+    """
+
+    session_id: str
+    text: str | None
+
+
+MessageParser = Callable[[Any], InboundMessage | None]
+
+
+def parse_message(payload: Any) -> InboundMessage | None:
+    """
+    Read a payload of the form `{"session_id": "...", "text": "..."}`.
+
+    Custom parsers adapt a provider's payload format; they return None for
+    payloads that carry no user message (delivery receipts, typing
+    notifications) and raise ValueError, TypeError or KeyError for invalid
+    ones, which are answered with 400.
+
+    Raises:
+        ValueError: If the payload is not a valid message
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Expected a JSON object")
+
+    session_id = payload.get("session_id")
+    if not isinstance(session_id, str) or not session_id:
+        raise ValueError("session_id must be a non-empty string")
+
+    text = payload.get("text")
+    if text is not None and not isinstance(text, str):
+        raise ValueError("text must be a string")
+
+    return InboundMessage(session_id, text)
+
+
+class _SessionContainer(Container):
+    """Container sharing the gateway's providers, with a session's Output."""
+
+    def __init__(self, base: Container, output: Output) -> None:
+        self.providers = base.providers
+        self._output = output
+
+    def resolve(self, key: Any) -> Any:
+        if key is Output:
+            return self._output
+        return super().resolve(key)
+
+
+class _Session:
+    """A running workflow and the messages waiting for it."""
+
+    __slots__ = ("orchestrator", "inputs", "worker", "last_seen")
+
+    def __init__(self, orchestrator: Orchestrator, last_seen: float) -> None:
+        self.orchestrator = orchestrator
+        # None starts the workflow without an answer
+        self.inputs: deque[str | None] = deque([None])
+        self.worker: asyncio.Task | None = None
+        self.last_seen = last_seen
+
+
+def _response(status: HTTPStatus, body: dict[str, Any], keep_alive: bool) -> bytes:
+    payload = json.dumps(body, separators=(",", ":")).encode()
+    connection = "keep-alive" if keep_alive else "close"
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        f"Connection: {connection}\r\n\r\n"
+    )
+    return head.encode("latin-1") + payload
+
+
+# Answers to every accepted message and to unexpected failures, built once
+_ACCEPTED = {
+    keep_alive: _response(HTTPStatus.ACCEPTED, {"status": "accepted"}, keep_alive)
+    for keep_alive in (False, True)
+}
+_INTERNAL_ERROR = {
+    keep_alive: _response(
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        {"error": HTTPStatus.INTERNAL_SERVER_ERROR.phrase},
+        keep_alive,
+    )
+    for keep_alive in (False, True)
+}
+
+
+class WebhookGateway:
+    """
+    HTTP webhook server that feeds incoming messages to workflow sessions.
+
+    Example:
+        ```python
+        template = Chain().add(...).template()
+
+        gateway = WebhookGateway(
+            template.build,
+            container,
+            output_factory=lambda session_id: TelegramOutput(bot, session_id),
+        )
+        await gateway.start(port=8080)
+        await gateway.serve_forever()
+        ```
+    """
+
+    def __init__(
+        self,
+        workflow: Callable[[], Node],
+        container: Container,
+        output_factory: Callable[[str], Output],
+        parse: MessageParser = parse_message,
+        path: str = DEFAULT_PATH,
+        data_factory: Callable[[], ListData] | None = None,
+        listeners: Iterable[EventListener] = (),
+        max_sessions: int = 100_000,
+        idle_timeout: float | None = 3600.0,
+        max_body_size: int = 64 * 1024,
+        keep_alive_timeout: float | None = 75.0,
+        max_steps: int | None = DEFAULT_MAX_STEPS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a WebhookGateway.
+
+        Args:
+            workflow: Creates the head node of a fresh workflow instance for
+                      each session, e.g. ChainTemplate.build
+            container: Container injecting dependencies into nodes; its
+                       Output registration is replaced per session
+            output_factory: Creates the Output delivering replies to a
+                            session, given its id
+            parse: Turns a decoded JSON payload into an InboundMessage
+                   (see parse_message)
+            path: URL path accepting webhooks with POST
+            data_factory: Creates each session's data, e.g.
+                          DataLayout.new_data; defaults to an empty ListData
+            listeners: Event listeners added to every session's
+                       Orchestrator, e.g. a WorkflowAnalytics
+            max_sessions: Sessions kept at once; the least recently active
+                          one is dropped beyond this, once it has no
+                          message left to process
+            idle_timeout: Seconds without messages after which a session is
+                          dropped; None keeps sessions until they finish
+            max_body_size: Largest accepted request body, in bytes
+            keep_alive_timeout: Seconds an idle connection is kept open,
+                                and the longest a request's head or body
+                                may take to arrive; None keeps it until
+                                the client closes it
+            max_steps: Step budget of each session's Orchestrator
+            clock: Monotonic time source, replaceable in tests
+        """
+        if max_sessions < 1 or max_body_size < 1:
+            raise ValueError("max_sessions and max_body_size must be positive")
+
+        self.workflow = workflow
+        self.container = container
+        self.output_factory = output_factory
+        self.parse = parse
+        self.path = path
+        self.data_factory = data_factory
+        self.listeners = tuple(listeners)
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_body_size = max_body_size
+        self.keep_alive_timeout = keep_alive_timeout
+        self.max_steps = max_steps
+        self._clock = clock
+
+        # Least recently active first
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._workers: set[asyncio.Task] = set()
+        self._connections: set[asyncio.StreamWriter] = set()
+        self._server: asyncio.Server | None = None
+
+    @property
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def port(self) -> int | None:
+        """Port the server listens on, useful after starting on port 0."""
+        if self._server is None or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
+    def session(self, session_id: str) -> Orchestrator | None:
+        """Get the Orchestrator running a session, if it is active."""
+        session = self._sessions.get(session_id)
+        return session.orchestrator if session is not None else None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        """Start listening for webhooks; port 0 picks a free port."""
+        if self._server is not None:
+            raise RuntimeError("Gateway is already started")
+        self._server = await asyncio.start_server(self._serve, host, port)
+        logger.info(f"Webhook gateway listening on {host}:{self.port}{self.path}")
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            raise RuntimeError("Gateway must be started before serving")
+        await self._server.serve_forever()
+
+    async def drain(self) -> None:
+        """Wait until every accepted message has been processed."""
+        while self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Stop accepting requests, close connections, then drain."""
+        if self._server is not None:
+            self._server.close()
+            for writer in tuple(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.drain()
+
+    async def __aenter__(self) -> "WebhookGateway":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def submit(self, message: InboundMessage) -> None:
+        """
+        Queue a message for its session, starting the session if needed.
+
+        Returns immediately; the message is processed in the background.
+        """
+        now = self._clock()
+        session = self._sessions.get(message.session_id)
+
+        if session is None:
+            session = self._open(message.session_id, now)
+        else:
+            self._sessions.move_to_end(message.session_id)
+            session.last_seen = now
+            # Without text there is nothing to answer the running node with
+            if message.text is not None:
+                session.inputs.append(message.text)
+
+        if session.worker is None:
+            worker = asyncio.create_task(self._run(message.session_id, session))
+            session.worker = worker
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+        self._expire(now)
+
+    def _open(self, session_id: str, now: float) -> _Session:
+        orchestrator = Orchestrator(
+            _SessionContainer(self.container, self.output_factory(session_id)),
+            max_steps=self.max_steps,
+        )
+        for listener in self.listeners:
+            orchestrator.add_listener(listener)
+
+        data = self.data_factory() if self.data_factory is not None else None
+        orchestrator.start(session_id, self.workflow(), data)
+
+        session = _Session(orchestrator, now)
+        self._sessions[session_id] = session
+        return session
+
+    def _close_session(self, session_id: str, session: _Session) -> None:
+        if self._sessions.get(session_id) is session:
+            del self._sessions[session_id]
+
+    def _expire(self, now: float) -> None:
+        """Drop the least recently active sessions that are idle or in excess."""
+        sessions = self._sessions
+
+        excess = len(sessions) - self.max_sessions
+        if excess > 0:
+            # Sessions still processing are kept until their worker is done:
+            # dropping them would let a new message start a second
+            # Orchestrator for the same session
+            idle = islice(
+                (
+                    session_id
+                    for session_id, session in sessions.items()
+                    if session.worker is None
+                ),
+                excess,
+            )
+            for session_id in list(idle):
+                del sessions[session_id]
+                logger.warning(f"Too many sessions, dropped session {session_id}")
+
+        if self.idle_timeout is None:
+            return
+        deadline = now - self.idle_timeout
+        while sessions:
+            session_id, session = next(iter(sessions.items()))
+            if session.last_seen > deadline or session.worker is not None:
+                return
+            del sessions[session_id]
+            logger.info(f"Dropped idle session {session_id}")
+
+    async def _run(self, session_id: str, session: _Session) -> None:
+        """Process a session's queued messages in order."""
+        orchestrator = session.orchestrator
+        try:
+            while session.inputs:
+                await orchestrator.process(session.inputs.popleft())
+                if orchestrator.is_finished:
+                    self._close_session(session_id, session)
+                    break
+        except Exception as e:
+            logger.error(f"Session {session_id} failed: {e}")
+            self._close_session(session_id, session)
+            return
+        finally:
+            session.worker = None
+            # Sessions kept over max_sessions while busy can be dropped now
+            self._expire(self._clock())
+
+        # Messages that arrived after the workflow finished start it over
+        if orchestrator.is_finished:
+            for text in session.inputs:
+                try:
+                    self.submit(InboundMessage(session_id, text))
+                except Exception as e:
+                    logger.error(f"Restarting session {session_id} failed: {e}")
+                    return
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of one connection until it is closed."""
+        self._connections.add(writer)
+        try:
+            while await self._answer(reader, writer):
+                await writer.drain()
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _answer(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Read and answer one request, returning whether to keep the connection."""
+        try:
+            head = await asyncio.wait_for(
+                reader.readuntil(b"\r\n\r\n"), self.keep_alive_timeout
+            )
+        except asyncio.IncompleteReadError:
+            return False
+        except asyncio.LimitOverrunError:
+            self._reject(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+            return False
+
+        lines = head.decode("latin-1").split("\r\n")
+        request_line = lines[0].split(" ")
+        if len(request_line) != 3 or not request_line[2].startswith("HTTP/1."):
+            self._reject(writer, HTTPStatus.BAD_REQUEST, "Malformed request line")
+            return False
+        method, target, version = request_line
+
+        headers = {}
+        for line in lines[1:-2]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            keep_alive = connection != "close"
+        else:
+            keep_alive = connection == "keep-alive"
+
+        if "transfer-encoding" in headers:
+            self._reject(writer, HTTPStatus.LENGTH_REQUIRED)
+            return False
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._reject(writer, HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+            return False
+        if length > self.max_body_size:
+            self._reject(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return False
+        # A client trickling its body must not hold the connection forever
+        body = b""
+        if length:
+            body = await asyncio.wait_for(
+                reader.readexactly(length), self.keep_alive_timeout
+            )
+
+        if target.partition("?")[0] != self.path:
+            writer.write(_response(HTTPStatus.NOT_FOUND, {}, keep_alive))
+        elif method != "POST":
+            writer.write(_response(HTTPStatus.METHOD_NOT_ALLOWED, {}, keep_alive))
+        else:
+            writer.write(self._accept(body, keep_alive))
+        return keep_alive
+
+    def _accept(self, body: bytes, keep_alive: bool) -> bytes:
+        """Parse a webhook body and queue its message."""
+        try:
+            message = self.parse(json.loads(body))
+        except (ValueError, TypeError, KeyError) as e:
+            error = {"error": str(e)}
+            return _response(HTTPStatus.BAD_REQUEST, error, keep_alive)
+        except Exception as e:
+            logger.error(f"Parsing a webhook failed: {e}")
+            return _INTERNAL_ERROR[keep_alive]
+
+        if message is None:
+            return _response(HTTPStatus.OK, {"status": "ignored"}, keep_alive)
+
+        # Building the workflow, the output or the Orchestrator runs user
+        # code; the body was read in full, so the connection stays usable
+        try:
+            self.submit(message)
+        except Exception as e:
+            logger.error(f"Starting session {message.session_id} failed: {e}")
+            return _INTERNAL_ERROR[keep_alive]
+        return _ACCEPTED[keep_alive]
+
+    def _reject(
+        self, writer: asyncio.StreamWriter, status: HTTPStatus, error: str = ""
+    ) -> None:
+        """Answer an unusable request; the connection is closed afterwards."""
+        writer.write(_response(status, {"error": error or status.phrase}, False))
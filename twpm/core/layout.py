@@ -0,0 +1,104 @@
+"""
+Compiled data layouts for workflow sessions.
+
+Most data keys of a workflow are known before it runs: node keys, the
+fields shown by progress and summary nodes, the derived quiz keys. A
+DataLayout assigns each of those keys an integer slot once, so every
+session can store its data in a flat list instead of a dictionary.
+"""
+
+from collections.abc import Iterable
+
+from twpm.core.base import Node, NodeKey
+from twpm.core.base.models import CompactListData, ListData
+from twpm.core.cursor import Cursor
+
+# Keys written by the orchestrator itself rather than by a node
+_RUNTIME_KEYS = ("_user_input",)
+
+
+class DataLayout:
+    """
+    Mapping of known data keys to list slots.
+
+    Attributes:
+        keys: Known keys, in slot order
+        slots: Dictionary from key to slot index
+    """
+
+    def __init__(self, keys: Iterable[NodeKey]):
+        """
+        Initialize a DataLayout.
+
+        Args:
+            keys: Keys to assign slots to, duplicates are ignored
+        """
+        self.keys: tuple[NodeKey, ...] = tuple(dict.fromkeys(keys))
+        self.slots: dict[NodeKey, int] = {key: i for i, key in enumerate(self.keys)}
+        self._plans: dict[tuple[NodeKey, ...], tuple[int | None, ...]] = {}
+
+    @classmethod
+    def from_chain(cls, head: Node, extra_keys: Iterable[NodeKey] = ()) -> "DataLayout":
+        """
+        Compile a layout from every node reachable from head.
+
+        Args:
+            head: The head node of a built chain
+            extra_keys: Additional keys known to be written at runtime
+
+        Returns:
+            A DataLayout covering the keys declared by the nodes
+
+        Example:
+            ```python
+            head = chain.build()
+            layout = DataLayout.from_chain(head)
+            orchestrator.start(session_id, head, data=layout.new_data())
+            ```
+        """
+        keys: list[NodeKey] = list(_RUNTIME_KEYS)
+        for node in Cursor.walk(head):
+            keys.extend(node.data_keys())
+        keys.extend(extra_keys)
+        return cls(keys)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: NodeKey) -> bool:
+        return key in self.slots
+
+    def slot(self, key: NodeKey) -> int | None:
+        """Get the slot of a key, or None if the key is not part of the layout."""
+        return self.slots.get(key)
+
+    def plan(self, keys: tuple[NodeKey, ...]) -> tuple[int | None, ...]:
+        """
+        Resolve a group of keys to their slots, caching the result.
+
+        Nodes read the same group of keys on every execution, so the slot
+        lookup is done only once per group.
+
+        Args:
+            keys: The keys to resolve
+
+        Returns:
+            Tuple with the slot of each key, None for keys outside the layout
+        """
+        plan = self._plans.get(keys)
+        if plan is None:
+            plan = tuple(self.slots.get(key) for key in keys)
+            self._plans[keys] = plan
+        return plan
+
+    def new_data(self, initial: dict[NodeKey, str] | None = None) -> ListData:
+        """
+        Create an empty session data container using this layout.
+
+        Args:
+            initial: Optional values to pre-populate the data with
+
+        Returns:
+            A CompactListData bound to this layout
+        """
+        return CompactListData(self, initial)
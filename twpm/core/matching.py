@@ -0,0 +1,266 @@
+"""
+Matching of typed user input against option lists.
+
+Users answer option prompts with the option number, its label or its
+value, typed with any casing, accents or spacing. An OptionIndex is
+built once per option list and resolves any of these in a single
+dictionary lookup.
+
+When nothing matches exactly, a FuzzyIndex suggests the closest labels
+using trigram similarity. Fuzzy indexes are shared between sessions
+through a FuzzyIndexCache and updated incrementally when an option list
+changes.
+"""
+
+import heapq
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize text for matching: case-folded, accents stripped and
+    whitespace collapsed.
+
+    Example:
+        ```python
+        normalize("  São   Paulo ")  # "sao paulo"
+        ```
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.split())
+
+
+class OptionIndex:
+    """
+    Lookup table from typed input to option positions.
+
+    Options are matched by number (1-based by default), by label (`str(option)`) and
+    by value (`option.value`, for PoolOption). Numbers take precedence over
+    labels and values; among options with the same label or value, the
+    first one wins.
+
+    Example:
+        ```python
+        index = OptionIndex([PoolOption("São Paulo", "sp"), PoolOption("Rio", "rj")])
+        index.lookup("2")  # 1
+        index.lookup("sao paulo")  # 0
+        index.lookup("RJ")  # 1
+        ```
+    """
+
+    __slots__ = ("size", "_positions")
+
+    def __init__(self, options: Sequence[Any], start: int = 1):
+        """
+        Build the index of an option list.
+
+        Args:
+            options: Options to index, PoolOption instances or plain strings
+            start: Number of the first option, e.g. for later pages of a
+                   paginated list
+        """
+        positions: dict[str, int] = {}
+
+        for position, option in enumerate(options):
+            positions.setdefault(normalize(str(option)), position)
+            value = getattr(option, "value", None)
+            if value is not None:
+                positions.setdefault(normalize(str(value)), position)
+
+        # Numbers are written last so they override labels such as "1"
+        for position in range(len(options)):
+            positions[str(position + start)] = position
+
+        self.size = len(options)
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return self.size
+
+    def lookup(self, text: str) -> int | None:
+        """
+        Find the option matching typed input.
+
+        Args:
+            text: The user's input
+
+        Returns:
+            Position of the matching option, or None if nothing matches
+        """
+        key = normalize(text)
+        position = self._positions.get(key)
+        if position is None and key.isdecimal():
+            # Numbers typed with leading zeros, e.g. "02"
+            position = self._positions.get(str(int(key)))
+        return position
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """
+    Get the trigrams of normalized text, padded so that word starts weigh more.
+
+    Example:
+        ```python
+        trigrams("rio")  # {"  r", " ri", "rio", "io "}
+        ```
+    """
+    padded = f"  {text} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class FuzzyIndex:
+    """
+    Trigram index of option labels for "did you mean" suggestions.
+
+    Labels are scored against the query with the Dice coefficient of their
+    trigram sets. Only labels sharing at least one trigram with the query
+    are scored, so lookups stay fast on lists with thousands of options.
+
+    Example:
+        ```python
+        index = FuzzyIndex(["Lisboa", "Porto", "Braga"])
+        index.search("lisbao")  # [(0, 0.57...)]
+        ```
+    """
+
+    def __init__(self, options: Sequence[Any] = ()):
+        """
+        Build the index of an option list.
+
+        Args:
+            options: Options to index, displayed with str()
+        """
+        # Trigram -> labels containing it
+        self._postings: dict[str, set[str]] = {}
+        # Label -> its trigrams
+        self._grams: dict[str, frozenset[str]] = {}
+        # Label -> position of its first option in the current list
+        self._positions: dict[str, int] = {}
+        self.update(options)
+
+    def __len__(self) -> int:
+        return len(self._grams)
+
+    def update(self, options: Sequence[Any]) -> None:
+        """
+        Re-index a changed option list, only processing labels that were
+        added or removed.
+
+        Args:
+            options: The new option list
+        """
+        positions: dict[str, int] = {}
+        for position, option in enumerate(options):
+            positions.setdefault(normalize(str(option)), position)
+
+        for label in self._grams.keys() - positions.keys():
+            for gram in self._grams.pop(label):
+                labels = self._postings[gram]
+                labels.discard(label)
+                if not labels:
+                    del self._postings[gram]
+
+        for label in positions.keys() - self._grams.keys():
+            grams = trigrams(label)
+            self._grams[label] = grams
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(label)
+
+        self._positions = positions
+
+    def search(
+        self, text: str, limit: int = 3, min_score: float = 0.3
+    ) -> list[tuple[int, float]]:
+        """
+        Find the options whose labels are most similar to typed input.
+
+        Args:
+            text: The user's input
+            limit: Maximum number of candidates returned
+            min_score: Minimum similarity, from 0 to 1
+
+        Returns:
+            (position, score) pairs, best match first
+        """
+        query = trigrams(normalize(text))
+        shared: dict[str, int] = {}
+        for gram in query:
+            for label in self._postings.get(gram, ()):
+                shared[label] = shared.get(label, 0) + 1
+
+        size = len(query)
+        scored = (
+            (2 * count / (size + len(self._grams[label])), label)
+            for label, count in shared.items()
+        )
+        return [
+            (self._positions[label], score)
+            for score, label in heapq.nlargest(limit, scored)
+            if score >= min_score
+        ]
+
+
+class FuzzyIndexCache:
+    """
+    Size-bounded LRU of fuzzy indexes shared between sessions.
+
+    Indexes are keyed by the source of an option list (e.g. the function
+    loading it) rather than by the list itself, so every session loading
+    options from the same source shares one index. When a session brings
+    a different list, the index is updated incrementally before use.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        """
+        Initialize a FuzzyIndexCache.
+
+        Args:
+            maxsize: Maximum number of indexes kept
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[FuzzyIndex, Sequence[Any]]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, source: Hashable, options: Sequence[Any]) -> FuzzyIndex:
+        """
+        Get the index of a source, brought up to date with an option list.
+
+        Args:
+            source: Identifies where the options come from
+            options: The option list the index must reflect
+
+        Returns:
+            The shared FuzzyIndex
+        """
+        entry = self._entries.get(source)
+
+        if entry is None:
+            index = FuzzyIndex(options)
+        else:
+            index = entry[0]
+            if entry[1] is not options:
+                index.update(options)
+
+        self._entries[source] = (index, options)
+        self._entries.move_to_end(source)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return index
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Shared by every PoolNode
+FUZZY_INDEXES = FuzzyIndexCache()
@@ -0,0 +1,221 @@
+"""
+Shared cache for asynchronously loaded options.
+
+Most option lists (plans, product categories, cities) are global or
+tenant-wide and change rarely, yet every session calls the options
+function again. An OptionsCache wraps such a function and serves options
+from memory:
+
+    - Fresh entries (younger than `ttl`) are returned directly.
+    - Stale entries (younger than `ttl + stale_ttl`) are returned directly
+      while a single background task refreshes them.
+    - Missing or expired entries are loaded once, with concurrent sessions
+      waiting on the same load (single flight).
+
+Cached lists are returned as the same object on every hit, so menu and
+fuzzy-match caches keyed by list identity keep hitting too.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from twpm.core.base import ListData
+
+logger = logging.getLogger(__name__)
+
+OptionsLoader = Callable[[ListData], Awaitable[Any]]
+CacheKey = str | Callable[[ListData], Hashable] | None
+
+
+class _WrappedKey(NamedTuple):
+    """Cache key of an entry stored by a function returned from wrap()."""
+
+    loader: OptionsLoader
+    key: Hashable
+
+
+@dataclass
+class _Entry:
+    value: Any
+    loaded_at: float
+
+
+class OptionsCache:
+    """
+    TTL cache with stale-while-revalidate and single-flight loading.
+
+    Example:
+        ```python
+        plans = OptionsCache(ttl=300, stale_ttl=3600)
+
+        async def load_plans(data: ListData) -> list[PoolOption]:
+            return [PoolOption(p.name, p.id) for p in await api.plans(data["tenant_id"])]
+
+        node = PoolNode("Plan", options=plans.wrap(load_plans, key="tenant_id"), key="plan")
+        ```
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        stale_ttl: float = 0.0,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize an OptionsCache.
+
+        Args:
+            ttl: Seconds an entry is served without refreshing
+            stale_ttl: Additional seconds an expired entry is still served
+                       while it is refreshed in the background
+            maxsize: Maximum number of entries kept, least recently used
+                     entries are dropped first
+            clock: Monotonic time source, in seconds
+        """
+        if ttl < 0 or stale_ttl < 0:
+            raise ValueError("ttl and stale_ttl must not be negative")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def wrap(self, loader: OptionsLoader, key: CacheKey = None) -> OptionsLoader:
+        """
+        Wrap an options function so its results are cached.
+
+        Args:
+            loader: Async function loading options from the workflow data
+            key: What the options depend on: the name of a ListData field
+                 (e.g. "tenant_id"), a function computing a key from the
+                 data, or None for options shared by every session
+
+        Returns:
+            An async options function backed by this cache
+        """
+
+        async def cached(data: ListData) -> Any:
+            if key is None:
+                user_key = None
+            elif isinstance(key, str):
+                user_key = data.get(key)
+            else:
+                user_key = key(data)
+            return await self.get(_WrappedKey(loader, user_key), loader, data)
+
+        return cached
+
+    async def get(self, key: Hashable, loader: OptionsLoader, data: ListData) -> Any:
+        """
+        Get the options stored under key, loading them if needed.
+
+        Args:
+            key: Cache key
+            loader: Async function loading the options on a miss
+            data: Workflow data passed to the loader
+
+        Returns:
+            The cached or freshly loaded options
+        """
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            age = self._clock() - entry.loaded_at
+            if age < self.ttl:
+                self._entries.move_to_end(key)
+                return entry.value
+            if age < self.ttl + self.stale_ttl:
+                self._entries.move_to_end(key)
+                self._load(key, loader, data)
+                return entry.value
+
+        # Several waiters may share the load; cancelling one must not
+        # cancel it for the others
+        return await asyncio.shield(self._load(key, loader, data))
+
+    def invalidate(
+        self, key: Hashable | None = None, loader: OptionsLoader | None = None
+    ) -> None:
+        """
+        Drop cached options, so the next request loads them again.
+
+        Loads already in flight for the dropped keys finish for the sessions
+        waiting on them, but their result is not cached.
+
+        Args:
+            key: Key given to get(), or the key value of functions returned
+                 by wrap(), e.g. the tenant id for key="tenant_id"; None
+                 with no loader drops every entry
+            loader: Only drop the entries of this wrapped loader; with key
+                    None, drops every entry of the loader
+
+        Example:
+            ```python
+            cache.invalidate("tenant-a")  # every wrapped loader
+            cache.invalidate("tenant-a", loader=load_plans)
+            ```
+        """
+        if key is None and loader is None:
+            self._entries.clear()
+            self._inflight.clear()
+            return
+
+        def matches(cache_key: Hashable) -> bool:
+            if isinstance(cache_key, _WrappedKey):
+                return (loader is None or cache_key.loader is loader) and (
+                    key is None or cache_key.key == key
+                )
+            return loader is None and cache_key == key
+
+        for stored in (self._entries, self._inflight):
+            for cache_key in [cache_key for cache_key in stored if matches(cache_key)]:
+                del stored[cache_key]
+
+    def _load(
+        self, key: Hashable, loader: OptionsLoader, data: ListData
+    ) -> asyncio.Task:
+        """Start loading key unless a load is already in flight."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(key, loader, data))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+            # Background refreshes may have no waiter to retrieve the error
+            task.add_done_callback(self._log_failure)
+        return task
+
+    async def _refresh(
+        self, key: Hashable, loader: OptionsLoader, data: ListData
+    ) -> Any:
+        value = await loader(data)
+        if self._inflight.get(key) is not asyncio.current_task():
+            # Invalidated while loading: serve the value but don't cache it
+            return value
+
+        self._entries[key] = _Entry(value, self._clock())
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Loading options failed: {task.exception()}")
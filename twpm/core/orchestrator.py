@@ -1,14 +1,27 @@
 import inspect
 import logging
+import weakref
+from contextlib import AsyncExitStack
 from enum import Enum, auto
-from typing import Any
+from typing import Any, NamedTuple
 
-from twpm.core.base import ListData, Node, NodeResult, NodeStatus
+from twpm.core.base import ListData, Node, NodeResult, NodeStatus, SubworkflowCall
 from twpm.core.container import Container
 from twpm.core.depedencies import Output
+from twpm.core.events import EventListener, WorkflowEvent, WorkflowEventType
 
 logger = logging.getLogger(__name__)
 
+# Default maximum number of nodes executed by a single process() call
+DEFAULT_MAX_STEPS = 10_000
+
+# Node type -> (parameter name, annotation) of its execute() method, shared
+# by every Orchestrator since it only depends on the type. Weak, so node
+# classes defined at runtime (e.g. in tests or plugins) can be collected
+_signatures: weakref.WeakKeyDictionary[type, list[tuple[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class OrchestratorState(Enum):
     DEFAULT = auto()
@@ -17,10 +30,32 @@ class OrchestratorState(Enum):
     ERROR = auto()
 
 
+class _CallFrame(NamedTuple):
+    """Caller state saved while a subworkflow runs."""
+
+    return_to: Node | None
+    data: ListData
+    outputs: tuple[str, ...] | None
+
+
 class Orchestrator:
     def __init__(
-        self, container: Container, logger: logging.Logger | None = None
+        self,
+        container: Container,
+        logger: logging.Logger | None = None,
+        max_steps: int | None = DEFAULT_MAX_STEPS,
     ) -> None:
+        """
+        Initialize an Orchestrator.
+
+        Args:
+            container: Container used to inject dependencies into nodes
+            logger: Optional logger, defaults to the module logger
+            max_steps: Maximum number of nodes a single process() call may
+                       execute before the workflow is stopped with an error,
+                       protecting the event loop from runaway loops.
+                       None disables the limit.
+        """
         self._head: Node | None = None
         self._current: Node | None = None
         self._data: ListData = ListData(data={})
@@ -30,10 +65,21 @@ class Orchestrator:
 
         self.container = container
         self.logger = logger or logging.getLogger(__name__)
+        self.max_steps = max_steps
+
+        # Callers of the subworkflows currently running, innermost last
+        self._call_stack: list[_CallFrame] = []
+
+        self._listeners: list[EventListener] = []
 
     @property
     def is_finished(self) -> bool:
-        return self._state == OrchestratorState.FINISHED
+        return self._state in (OrchestratorState.FINISHED, OrchestratorState.ERROR)
+
+    @property
+    def has_error(self) -> bool:
+        """Whether the workflow was stopped by the orchestrator itself."""
+        return self._state == OrchestratorState.ERROR
 
     @property
     def is_started(self) -> bool:
@@ -48,8 +94,49 @@ class Orchestrator:
     def session_id(self) -> str | None:
         return self._session_id
 
-    def start(self, session_id: str, start_node: Node):
-        """Initialize and start the orchestrator with a starting node."""
+    @property
+    def call_depth(self) -> int:
+        """Number of nested subworkflows currently running."""
+        return len(self._call_stack)
+
+    def add_listener(self, listener: EventListener) -> None:
+        """
+        Register a function called with every WorkflowEvent of this
+        orchestrator (see twpm.core.events).
+
+        Exceptions raised by listeners are logged and never stop the workflow.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: EventListener) -> None:
+        """Unregister a listener added with add_listener()."""
+        self._listeners.remove(listener)
+
+    def _emit(self, event_type: WorkflowEventType, node: Node | None) -> None:
+        """Notify the listeners of an event."""
+        if not self._listeners:
+            return
+
+        event = WorkflowEvent(event_type, self._session_id, node, self._data)
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                self.logger.error(f"Event listener failed on {event_type.value}: {e}")
+
+    def start(self, session_id: str, start_node: Node, data: ListData | None = None):
+        """
+        Initialize and start the orchestrator with a starting node.
+
+        Args:
+            session_id: Identifier of the session being processed
+            start_node: The head node of the workflow
+            data: Optional data container for the session, e.g. one created by
+                  DataLayout.new_data(). Keeps the current data if omitted.
+        """
+        self._unwind_calls()
+        if data is not None:
+            self._data = data
         self._state = OrchestratorState.STARTED
         self._session_id = session_id
         self._head = start_node
@@ -57,28 +144,59 @@ class Orchestrator:
         self.logger.info(
             f"Orchestrator started with node: {self._get_node_identifier(start_node)}"
         )
+        self._emit(WorkflowEventType.STARTED, None)
+        self._emit(WorkflowEventType.NODE_ENTERED, start_node)
 
     def reset(self):
         """Reset the orchestrator to the beginning of the workflow."""
         self._state = OrchestratorState.DEFAULT
+        self._unwind_calls()
         self._current = self._head
         self.logger.info("Orchestrator reset to head node")
 
+    def _parameters(self, node: Node) -> list[tuple[str, Any]]:
+        """Get the parameters of a node's execute() method, cached per type."""
+        node_type = type(node)
+        parameters = _signatures.get(node_type)
+
+        if parameters is None:
+            try:
+                func_signature = inspect.signature(node.execute, eval_str=True)
+            except NameError:
+                func_signature = inspect.signature(node.execute)
+
+            parameters = [
+                (name, parameter.annotation)
+                for name, parameter in func_signature.parameters.items()
+                if name != "data"
+            ]
+            _signatures[node_type] = parameters
+
+        return parameters
+
     def inject(self, node: Node) -> dict[str, Any]:
         """
         Build dependency injection kwargs for node execution.
 
+        The `output` parameter receives the registered Output. Any other
+        parameter annotated with a type registered in the container receives
+        that service; POOLED services are leased by _execute_node instead.
+
         Returns:
             Dictionary of parameter names to injected values
         """
-        execute_method = node.execute
-        func_signature = inspect.signature(execute_method)
         kwargs: dict[str, Any] = {}
 
         kwargs["data"] = self._data
 
-        if "output" in func_signature.parameters:
-            kwargs["output"] = self.container.resolve(Output)
+        for name, annotation in self._parameters(node):
+            if name == "output":
+                kwargs["output"] = self.container.resolve(Output)
+            elif (
+                annotation in self.container.providers
+                and not self.container.is_pooled(annotation)
+            ):
+                kwargs[name] = self.container.resolve(annotation)
 
         return kwargs
 
@@ -103,9 +221,24 @@ class Orchestrator:
             self._data["_user_input"] = input
             self.logger.debug(f"User input received: {input}")
 
-        while self._current is not None:
+        steps = 0
+        while self._current is not None or self._call_stack:
+            if self._current is None:
+                self._return_from_call()
+                continue
+
             node_id = self._get_node_identifier(self._current)
 
+            steps += 1
+            if self.max_steps is not None and steps > self.max_steps:
+                self._state = OrchestratorState.ERROR
+                self.logger.error(
+                    f"Step budget of {self.max_steps} exceeded at node {node_id}, "
+                    "stopping workflow"
+                )
+                self._emit(WorkflowEventType.ERROR, self._current)
+                return
+
             result = await self._execute_node(self._current)
 
             if not self._handle_node_result(result, node_id):
@@ -121,7 +254,41 @@ class Orchestrator:
         node.status = NodeStatus.DEFAULT
 
         kwargs = self.inject(node)
-        result = await node.execute(**kwargs)
+        pooled = [
+            (name, annotation)
+            for name, annotation in self._parameters(node)
+            if name not in kwargs and self.container.is_pooled(annotation)
+        ]
+
+        if pooled:
+            # Leases are released as soon as the node finishes executing
+            stack = AsyncExitStack()
+            try:
+                for name, annotation in pooled:
+                    kwargs[name] = await stack.enter_async_context(
+                        self.container.acquire(annotation)
+                    )
+            except Exception as e:
+                # A dependency that cannot be leased fails the node, like
+                # an exception inside execute() does with @safe_execute
+                await self._release(stack, node_id)
+                self.logger.error(
+                    f"Acquiring dependencies of node {node_id} failed: {e}",
+                    exc_info=True,
+                )
+                result = NodeResult(
+                    success=False,
+                    data={},
+                    message=f"Exception in node '{node_id}': {e!s}",
+                    is_awaiting_input=False,
+                )
+            else:
+                try:
+                    result = await node.execute(**kwargs)
+                finally:
+                    await self._release(stack, node_id)
+        else:
+            result = await node.execute(**kwargs)
 
         self.logger.debug(
             f"Node {node_id} execution completed - Success: {result.success}"
@@ -129,6 +296,13 @@ class Orchestrator:
 
         return result
 
+    async def _release(self, leases: AsyncExitStack, node_id: str) -> None:
+        """Return leased dependencies; failing to close one only gets logged."""
+        try:
+            await leases.aclose()
+        except Exception as e:
+            self.logger.error(f"Releasing dependencies of node {node_id} failed: {e}")
+
     def _handle_node_result(self, result: NodeResult, node_id: str) -> bool:
         """
         Handle the result of a node execution.
@@ -142,12 +316,14 @@ class Orchestrator:
             if result.data:
                 self._merge_result_data(result.data)
                 self.logger.debug(f"Merged data from node {node_id}: {result.data}")
+            self._emit(WorkflowEventType.AWAITING_INPUT, self._current)
             return False
 
         if not result.success:
             self.logger.warning(f"Node {node_id} failed: {result.message}")
             self._current.status = NodeStatus.FAILED
-            self._end_workflow(f"Node {node_id} failed")
+            self._emit(WorkflowEventType.NODE_FAILED, self._current)
+            self._end_workflow(f"Node {node_id} failed", self._current)
             return False
 
         if result.data:
@@ -155,22 +331,70 @@ class Orchestrator:
             self.logger.debug(f"Merged data from node {node_id}: {result.data}")
 
         self._current.status = NodeStatus.COMPLETE
-        self._current = self._current.next
+        self._emit(WorkflowEventType.NODE_COMPLETED, self._current)
+        if result.call is not None:
+            self._enter_call(result.call)
+        elif result.next_node is not None:
+            self._current = result.next_node
+        else:
+            self._current = self._current.next
 
         if self._current:
             next_id = self._get_node_identifier(self._current)
             self.logger.debug(f"Moving to next node: {next_id}")
+            self._emit(WorkflowEventType.NODE_ENTERED, self._current)
 
         return True
 
+    def _enter_call(self, call: SubworkflowCall) -> None:
+        """Save the caller's position and data, then jump into a subworkflow."""
+        assert self._current is not None, "Current is None"
+
+        self._call_stack.append(
+            _CallFrame(self._current.next, self._data, call.outputs)
+        )
+        self._data = call.data
+        self._current = call.head
+        self.logger.debug(f"Entered subworkflow, call depth {self.call_depth}")
+
+    def _return_from_call(self) -> None:
+        """Return to the caller of a finished subworkflow."""
+        frame = self._call_stack.pop()
+
+        if frame.data is not self._data:
+            if frame.outputs is None:
+                values = {
+                    key: value
+                    for key, value in self._data.data.items()
+                    if key != "_user_input"
+                }
+            else:
+                values = {
+                    key: self._data[key] for key in frame.outputs if self._data.has(key)
+                }
+            frame.data.update(values)
+
+        self._data = frame.data
+        self._current = frame.return_to
+        self.logger.debug(f"Returned from subworkflow, call depth {self.call_depth}")
+        if self._current is not None:
+            self._emit(WorkflowEventType.NODE_ENTERED, self._current)
+
+    def _unwind_calls(self) -> None:
+        """Drop running subworkflows, restoring the outermost caller's data."""
+        if self._call_stack:
+            self._data = self._call_stack[0].data
+            self._call_stack.clear()
+
     def _merge_result_data(self, result_data: dict[str, str]) -> None:
         """Merge result data into the workflow's shared data."""
         self._data.update(result_data)
 
-    def _end_workflow(self, reason: str) -> None:
+    def _end_workflow(self, reason: str, failed_node: Node | None = None) -> None:
         """Mark the workflow as ended and log the reason."""
         self._state = OrchestratorState.FINISHED
         self.logger.info(f"Workflow ended: {reason}")
+        self._emit(WorkflowEventType.FINISHED, failed_node)
 
     def _get_node_identifier(self, node: Node) -> str:
         """Get a readable identifier for a node."""
@@ -1,27 +1,95 @@
-"""Primitive node implementations for common workflow patterns."""
-
-from twpm.core.primitives.condition import ConditionalNode
-from twpm.core.primitives.display_message import DisplayMessageNode
-from twpm.core.primitives.pool import PoolNode, PoolOption
-from twpm.core.primitives.progress import ProgressNode
-from twpm.core.primitives.question import QuestionNode
-from twpm.core.primitives.quiz import QuizNode, QuizSummaryNode
-from twpm.core.primitives.summary import SummaryNode
-from twpm.core.primitives.switch import SwitchNode
-from twpm.core.primitives.task import TaskNode
+"""
+Primitive node implementations for common workflow patterns.
+
+Primitives are loaded lazily (PEP 562): each module is imported the first
+time one of its nodes is accessed.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from twpm.core.primitives.condition import ConditionalNode
+    from twpm.core.primitives.display_message import DisplayMessageNode
+    from twpm.core.primitives.loop import GotoNode, LoopNode
+    from twpm.core.primitives.paged_pool import PagedPoolNode
+    from twpm.core.primitives.pool import PoolNode, PoolOption
+    from twpm.core.primitives.progress import ProgressNode
+    from twpm.core.primitives.question import QuestionNode
+    from twpm.core.primitives.quiz import (
+        BankQuestion,
+        QuestionBank,
+        QuestionBankNode,
+        QuestionBankSummaryNode,
+        QuizNode,
+        QuizSummaryNode,
+    )
+    from twpm.core.primitives.subworkflow import DataScope, SubworkflowNode
+    from twpm.core.primitives.summary import SummaryNode
+    from twpm.core.primitives.switch import SwitchNode
+    from twpm.core.primitives.task import TaskNode
+
+# Public name -> module that defines it
+_LAZY_ATTRIBUTES = {
+    "DisplayMessageNode": "twpm.core.primitives.display_message",
+    # pools
+    "PoolNode": "twpm.core.primitives.pool",
+    "PoolOption": "twpm.core.primitives.pool",
+    "PagedPoolNode": "twpm.core.primitives.paged_pool",
+    # -- end pools --
+    "ProgressNode": "twpm.core.primitives.progress",
+    "QuestionNode": "twpm.core.primitives.question",
+    "QuizNode": "twpm.core.primitives.quiz.quiz_node",
+    "QuizSummaryNode": "twpm.core.primitives.quiz.quiz_summary",
+    "BankQuestion": "twpm.core.primitives.quiz.question_bank",
+    "QuestionBank": "twpm.core.primitives.quiz.question_bank",
+    "QuestionBankNode": "twpm.core.primitives.quiz.question_bank",
+    "QuestionBankSummaryNode": "twpm.core.primitives.quiz.question_bank",
+    "SummaryNode": "twpm.core.primitives.summary",
+    "TaskNode": "twpm.core.primitives.task",
+    "ConditionalNode": "twpm.core.primitives.condition",
+    "SwitchNode": "twpm.core.primitives.switch",
+    "GotoNode": "twpm.core.primitives.loop",
+    "LoopNode": "twpm.core.primitives.loop",
+    "SubworkflowNode": "twpm.core.primitives.subworkflow",
+    "DataScope": "twpm.core.primitives.subworkflow",
+}
 
 __all__ = [
     "DisplayMessageNode",
     # pools
     "PoolNode",
     "PoolOption",
+    "PagedPoolNode",
     # -- end pools --
     "ProgressNode",
     "QuestionNode",
     "QuizNode",
     "QuizSummaryNode",
+    "BankQuestion",
+    "QuestionBank",
+    "QuestionBankNode",
+    "QuestionBankSummaryNode",
     "SummaryNode",
     "TaskNode",
     "ConditionalNode",
     "SwitchNode",
+    "GotoNode",
+    "LoopNode",
+    "SubworkflowNode",
+    "DataScope",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
@@ -1,8 +1,10 @@
+from collections.abc import Mapping
 from typing import Callable, override
 
 from twpm.core.base import ListData, Node, NodeResult
 from twpm.core.cursor import Cursor
 from twpm.core.decorators import safe_execute
+from twpm.core.expressions import compile_expression
 
 ConditionalFunc = Callable[[ListData], bool]
 
@@ -12,28 +14,76 @@ class ConditionalNode(Node):
         self.condition_func: ConditionalFunc | None = None
         self.true_node: Node | None = None
         self.false_node: Node | None = None
+        self._spliced = False
         super().__init__(key)
 
+    @override
+    def relink(self, clones: Mapping[int, Node]) -> None:
+        if self.true_node is not None:
+            self.true_node = clones.get(id(self.true_node), self.true_node)
+        if self.false_node is not None:
+            self.false_node = clones.get(id(self.false_node), self.false_node)
+
     @override
     @safe_execute()
     async def execute(self, data: ListData) -> NodeResult:
-        if self.condition_func is None:
-            raise ValueError("Condition function is not set.")
+        if not self.verified:
+            problems = self.validate()
+            if problems:
+                raise ValueError(problems[0])
 
         if self.condition_func(data):
             next_node = self.true_node
         else:
             next_node = self.false_node
 
-        assert next_node is not None, "Next node is not set."
-        Cursor.insert(self, next_node)
+        if not self._spliced:
+            Cursor.link_branches(self)
+            self._spliced = True
+        self.next = next_node
 
         result = NodeResult(success=True, data={}, message="")
         return result
 
+    @override
+    def branches(self) -> list[Node]:
+        return [node for node in (self.true_node, self.false_node) if node]
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        return getattr(self.condition_func, "names", ())
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return ()
+
+    @override
+    def validate(self) -> list[str]:
+        problems = []
+        if self.condition_func is None:
+            problems.append("Condition function is not set.")
+        if self.true_node is None or self.false_node is None:
+            problems.append("Next node is not set.")
+        return problems
+
     def set_condition(
-        self, condition_func: ConditionalFunc, true_node: Node, false_node: Node
+        self,
+        condition_func: ConditionalFunc | str,
+        true_node: Node,
+        false_node: Node,
     ) -> None:
+        """
+        Configure the condition and both branches.
+
+        Args:
+            condition_func: Callable receiving the workflow data, or an
+                            expression string (see twpm.core.expressions)
+            true_node: Branch inserted when the condition is truthy
+            false_node: Branch inserted otherwise
+        """
+        if isinstance(condition_func, str):
+            condition_func = compile_expression(condition_func)
+
         self.condition_func = condition_func
         self.true_node = true_node
         self.false_node = false_node
@@ -4,6 +4,7 @@ from typing import override
 from twpm.core.base import ListData, Node, NodeResult
 from twpm.core.decorators import safe_execute
 from twpm.core.depedencies import Output
+from twpm.core.template import Template, as_template
 
 SyncPoolOptionsFunc = Callable[[ListData], str]
 
@@ -12,33 +13,43 @@ class DisplayMessageNode(Node):
     """
     Node that displays a message to the user without expecting input.
 
-    This node simply prints a message and continues to the next node.
+    This node simply prints a message and continues to the next node. The
+    message is shown as written, or rendered when given as a Template (see
+    twpm.core.template) to include values collected earlier:
+    `Template("Thanks, {user_name}!")`.
     """
 
     def __init__(
         self,
         key: str,
-        message: str | None = None,
+        message: str | Template | None = None,
         message_func: SyncPoolOptionsFunc | None = None,
     ):
         """
         Initialize a DisplayMessageNode.
 
         Args:
-            message: The message to display to the user
-            key: Unique key for this node (default: "display_message")
+            key: Unique key for this node
+            message: The message to display to the user, plain text
+                     or a Template
+            message_func: Function building the message from the workflow
+                          data, called on every execution
         """
         super().__init__(key)
-        self._message_loaded = False
-        self._message_func = message_func
-        self._message = message
 
         if message is None and message_func is None:
             raise ValueError("Either message or message_func must be provided.")
 
-        if message is not None:
-            self._message = message
-            self._message_loaded = True
+        self._message_func = message_func
+        self._template = as_template(message) if message is not None else None
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        return self._template.names if self._template is not None else ()
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return ()
 
     @override
     @safe_execute()
@@ -52,12 +63,13 @@ class DisplayMessageNode(Node):
         Returns:
             NodeResult indicating success with the displayed message
         """
-        if not self._message_loaded:
-            self._message = self._message_func(data)
-            self._message_loaded = True
+        if self._template is not None:
+            message = self._template.render(data)
+        else:
+            message = self._message_func(data)
 
-        await output.send_text(self._message)
+        await output.send_text(message)
 
         return NodeResult(
-            success=True, data={}, message=self._message, is_awaiting_input=False
+            success=True, data={}, message=message, is_awaiting_input=False
         )
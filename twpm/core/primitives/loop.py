@@ -0,0 +1,166 @@
+from collections.abc import Mapping
+from typing import Callable, override
+
+from twpm.core.base import ListData, Node, NodeResult
+from twpm.core.base.types import NodeKey
+from twpm.core.decorators import safe_execute
+from twpm.core.expressions import compile_expression
+
+LoopCondition = Callable[[ListData], bool]
+
+
+class GotoNode(Node):
+    """
+    Node that jumps back (or forward) to another node of the workflow.
+
+    The jump is a back-edge resolved once when the chain is built: the
+    graph is never modified, the orchestrator simply continues with the
+    target node. Each jump increments a per-session counter stored in the
+    workflow data under `{key}_iterations`; once `max_iterations` is reached,
+    or the condition is false, the workflow falls through to the next node
+    and the counter is reset.
+
+    Example:
+        ```python
+        chain = (
+            Chain()
+            .add(QuestionNode("Email", key="email"))
+            .add(GotoNode("email", condition="'@' not in email", max_iterations=3))
+            .add(DisplayMessageNode(message="Thanks!", key="thanks"))
+            .build()
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        target: Node | NodeKey,
+        condition: LoopCondition | str | None = None,
+        max_iterations: int = 10,
+        key: str = "goto",
+    ):
+        """
+        Initialize a GotoNode.
+
+        Args:
+            target: Node to jump to, or its key
+            condition: Jump only while this is truthy; a callable receiving
+                       the workflow data or an expression string
+                       (see twpm.core.expressions). Always jumps if None.
+            max_iterations: Maximum number of jumps before falling through
+            key: Unique identifier for this node
+        """
+        if max_iterations < 1:
+            raise ValueError("max_iterations must be at least 1")
+        if isinstance(condition, str):
+            condition = compile_expression(condition)
+
+        super().__init__(key)
+        self.condition = condition
+        self.max_iterations = max_iterations
+        self.target_node: Node | None = target if isinstance(target, Node) else None
+        self.target_key: NodeKey = target.key if isinstance(target, Node) else target
+
+    @override
+    def relink(self, clones: Mapping[int, Node]) -> None:
+        if self.target_node is not None:
+            self.target_node = clones.get(id(self.target_node), self.target_node)
+
+    @property
+    def counter_key(self) -> str:
+        return f"{self.key}_iterations"
+
+    @override
+    def bind(self, nodes: dict[NodeKey, Node]) -> None:
+        if self.target_node is None:
+            self.target_node = nodes.get(self.target_key)
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        return getattr(self.condition, "names", ())
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return (self.counter_key,)
+
+    @override
+    def validate(self) -> list[str]:
+        if self.target_node is None:
+            return [f"Target node '{self.target_key}' not found."]
+        return []
+
+    def should_jump(self, data: ListData) -> bool:
+        """Whether the condition asks for another iteration."""
+        return self.condition is None or bool(self.condition(data))
+
+    @override
+    @safe_execute()
+    async def execute(self, data: ListData) -> NodeResult:
+        if not self.verified:
+            problems = self.validate()
+            if problems:
+                raise ValueError(problems[0])
+
+        iterations = int(data.get(self.counter_key) or 0)
+
+        if iterations < self.max_iterations and self.should_jump(data):
+            data[self.counter_key] = str(iterations + 1)
+            return NodeResult(
+                success=True,
+                data={},
+                message=f"Jumping to {self.target_key} (iteration {iterations + 1})",
+                next_node=self.target_node,
+            )
+
+        # Reset so the loop starts over if the workflow reaches it again
+        data[self.counter_key] = "0"
+        return NodeResult(
+            success=True,
+            data={},
+            message=f"Loop finished after {iterations} iteration(s)",
+        )
+
+
+class LoopNode(GotoNode):
+    """
+    Node that repeats the nodes from a target up to itself until a
+    condition holds.
+
+    Example:
+        ```python
+        chain = (
+            Chain()
+            .add(QuestionNode("Pick a number from 1 to 5", key="number"))
+            .add(LoopNode("number", until="number in ('1', '2', '3', '4', '5')"))
+            .build()
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        target: Node | NodeKey,
+        until: LoopCondition | str,
+        max_iterations: int = 10,
+        key: str = "loop",
+    ):
+        """
+        Initialize a LoopNode.
+
+        Args:
+            target: First node of the loop body, or its key
+            until: Exit condition; a callable receiving the workflow data or
+                   an expression string (see twpm.core.expressions)
+            max_iterations: Maximum number of repetitions
+            key: Unique identifier for this node
+        """
+        if isinstance(until, str):
+            until = compile_expression(until)
+
+        super().__init__(
+            target, condition=until, max_iterations=max_iterations, key=key
+        )
+
+    @override
+    def should_jump(self, data: ListData) -> bool:
+        return not self.condition(data)
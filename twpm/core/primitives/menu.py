@@ -0,0 +1,93 @@
+"""
+Numbered option menus shared by PoolNode and QuizNode.
+
+Menus only depend on the option list and the selection prompt, so they
+are rendered once: nodes with fixed options render theirs when created,
+and dynamic option lists go through a shared, size-bounded LRU cache
+keyed by the identity of the list. Option lists must therefore be
+replaced rather than mutated in place once displayed.
+"""
+
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Any
+
+
+def render_menu(options: Sequence[Any], prompt: str) -> str:
+    """
+    Render the numbered lines of a menu followed by the selection prompt.
+
+    Args:
+        options: Options to list, displayed with str()
+        prompt: Selection prompt with a `{}` placeholder for the option count
+
+    Returns:
+        The rendered menu
+    """
+    lines = [f"  {i}. {option}\n" for i, option in enumerate(options, 1)]
+    lines.append(prompt.format(len(options)))
+    return "".join(lines)
+
+
+class MenuCache:
+    """
+    Size-bounded LRU cache of rendered menus keyed by option-list identity.
+
+    Each entry keeps a reference to its option list, so the id used as key
+    cannot be reused by another list while the entry is cached.
+
+    Example:
+        ```python
+        menu = MENUS.get(options, "Select an option (1-{}):")
+        ```
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Initialize a MenuCache.
+
+        Args:
+            maxsize: Maximum number of menus kept
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[int, str], tuple[Sequence[Any], str]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, options: Sequence[Any], prompt: str) -> str:
+        """
+        Get the rendered menu of an option list, rendering it on a miss.
+
+        Args:
+            options: Options to list
+            prompt: Selection prompt with a `{}` placeholder for the option count
+
+        Returns:
+            The rendered menu
+        """
+        key = (id(options), prompt)
+        entry = self._entries.get(key)
+
+        if entry is not None and entry[0] is options:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        menu = render_menu(options, prompt)
+        self._entries[key] = (options, menu)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return menu
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Shared by every node rendering dynamic options
+MENUS = MenuCache()
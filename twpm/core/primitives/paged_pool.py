@@ -0,0 +1,227 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import override
+
+from twpm.core.base import ListData, Node, NodeResult
+from twpm.core.decorators import safe_execute
+from twpm.core.depedencies import Output
+from twpm.core.matching import OptionIndex, normalize
+from twpm.core.primitives.pool import PoolOption
+from twpm.core.template import Template, as_template
+
+# Fetches `limit` options starting at `offset`
+PageFetcher = Callable[[ListData, int, int], Awaitable[list[PoolOption]]]
+# Yields every option in order
+OptionsStream = Callable[[ListData], AsyncIterator[PoolOption]]
+
+_SELECT_PROMPT = "Select an option ({}-{}):"
+_NEXT_HINT = "Type 'next' for more options."
+_PREVIOUS_HINT = "Type 'previous' to go back."
+_INVALID_INPUT = "Invalid input. Please enter a number or one of the options."
+
+_NEXT_COMMANDS = frozenset({"next", "n", ">"})
+_PREVIOUS_COMMANDS = frozenset({"previous", "prev", "p", "<"})
+
+
+class _StreamPages:
+    """
+    Page fetcher over an options stream.
+
+    The stream is opened once per listing and kept open between pages, so
+    moving forward only reads the options of the new page. Options already
+    read are kept to serve previous pages without restarting the stream.
+    """
+
+    def __init__(self, stream: OptionsStream):
+        self._stream = stream
+        self._iterator: AsyncIterator[PoolOption] | None = None
+        self._options: list[PoolOption] = []
+        self._exhausted = False
+
+    async def __call__(
+        self, data: ListData, offset: int, limit: int
+    ) -> list[PoolOption]:
+        if self._iterator is None and not self._exhausted:
+            self._iterator = self._stream(data).__aiter__()
+
+        end = offset + limit
+        while self._iterator is not None and len(self._options) < end:
+            try:
+                self._options.append(await self._iterator.__anext__())
+            except StopAsyncIteration:
+                self._iterator = None
+                self._exhausted = True
+
+        return self._options[offset:end]
+
+    async def close(self) -> None:
+        """Close the stream and forget its options; the next call reopens it."""
+        iterator, self._iterator = self._iterator, None
+        self._options = []
+        self._exhausted = False
+
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class PagedPoolNode(Node):
+    """
+    Node that presents a large option list one page at a time.
+
+    Only the page being shown is fetched, so memory and message size stay
+    bounded for catalogues with thousands of entries. Users pick
+    an option by its number or text, or type "next" / "previous" to move
+    between pages; an option on the page whose text matches a command is
+    picked rather than treated as one.
+
+    Example:
+        ```python
+        async def fetch_products(data: ListData, offset: int, limit: int):
+            rows = await catalogue.list(offset=offset, limit=limit)
+            return [PoolOption(row.name, row.sku) for row in rows]
+
+        node = PagedPoolNode("Product", key="product", fetch_page=fetch_products)
+        ```
+    """
+
+    def __init__(
+        self,
+        question: str | Template,
+        key: str,
+        fetch_page: PageFetcher | None = None,
+        stream: OptionsStream | None = None,
+        page_size: int = 10,
+    ):
+        """
+        Initialize a PagedPoolNode.
+
+        Args:
+            question: The question to ask the user; a Template to fill in
+                      placeholders (see twpm.core.template)
+            key: The key to store the selected option in the workflow data
+            fetch_page: Async function returning up to `limit` options
+                        starting at `offset`
+            stream: Alternative to fetch_page, a function returning an async
+                    iterator over every option; it is read up to the page
+                    being shown and kept open while the user browses
+            page_size: Number of options shown per page
+        """
+        if (fetch_page is None) == (stream is None):
+            raise ValueError("Exactly one of fetch_page or stream must be provided.")
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        super().__init__(key)
+        self.question = question
+        self.page_size = page_size
+        self._question = as_template(question)
+        self._stream_pages = _StreamPages(stream) if stream is not None else None
+        self._fetch_page = fetch_page or self._stream_pages
+        self._waiting_for_input = True
+
+        # Current page of this session
+        self.page = 0
+        self.options: list[PoolOption] = []
+        self._has_more = False
+        self._index: OptionIndex | None = None
+
+    @property
+    def offset(self) -> int:
+        return self.page * self.page_size
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        return self._question.names
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return (self.key,)
+
+    @override
+    @safe_execute()
+    async def execute(self, data: ListData, output: Output) -> NodeResult:
+        """
+        Display the current page of options and process the user's input.
+
+        Args:
+            data: Shared workflow data
+            output: Output interface for sending messages
+
+        Returns:
+            NodeResult indicating awaiting input or completed
+        """
+        if self._waiting_for_input:
+            self._waiting_for_input = False
+            await self._close_stream()
+            await self._show_page(0, data, output)
+            return self._awaiting("Waiting for selection")
+
+        user_input = data.get("_user_input", "")
+
+        # Options are matched first, so one labelled like a command is reachable
+        assert self._index is not None, "A page must be shown before input"
+        position = self._index.lookup(user_input)
+        if position is not None:
+            option = self.options[position]
+            data[self.key] = option.value
+            # Ask again from the first page if a loop brings the workflow back
+            self._waiting_for_input = True
+            await self._close_stream()
+
+            return NodeResult(
+                success=True,
+                data={},
+                message=f"Selected option: {option}",
+                is_awaiting_input=False,
+            )
+
+        command = normalize(user_input)
+
+        if command in _NEXT_COMMANDS and self._has_more:
+            await self._show_page(self.page + 1, data, output)
+            return self._awaiting(f"Showing page {self.page + 1}")
+
+        if command in _PREVIOUS_COMMANDS and self.page > 0:
+            await self._show_page(self.page - 1, data, output)
+            return self._awaiting(f"Showing page {self.page + 1}")
+
+        await output.send_text(f"{_INVALID_INPUT}\n{self._prompt()}")
+        return self._awaiting("Invalid input, waiting for valid input")
+
+    async def _show_page(self, page: int, data: ListData, output: Output) -> None:
+        # One extra option tells whether there is a next page
+        options = await self._fetch_page(
+            data, page * self.page_size, self.page_size + 1
+        )
+
+        self.page = page
+        self._has_more = len(options) > self.page_size
+        self.options = options[: self.page_size]
+        self._index = OptionIndex(self.options, start=self.offset + 1)
+
+        question = self._question.render(data)
+        lines = "".join(
+            f"  {number}. {option}\n"
+            for number, option in enumerate(self.options, self.offset + 1)
+        )
+        await output.send_text(f"\n? {question}:\n{lines}{self._prompt()}")
+
+    async def _close_stream(self) -> None:
+        if self._stream_pages is not None:
+            await self._stream_pages.close()
+
+    def _prompt(self) -> str:
+        if not self.options:
+            return _PREVIOUS_HINT if self.page > 0 else ""
+
+        prompt = _SELECT_PROMPT.format(self.offset + 1, self.offset + len(self.options))
+        if self._has_more:
+            prompt += f"\n{_NEXT_HINT}"
+        if self.page > 0:
+            prompt += f"\n{_PREVIOUS_HINT}"
+        return prompt
+
+    def _awaiting(self, message: str) -> NodeResult:
+        return NodeResult(
+            success=True, data={}, message=message, is_awaiting_input=True
+        )
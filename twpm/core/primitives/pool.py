@@ -4,8 +4,13 @@ from typing import override
 from twpm.core.base import ListData, Node, NodeResult
 from twpm.core.decorators import safe_execute
 from twpm.core.depedencies import Output
+from twpm.core.matching import FUZZY_INDEXES, OptionIndex
+from twpm.core.primitives.menu import MENUS, render_menu
+from twpm.core.template import Template, as_template
 
 _SELECT_PROMPT = "Select an option (1-{}):"
+_INVALID_INPUT = "Invalid input. Please enter a number or one of the options."
+_DID_YOU_MEAN = "Did you mean:\n"
 
 
 class PoolOption:
@@ -16,6 +21,9 @@ class PoolOption:
         self.display_text = display_text
         self.value = value if value is not None else display_text
 
+    def __str__(self) -> str:
+        return self.display_text
+
 
 AsyncPoolOptionsFunc = Callable[[ListData], Awaitable[list[PoolOption]]]
 PoolOptionsInput = list[PoolOption] | AsyncPoolOptionsFunc
@@ -26,28 +34,54 @@ class PoolNode(Node):
     Node that presents a list of options for the user to choose from.
 
     This node displays a question with multiple choice options and stores
-    the user's selection in the workflow data.
+    the user's selection in the workflow data. Users can answer with the
+    option number, its text or its value; typed text is matched ignoring
+    case, accents and extra spaces. Misspelled answers get "did you mean"
+    suggestions with the numbers of the closest options.
     """
 
-    def __init__(self, question: str, options: PoolOptionsInput, key: str):
+    def __init__(
+        self,
+        question: str | Template,
+        options: PoolOptionsInput,
+        key: str,
+        suggestions: int = 3,
+    ):
         """
         Initialize a PoolNode.
 
         Args:
-            question: The question to ask the user
+            question: The question to ask the user; a Template to fill in
+                      placeholders (see twpm.core.template)
             options: List of options to present to the user
             key: The key to store the selected option in the workflow data
+            suggestions: Maximum number of "did you mean" suggestions for
+                         misspelled answers, 0 disables them
         """
         super().__init__(key)
+        self.suggestions = suggestions
         self.question = question
+        self._question = as_template(question)
         self.options: list[PoolOption] = []
         self._options_input = options
         self._options_loaded = False
         self._waiting_for_input = True
+        self._menu: str | None = None
+        self._index: OptionIndex | None = None
 
         if isinstance(options, list):
             self.options = options
             self._options_loaded = True
+            self._menu = render_menu(options, _SELECT_PROMPT)
+            self._index = OptionIndex(options)
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        return self._question.names
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return (self.key,)
 
     @override
     @safe_execute()
@@ -71,39 +105,39 @@ class PoolNode(Node):
                 )
                 self.options = await self._options_input(data)
                 self._options_loaded = True
+                self._index = OptionIndex(self.options)
 
-            message = ""
-            message += f"\n? {self.question}:\n"
-            for i, option in enumerate(self.options, 1):
-                message += f"  {i}. {option}\n"
-
-            message += _SELECT_PROMPT.format(len(self.options))
-            await output.send_text(message)
+            question = self._question.render(data)
+            menu = self._menu or MENUS.get(self.options, _SELECT_PROMPT)
+            await output.send_text(f"\n? {question}:\n{menu}")
 
             self._waiting_for_input = False
 
             return NodeResult(
                 success=True,
                 data={},
-                message=f"Waiting for selection from: {self.question}",
+                message=f"Waiting for selection from: {question}",
                 is_awaiting_input=True,
             )
 
         user_input = data.get("_user_input", "")
         assert user_input is not None, "User input is required here"
 
-        try:
-            index = int(user_input.strip()) - 1
-            if 0 <= index < len(self.options):
-                data[self.key] = self.options[index].value
+        assert self._index is not None, "Options must be loaded before input"
+        index = self._index.lookup(user_input)
+        if index is not None:
+            data[self.key] = self.options[index].value
+            # Ask again if a loop brings the workflow back to this node
+            self._waiting_for_input = True
 
-                return NodeResult(
-                    success=True,
-                    data={},
-                    message=f"Selected option: {self.options[index]}",
-                    is_awaiting_input=False,
-                )
+            return NodeResult(
+                success=True,
+                data={},
+                message=f"Selected option: {self.options[index]}",
+                is_awaiting_input=False,
+            )
 
+        if user_input.strip().isdecimal():
             max_opt = len(self.options)
             await output.send_text(_SELECT_PROMPT.format(max_opt))
 
@@ -113,12 +147,44 @@ class PoolNode(Node):
                 message="Invalid selection, waiting for valid input",
                 is_awaiting_input=True,
             )
-        except ValueError:
-            await output.send_text("Invalid input. Please enter a number.")
+
+        candidates = self._suggest(user_input)
+        if candidates:
+            lines = "".join(f"  {i + 1}. {self.options[i]}\n" for i in candidates)
+            await output.send_text(
+                _DID_YOU_MEAN + lines + _SELECT_PROMPT.format(len(self.options))
+            )
 
             return NodeResult(
                 success=True,
                 data={},
-                message="Invalid input format, waiting for valid input",
+                message="No exact match, suggested similar options",
                 is_awaiting_input=True,
             )
+
+        await output.send_text(_INVALID_INPUT)
+
+        return NodeResult(
+            success=True,
+            data={},
+            message="Invalid input format, waiting for valid input",
+            is_awaiting_input=True,
+        )
+
+    def _suggest(self, user_input: str) -> list[int]:
+        """Positions of the options closest to a misspelled answer."""
+        if self.suggestions <= 0:
+            return []
+
+        # Sessions loading options from the same function share one index,
+        # as do nodes sharing a static option list. The cache entry holds a
+        # reference to the list, so its id is not reused while cached
+        if callable(self._options_input):
+            source = self._options_input
+        else:
+            source = ("options", id(self.options))
+
+        index = FUZZY_INDEXES.get(source, self.options)
+        return [
+            position for position, _ in index.search(user_input, limit=self.suggestions)
+        ]
@@ -3,6 +3,7 @@ from typing import override
 from twpm.core.base import ListData, Node, NodeResult
 from twpm.core.decorators import safe_execute
 from twpm.core.depedencies import Output
+from twpm.core.template import Template, as_template
 
 
 class ProgressNode(Node):
@@ -16,7 +17,7 @@ class ProgressNode(Node):
     def __init__(
         self,
         fields: list[tuple[str, str]],
-        title: str | None = None,
+        title: str | Template | None = None,
         key: str = "progress",
     ):
         """
@@ -24,12 +25,25 @@ class ProgressNode(Node):
 
         Args:
             fields: List of tuples (label, data_key) representing the fields to track
-            title: Optional title to display before the progress list
+            title: Optional title to display before the progress list,
+                   plain text or a Template
             key: Unique key for this node (default: "progress")
         """
         super().__init__(key)
         self.fields = fields
         self.title = title
+        self._title = as_template(title) if title else None
+        self._field_keys = tuple(data_key for _, data_key in fields)
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        if self._title is None:
+            return self._field_keys
+        return tuple(dict.fromkeys(self._field_keys + self._title.names))
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return ()
 
     @override
     @safe_execute()
@@ -45,13 +59,13 @@ class ProgressNode(Node):
         """
         message = ""
 
-        if self.title:
-            message += f"\n{self.title}\n"
+        if self._title is not None:
+            message += f"\n{self._title.render(data)}\n"
         else:
             message += "\n"
 
-        for label, data_key in self.fields:
-            value = data.get(data_key)
+        values = data.get_many(self._field_keys)
+        for (label, _), value in zip(self.fields, values):
             if value is not None:
                 message += f"✅ {value}\n"
             else:
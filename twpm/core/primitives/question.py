@@ -3,6 +3,7 @@ from typing import override
 from twpm.core.base import ListData, Node, NodeResult
 from twpm.core.decorators import safe_execute
 from twpm.core.depedencies import Output
+from twpm.core.template import Template, as_template
 
 
 class QuestionNode(Node):
@@ -13,18 +14,28 @@ class QuestionNode(Node):
     in the workflow data using the specified key.
     """
 
-    def __init__(self, question: str, key: str):
+    def __init__(self, question: str | Template, key: str):
         """
         Initialize a QuestionNode.
 
         Args:
-            question: The question to ask the user
+            question: The question to ask the user; a Template to fill in
+                      placeholders (see twpm.core.template)
             key: The key to store the answer in the workflow data
         """
         super().__init__(key)
         self.question = question
+        self._question = as_template(question)
         self._waiting_for_input = True
 
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        return self._question.names
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return (self.key,)
+
     @override
     @safe_execute()
     async def execute(self, data: ListData, output: Output) -> NodeResult:
@@ -42,18 +53,21 @@ class QuestionNode(Node):
         """
         if self._waiting_for_input:
             # First execution: display the question and wait for input
-            await output.send_text(f"\n? {self.question}: ")
+            question = self._question.render(data)
+            await output.send_text(f"\n? {question}: ")
             self._waiting_for_input = False
 
             return NodeResult(
                 success=True,
                 data={},
-                message=f"Waiting for answer to: {self.question}",
+                message=f"Waiting for answer to: {question}",
                 is_awaiting_input=True,
             )
         # Second execution: process the user's input
         user_input = data.get("_user_input", "")
         data[self.key] = user_input
+        # Ask again if a loop brings the workflow back to this node
+        self._waiting_for_input = True
 
         return NodeResult(
             success=True,
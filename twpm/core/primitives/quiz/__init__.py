@@ -1,4 +1,17 @@
+from twpm.core.primitives.quiz.question_bank import (
+    BankQuestion,
+    QuestionBank,
+    QuestionBankNode,
+    QuestionBankSummaryNode,
+)
 from twpm.core.primitives.quiz.quiz_node import QuizNode
 from twpm.core.primitives.quiz.quiz_summary import QuizSummaryNode
 
-__all__ = ["QuizNode", "QuizSummaryNode"]
+__all__ = [
+    "QuizNode",
+    "QuizSummaryNode",
+    "BankQuestion",
+    "QuestionBank",
+    "QuestionBankNode",
+    "QuestionBankSummaryNode",
+]
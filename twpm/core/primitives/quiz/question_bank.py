@@ -0,0 +1,338 @@
+import random
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple, override
+
+from twpm.core.base import ListData, Node, NodeResult
+from twpm.core.decorators import safe_execute
+from twpm.core.depedencies import Output
+from twpm.core.primitives.menu import render_menu
+from twpm.core.template import Template, as_template
+
+_SELECT_PROMPT = "Selecione uma opção (1-{}):"
+
+# Seeds of option shuffles are derived from the session seed and the question
+_SHUFFLE_STRIDE = 1_000_003
+
+
+class _BankQuestionFields(NamedTuple):
+    question: str
+    options: tuple[str, ...]
+    answer: int
+
+
+class BankQuestion(_BankQuestionFields):
+    """
+    A question stored in a QuestionBank.
+
+    Attributes:
+        question: The question text
+        options: The options, in their original order
+        answer: Index of the correct option
+
+    Raises:
+        ValueError: If answer is not the index of one of the options
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, question: str, options: tuple[str, ...], answer: int):
+        # NamedTuple forbids overriding __new__ in its own body
+        if isinstance(answer, bool) or not 0 <= answer < len(options):
+            raise ValueError(
+                f"Resposta esperada {answer!r} deve ser o índice de uma das "
+                f"opções fornecidas em '{question}'"
+            )
+        return super().__new__(cls, question, tuple(options), answer)
+
+
+class QuestionBank:
+    """
+    Immutable set of quiz questions shared by every session.
+
+    Sessions never copy questions: they keep a seed and indices into the
+    bank, and the bank derives the sampled questions and the shuffled
+    option order from them.
+
+    Example:
+        ```python
+        bank = QuestionBank([
+            ("1 + 1?", ["1", "2", "3"], "2"),
+            ("Capital of Portugal?", ["Porto", "Lisboa"], "Lisboa"),
+            ...
+        ])
+        quiz = QuestionBankNode(bank, count=5, key="quiz")
+        summary = QuestionBankSummaryNode(bank, quiz_key="quiz", title="Resultado")
+        ```
+    """
+
+    def __init__(
+        self, questions: Iterable[BankQuestion | tuple[str, Sequence[str], str]]
+    ):
+        """
+        Initialize a QuestionBank.
+
+        Args:
+            questions: BankQuestion instances, or (question, options,
+                       expected_answer) tuples where expected_answer is one
+                       of the options
+
+        Raises:
+            ValueError: If an expected answer is not one of its options
+        """
+        self._questions: list[BankQuestion] = []
+
+        for item in questions:
+            if isinstance(item, BankQuestion):
+                question = item
+            else:
+                text, options, expected_answer = item
+                if expected_answer not in options:
+                    raise ValueError(
+                        f"Resposta esperada '{expected_answer}' deve ser uma das "
+                        f"opções fornecidas em '{text}'"
+                    )
+                question = BankQuestion(
+                    text, tuple(options), list(options).index(expected_answer)
+                )
+            self._questions.append(question)
+
+    def __len__(self) -> int:
+        return len(self._questions)
+
+    def __getitem__(self, index: int) -> BankQuestion:
+        return self._questions[index]
+
+    def sample(self, seed: int, count: int) -> list[int]:
+        """
+        Pick `count` distinct questions for a session.
+
+        Returns:
+            Indices of the sampled questions, in the order they are asked
+        """
+        return random.Random(seed).sample(range(len(self._questions)), count)
+
+    def option_order(self, seed: int, index: int) -> list[int]:
+        """
+        Shuffle the options of a question for a session.
+
+        Returns:
+            Option indices in the order they are displayed
+        """
+        order = list(range(len(self._questions[index].options)))
+        random.Random(seed * _SHUFFLE_STRIDE + index).shuffle(order)
+        return order
+
+
+def _join(indices: Iterable[int]) -> str:
+    return ",".join(map(str, indices))
+
+
+def _split(value: str | None) -> list[int]:
+    return [int(index) for index in value.split(",")] if value else []
+
+
+class QuestionBankNode(Node):
+    """
+    Node that asks `count` questions sampled from a QuestionBank.
+
+    Each session gets its own sample and option order from a random seed.
+    Only indices are stored in the workflow data:
+
+        - `{key}_seed`: the session's seed
+        - `{key}_questions`: indices of the sampled questions
+        - `{key}_answers`: index of the option chosen for each question
+          answered so far, in the bank's original option order
+
+    Score the answers with QuestionBankSummaryNode.
+    """
+
+    def __init__(
+        self,
+        bank: QuestionBank,
+        count: int,
+        key: str,
+        seed: int | None = None,
+    ):
+        """
+        Initialize a QuestionBankNode.
+
+        Args:
+            bank: The bank to sample questions from
+            count: Number of questions asked per session
+            key: Prefix of the keys stored in the workflow data
+            seed: Fixed seed giving every session the same quiz; a random
+                  seed per session if None
+        """
+        if not 1 <= count <= len(bank):
+            raise ValueError(f"count must be between 1 and {len(bank)}")
+
+        super().__init__(key)
+        self.bank = bank
+        self.count = count
+        self.seed = seed
+        self._waiting_for_input = True
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return (f"{self.key}_seed", f"{self.key}_questions", f"{self.key}_answers")
+
+    @override
+    @safe_execute()
+    async def execute(self, data: ListData, output: Output) -> NodeResult:
+        """
+        Ask the next question of the session or record the answer.
+
+        Args:
+            data: Shared workflow data
+            output: Output interface for sending messages
+
+        Returns:
+            NodeResult awaiting input until every question is answered
+        """
+        if self._waiting_for_input:
+            seed = self.seed if self.seed is not None else random.getrandbits(32)
+            data[f"{self.key}_seed"] = str(seed)
+            data[f"{self.key}_questions"] = _join(self.bank.sample(seed, self.count))
+            data[f"{self.key}_answers"] = ""
+            self._waiting_for_input = False
+            return await self._ask(data, output)
+
+        seed = int(data[f"{self.key}_seed"])
+        questions = _split(data.get(f"{self.key}_questions"))
+        answers = _split(data.get(f"{self.key}_answers"))
+        index = questions[len(answers)]
+        order = self.bank.option_order(seed, index)
+
+        user_input = data.get("_user_input", "").strip()
+        if not (user_input.isdecimal() and 1 <= int(user_input) <= len(order)):
+            await output.send_text(_SELECT_PROMPT.format(len(order)))
+            return NodeResult(
+                success=True,
+                data={},
+                message="Seleção inválida, aguardando entrada válida",
+                is_awaiting_input=True,
+            )
+
+        answers.append(order[int(user_input) - 1])
+        data[f"{self.key}_answers"] = _join(answers)
+
+        if len(answers) < len(questions):
+            return await self._ask(data, output)
+
+        # Start a new sample if a loop brings the workflow back to this node
+        self._waiting_for_input = True
+        return NodeResult(
+            success=True,
+            data={},
+            message=f"Quiz respondido: {len(answers)} perguntas",
+            is_awaiting_input=False,
+        )
+
+    async def _ask(self, data: ListData, output: Output) -> NodeResult:
+        seed = int(data[f"{self.key}_seed"])
+        questions = _split(data.get(f"{self.key}_questions"))
+        number = len(_split(data.get(f"{self.key}_answers")))
+        index = questions[number]
+        question = self.bank[index]
+
+        options = [question.options[i] for i in self.bank.option_order(seed, index)]
+        menu = render_menu(options, _SELECT_PROMPT)
+        await output.send_text(
+            f"\n? ({number + 1}/{len(questions)}) {question.question}:\n{menu}"
+        )
+
+        return NodeResult(
+            success=True,
+            data={},
+            message=f"Aguardando resposta para: {question.question}",
+            is_awaiting_input=True,
+        )
+
+
+class QuestionBankSummaryNode(Node):
+    """
+    Node that scores the answers of a QuestionBankNode from their indices.
+
+    Writes `{key}_score`, `{key}_score_total` and `{key}_score_percentage`,
+    like QuizSummaryNode.
+    """
+
+    def __init__(
+        self,
+        bank: QuestionBank,
+        quiz_key: str,
+        title: str | Template,
+        key: str = "quiz_summary",
+    ):
+        """
+        Initialize a QuestionBankSummaryNode.
+
+        Args:
+            bank: The bank the quiz sampled its questions from
+            quiz_key: Key of the QuestionBankNode
+            title: The title to display before the results, plain text or
+                   a Template
+            key: Unique key for this node (default: "quiz_summary")
+        """
+        super().__init__(key)
+        self.bank = bank
+        self.quiz_key = quiz_key
+        self.title = title
+        self._title = as_template(title)
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        keys = (f"{self.quiz_key}_questions", f"{self.quiz_key}_answers")
+        return tuple(dict.fromkeys(keys + self._title.names))
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        score_key = f"{self.key}_score"
+        return (score_key, f"{score_key}_total", f"{score_key}_percentage")
+
+    @override
+    @safe_execute()
+    async def execute(self, data: ListData, output: Output) -> NodeResult:
+        """
+        Display the quiz results and store the score.
+
+        Args:
+            data: Shared workflow data containing the quiz indices
+            output: Output interface for sending messages
+
+        Returns:
+            NodeResult indicating success with the displayed summary
+        """
+        questions = _split(data.get(f"{self.quiz_key}_questions"))
+        answers = _split(data.get(f"{self.quiz_key}_answers"))
+
+        message = f"{self._title.render(data)}\n\n"
+        correct_count = 0
+
+        for index, answer in zip(questions, answers):
+            question = self.bank[index]
+            expected = question.options[question.answer]
+            if answer == question.answer:
+                correct_count += 1
+                message += f"✅ {expected}\n"
+            else:
+                message += f"❌ {expected} - {question.options[answer]}\n"
+
+        total_count = len(questions)
+        score_key = f"{self.key}_score"
+        data[score_key] = str(correct_count)
+        data[f"{score_key}_total"] = str(total_count)
+        data[f"{score_key}_percentage"] = str(
+            round((correct_count / total_count * 100) if total_count > 0 else 0, 1)
+        )
+
+        message += f"\nVocê acertou {correct_count} das {total_count} perguntas.\n"
+
+        await output.send_text(message)
+
+        return NodeResult(
+            success=True,
+            data={},
+            message="Resumo do quiz exibido",
+            is_awaiting_input=False,
+        )
@@ -3,6 +3,8 @@ from typing import override
 from twpm.core.base import ListData, Node, NodeResult
 from twpm.core.decorators import safe_execute
 from twpm.core.depedencies import Output
+from twpm.core.primitives.menu import render_menu
+from twpm.core.template import Template, as_template
 
 _SELECT_PROMPT = "Selecione uma opção (1-{}):"
 
@@ -17,19 +19,25 @@ class QuizNode(Node):
     """
 
     def __init__(
-        self, question: str, options: list[str], expected_answer: str, key: str
+        self,
+        question: str | Template,
+        options: list[str],
+        expected_answer: str,
+        key: str,
     ):
         """
         Initialize a QuizNode.
 
         Args:
-            question: The quiz question to ask the user
+            question: The quiz question to ask the user; a Template to
+                      fill in placeholders (see twpm.core.template)
             options: List of options to present to the user
             expected_answer: The correct answer (must be one of the options)
             key: The key to store the quiz result in the workflow data
         """
         super().__init__(key)
         self.question = question
+        self._question = as_template(question)
         self.options = options
         self.expected_answer = expected_answer
         self._waiting_for_input = True
@@ -39,6 +47,16 @@ class QuizNode(Node):
                 f"Resposta esperada '{expected_answer}' deve ser uma das opções fornecidas"
             )
 
+        self._menu = render_menu(options, _SELECT_PROMPT)
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        return self._question.names
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return (self.key, f"{self.key}_expected", f"{self.key}_correct")
+
     @override
     @safe_execute()
     async def execute(self, data: ListData, output: Output) -> NodeResult:
@@ -56,20 +74,15 @@ class QuizNode(Node):
             NodeResult indicating awaiting input or completed
         """
         if self._waiting_for_input:
-            message = ""
-            message += f"\n? {self.question}:\n"
-            for i, option in enumerate(self.options, 1):
-                message += f"  {i}. {option}\n"
-
-            message += _SELECT_PROMPT.format(len(self.options))
-            await output.send_text(message)
+            question = self._question.render(data)
+            await output.send_text(f"\n? {question}:\n{self._menu}")
 
             self._waiting_for_input = False
 
             return NodeResult(
                 success=True,
                 data={},
-                message=f"Aguardando resposta para: {self.question}",
+                message=f"Aguardando resposta para: {question}",
                 is_awaiting_input=True,
             )
 
@@ -84,6 +97,8 @@ class QuizNode(Node):
                 data[self.key] = selected_answer
                 data[f"{self.key}_expected"] = self.expected_answer
                 data[f"{self.key}_correct"] = "true" if is_correct else "false"
+                # Ask again if a loop brings the workflow back to this node
+                self._waiting_for_input = True
 
                 return NodeResult(
                     success=True,
@@ -3,6 +3,7 @@ from typing import override
 from twpm.core.base import ListData, Node, NodeResult
 from twpm.core.decorators import safe_execute
 from twpm.core.depedencies import Output
+from twpm.core.template import Template, as_template
 
 
 class QuizSummaryNode(Node):
@@ -15,7 +16,7 @@ class QuizSummaryNode(Node):
 
     def __init__(
         self,
-        title: str,
+        title: str | Template,
         quiz_keys: list[str],
         key: str = "quiz_summary",
     ):
@@ -23,13 +24,28 @@ class QuizSummaryNode(Node):
         Initialize a QuizSummaryNode.
 
         Args:
-            title: The title message to display before the quiz summary
+            title: The title to display before the quiz summary, plain
+                   text or a Template
             quiz_keys: List of keys used to store quiz results (from QuizNode)
             key: Unique key for this node (default: "quiz_summary")
         """
         super().__init__(key)
         self.title = title
         self.quiz_keys = quiz_keys
+        self._title = as_template(title)
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        keys = []
+        for quiz_key in self.quiz_keys:
+            keys.extend((quiz_key, f"{quiz_key}_expected", f"{quiz_key}_correct"))
+        keys.extend(self._title.names)
+        return tuple(dict.fromkeys(keys))
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        score_key = f"{self.key}_score" if self.key else "quiz_score"
+        return (score_key, f"{score_key}_total", f"{score_key}_percentage")
 
     @override
     @safe_execute()
@@ -44,7 +60,7 @@ class QuizSummaryNode(Node):
         Returns:
             NodeResult indicating success with the displayed summary
         """
-        message = f"{self.title}\n\n"
+        message = f"{self._title.render(data)}\n\n"
 
         correct_count = 0
         total_count = len(self.quiz_keys)
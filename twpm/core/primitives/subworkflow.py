@@ -0,0 +1,102 @@
+from collections.abc import Iterable
+from enum import Enum
+from typing import override
+
+from twpm.core.base import ListData, Node, NodeResult, SubworkflowCall
+from twpm.core.decorators import safe_execute
+from twpm.core.registry import WorkflowRegistry
+
+
+class DataScope(Enum):
+    """How a subworkflow sees the caller's data."""
+
+    # The subworkflow reads and writes the caller's data directly
+    SHARED = "shared"
+    # The subworkflow runs on its own data; inputs are copied in and
+    # outputs copied back when it returns
+    ISOLATED = "isolated"
+
+
+class SubworkflowNode(Node):
+    """
+    Node that runs another registered workflow and then continues with
+    its own next node.
+
+    Common sections (e.g. collecting an address) are registered once in
+    the WorkflowRegistry and called from any workflow instead of being
+    copied into every chain. Each call builds a fresh graph of the latest
+    registered version, so sessions never share node state. The
+    orchestrator keeps the call stack and returns to the caller when the
+    subworkflow finishes.
+
+    The registry is injected from the container, so it must be registered:
+
+    Example:
+        ```python
+        registry = WorkflowRegistry()
+        registry.register("address", create_address_chain)
+        container.register(WorkflowRegistry, lambda: registry, ServiceScope.SINGLETON)
+
+        chain = (
+            Chain()
+            .add(QuestionNode("Name", key="name"))
+            .add(SubworkflowNode("address", inputs=["name"], outputs=["city"]))
+            .add(SummaryNode(title="Done", fields=[("City", "city")]))
+            .build()
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        workflow: str,
+        scope: DataScope | str = DataScope.ISOLATED,
+        inputs: Iterable[str] = (),
+        outputs: Iterable[str] | None = None,
+        key: str | None = None,
+    ):
+        """
+        Initialize a SubworkflowNode.
+
+        Args:
+            workflow: Name of the registered workflow to call
+            scope: Data scope of the call, DataScope or its value
+            inputs: Keys copied into an isolated subworkflow's data
+            outputs: Keys copied back from an isolated subworkflow's data;
+                     every key is copied back if None
+            key: Unique identifier for this node, defaults to the workflow name
+        """
+        super().__init__(key or workflow)
+        self.workflow = workflow
+        self.scope = DataScope(scope)
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs) if outputs is not None else None
+
+        if self.scope is DataScope.SHARED and (self.inputs or self.outputs):
+            raise ValueError("inputs and outputs only apply to an isolated scope")
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        return self.inputs
+
+    @override
+    def output_keys(self) -> tuple[str, ...] | None:
+        return self.outputs
+
+    @override
+    @safe_execute()
+    async def execute(self, data: ListData, registry: WorkflowRegistry) -> NodeResult:
+        head, sub_data = registry.instantiate(self.workflow)
+
+        if self.scope is DataScope.SHARED:
+            call = SubworkflowCall(head, data)
+        else:
+            sub_data.update({key: data[key] for key in self.inputs if data.has(key)})
+            call = SubworkflowCall(head, sub_data, self.outputs)
+
+        return NodeResult(
+            success=True,
+            data={},
+            message=f"Calling workflow {self.workflow}",
+            call=call,
+        )
@@ -3,6 +3,7 @@ from typing import override
 from twpm.core.base import ListData, Node, NodeResult
 from twpm.core.decorators import safe_execute
 from twpm.core.depedencies import Output
+from twpm.core.template import Template, as_template
 
 
 class SummaryNode(Node):
@@ -14,7 +15,7 @@ class SummaryNode(Node):
 
     def __init__(
         self,
-        title: str,
+        title: str | Template,
         fields: list[tuple[str, str]],
         key: str = "summary",
     ):
@@ -22,13 +23,24 @@ class SummaryNode(Node):
         Initialize a SummaryNode.
 
         Args:
-            title: The title message to display before the summary
+            title: The title to display before the summary, plain text or
+                   a Template
             fields: List of tuples (label, data_key) to display in the summary
             key: Unique key for this node (default: "summary")
         """
         super().__init__(key)
         self.title = title
         self.fields = fields
+        self._title = as_template(title)
+        self._field_keys = tuple(data_key for _, data_key in fields)
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(self._field_keys + self._title.names))
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return ()
 
     @override
     @safe_execute()
@@ -42,10 +54,9 @@ class SummaryNode(Node):
         Returns:
             NodeResult indicating success with the displayed summary
         """
-        message = f"{self.title}\n"
+        message = f"{self._title.render(data)}\n"
 
-        for _, data_key in self.fields:
-            value = data.get(data_key, "-")
+        for value in data.get_many(self._field_keys, "-"):
             message += f"✅ {value}\n"
 
         await output.send_text(message)
@@ -1,8 +1,10 @@
+from collections.abc import Mapping
 from typing import Callable, override
 
 from twpm.core.base import ListData, Node, NodeResult
 from twpm.core.cursor import Cursor
 from twpm.core.decorators import safe_execute
+from twpm.core.expressions import compile_expression
 
 SwitchFunc = Callable[[ListData], str]
 
@@ -12,13 +14,24 @@ class SwitchNode(Node):
         self.switch_func: SwitchFunc | None = None
         self.case_nodes: dict[str, Node] = {}
         self.default_node: Node | None = None
+        self._spliced = False
         super().__init__(key)
 
+    @override
+    def relink(self, clones: Mapping[int, Node]) -> None:
+        self.case_nodes = {
+            case: clones.get(id(node), node) for case, node in self.case_nodes.items()
+        }
+        if self.default_node is not None:
+            self.default_node = clones.get(id(self.default_node), self.default_node)
+
     @override
     @safe_execute()
     async def execute(self, data: ListData) -> NodeResult:
-        if self.switch_func is None:
-            raise ValueError("Condition function is not set.")
+        if not self.verified:
+            problems = self.validate()
+            if problems:
+                raise ValueError(problems[0])
 
         case = self.switch_func(data)
         if case in self.case_nodes:
@@ -26,18 +39,57 @@ class SwitchNode(Node):
         else:
             next_node = self.default_node
 
-        assert next_node is not None, "Next node is not set."
-        Cursor.insert(self, next_node)
+        if not self._spliced:
+            Cursor.link_branches(self)
+            self._spliced = True
+        self.next = next_node
 
         result = NodeResult(success=True, data={}, message="")
         return result
 
+    @override
+    def branches(self) -> list[Node]:
+        nodes = list(self.case_nodes.values())
+        if self.default_node is not None:
+            nodes.append(self.default_node)
+        return nodes
+
+    @override
+    def input_keys(self) -> tuple[str, ...]:
+        return getattr(self.switch_func, "names", ())
+
+    @override
+    def output_keys(self) -> tuple[str, ...]:
+        return ()
+
+    @override
+    def validate(self) -> list[str]:
+        problems = []
+        if self.switch_func is None:
+            problems.append("Condition function is not set.")
+        if self.default_node is None:
+            problems.append("Default node is not set.")
+        return problems
+
     def set_switch(
         self,
-        condition_func: SwitchFunc,
+        condition_func: SwitchFunc | str,
         case_nodes: dict[str, Node],
         default_node: Node,
     ) -> None:
+        """
+        Configure the switch function and its cases.
+
+        Args:
+            condition_func: Callable receiving the workflow data and returning
+                            a case name, or an expression string
+                            (see twpm.core.expressions)
+            case_nodes: Mapping of case name to the branch to insert
+            default_node: Branch inserted when no case matches
+        """
+        if isinstance(condition_func, str):
+            condition_func = compile_expression(condition_func)
+
         self.switch_func = condition_func
         self.case_nodes = case_nodes
         self.default_node = default_node
@@ -0,0 +1,249 @@
+"""
+Versioned workflow registry.
+
+The registry keeps several versions of each workflow side by side. New
+sessions start on the latest version, running sessions stay pinned to the
+version they started on, and older versions are evicted as soon as their
+last session ends. This lets a long-lived worker hot-reload workflows
+without restarting or breaking in-flight conversations.
+"""
+
+import itertools
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from twpm.core.base import ListData, Node
+from twpm.core.definitions import CompiledWorkflow, Functions, load_definition
+from twpm.core.layout import DataLayout
+
+WorkflowBuilder = Callable[[], Node]
+
+
+@dataclass
+class WorkflowVersion:
+    """
+    A registered version of a workflow.
+
+    Attributes:
+        name: Workflow name
+        version: Version identifier
+        builder: Creates a fresh node graph for a new session
+        digest: Content hash for versions loaded from definitions
+        sessions: Number of sessions pinned to this version
+        layout: Data layout, compiled when the first session starts
+    """
+
+    name: str
+    version: str
+    builder: WorkflowBuilder
+    digest: str | None = None
+    sessions: int = 0
+    layout: DataLayout | None = None
+
+
+@dataclass
+class WorkflowSession:
+    """
+    A session pinned to a workflow version.
+
+    Attributes:
+        session_id: Identifier of the session
+        workflow: The workflow version the session runs on
+        head: Head node of the session's node graph
+        data: Session data, laid out for the pinned version
+    """
+
+    session_id: str
+    workflow: WorkflowVersion
+    head: Node
+    data: ListData
+
+    @property
+    def version(self) -> str:
+        return self.workflow.version
+
+
+class WorkflowRegistry:
+    """
+    Registry of workflow versions with session pinning.
+
+    Example:
+        ```python
+        registry = WorkflowRegistry()
+        registry.register("onboarding", create_chain)
+
+        session = registry.start_session("user-1", "onboarding")
+        orchestrator.start(session.session_id, session.head, data=session.data)
+        ...
+        registry.reload("onboarding", "workflows/onboarding.json")  # new sessions only
+        ...
+        registry.end_session("user-1")
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._versions: dict[str, dict[str, WorkflowVersion]] = {}
+        self._latest: dict[str, str] = {}
+        self._sessions: dict[str, WorkflowSession] = {}
+        self._counter = itertools.count(1)
+
+    def register(
+        self,
+        name: str,
+        workflow: CompiledWorkflow | WorkflowBuilder,
+        version: str | None = None,
+        functions: Functions | None = None,
+    ) -> WorkflowVersion:
+        """
+        Register a new version of a workflow and make it the latest.
+
+        Args:
+            name: Workflow name
+            workflow: A compiled workflow, or a callable that builds a fresh chain
+            version: Version identifier; defaults to the compiled workflow's
+                     version, or an increasing counter for callables
+            functions: Functions used to build a compiled workflow
+
+        Returns:
+            The registered WorkflowVersion
+
+        Raises:
+            ValueError: If the version is already registered for the workflow
+        """
+        digest = None
+        if isinstance(workflow, CompiledWorkflow):
+            compiled = workflow
+            digest = compiled.digest
+            version = version or compiled.version
+
+            def builder() -> Node:
+                return compiled.build(functions)
+
+        else:
+            builder = workflow
+
+        version = version or str(next(self._counter))
+        versions = self._versions.setdefault(name, {})
+        if version in versions:
+            raise ValueError(f"Workflow '{name}' version '{version}' already exists")
+
+        entry = WorkflowVersion(name, version, builder, digest=digest)
+        versions[version] = entry
+
+        previous = self._latest.get(name)
+        self._latest[name] = version
+        if previous is not None:
+            self._evict_if_unused(versions[previous])
+
+        return entry
+
+    def reload(
+        self,
+        name: str,
+        path: str | Path,
+        functions: Functions | None = None,
+        cache_dir: str | Path | None = None,
+    ) -> WorkflowVersion:
+        """
+        Load a workflow definition file and register it if it changed.
+
+        Args:
+            name: Workflow name
+            path: Path of the JSON definition
+            functions: Functions referenced by the definition
+            cache_dir: Optional directory for compiled workflows
+
+        Returns:
+            The latest WorkflowVersion, unchanged if the file content is the
+            same as the latest registered version
+        """
+        compiled = load_definition(path, cache_dir=cache_dir)
+
+        latest = self.latest(name) if name in self._latest else None
+        if latest is not None and latest.digest == compiled.digest:
+            return latest
+
+        version = compiled.version
+        if version in self._versions.get(name, {}):
+            version = f"{version}+{compiled.digest[:12]}"
+
+        return self.register(name, compiled, version=version, functions=functions)
+
+    def latest(self, name: str) -> WorkflowVersion:
+        """
+        Get the latest version of a workflow.
+
+        Raises:
+            KeyError: If the workflow is not registered
+        """
+        return self._versions[name][self._latest[name]]
+
+    def versions(self, name: str) -> list[str]:
+        """List the versions of a workflow still held by the registry."""
+        return list(self._versions.get(name, {}))
+
+    def start_session(self, session_id: str, name: str) -> WorkflowSession:
+        """
+        Start a session on the latest version of a workflow.
+
+        Args:
+            session_id: Identifier of the session
+            name: Workflow name
+
+        Returns:
+            The new WorkflowSession with a fresh node graph
+
+        Raises:
+            KeyError: If the workflow is not registered
+            ValueError: If the session is already running
+        """
+        if session_id in self._sessions:
+            raise ValueError(f"Session '{session_id}' is already running")
+
+        workflow = self.latest(name)
+        head, data = self._instantiate(workflow)
+
+        session = WorkflowSession(
+            session_id=session_id, workflow=workflow, head=head, data=data
+        )
+        workflow.sessions += 1
+        self._sessions[session_id] = session
+        return session
+
+    def instantiate(self, name: str) -> tuple[Node, ListData]:
+        """
+        Build a fresh node graph and data of the latest version of a
+        workflow without starting a session, e.g. to run it as a subworkflow.
+
+        Raises:
+            KeyError: If the workflow is not registered
+        """
+        return self._instantiate(self.latest(name))
+
+    def get_session(self, session_id: str) -> WorkflowSession | None:
+        """Get a running session, or None if it doesn't exist."""
+        return self._sessions.get(session_id)
+
+    def end_session(self, session_id: str) -> None:
+        """
+        End a session, evicting its version if it was the last user of an
+        outdated version. Unknown sessions are ignored.
+        """
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+
+        session.workflow.sessions -= 1
+        self._evict_if_unused(session.workflow)
+
+    def _instantiate(self, workflow: WorkflowVersion) -> tuple[Node, ListData]:
+        head = workflow.builder()
+        if workflow.layout is None:
+            workflow.layout = DataLayout.from_chain(head)
+        return head, workflow.layout.new_data()
+
+    def _evict_if_unused(self, workflow: WorkflowVersion) -> None:
+        if workflow.sessions > 0 or self._latest.get(workflow.name) == workflow.version:
+            return
+        self._versions[workflow.name].pop(workflow.version, None)
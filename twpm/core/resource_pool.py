@@ -0,0 +1,225 @@
+"""
+Bounded async pools of reusable resources.
+
+Used by the Container for POOLED services: database connections, HTTP
+clients and other resources that are expensive to create and should be
+shared between nodes instead of opened on every execution.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+ResourceFactory = Callable[[], Any | Awaitable[Any]]
+ResourceCheck = Callable[[Any], bool | Awaitable[bool]]
+ResourceClose = Callable[[Any], Any | Awaitable[Any]]
+
+
+async def _maybe_await(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class ResourcePool:
+    """
+    A bounded pool of resources with health checks and idle eviction.
+
+    At most `max_size` resources exist at the same time; acquiring from an
+    exhausted pool waits until a resource is released. Idle resources are
+    reused most-recently-released first and closed once they have been
+    idle for longer than `idle_timeout`.
+
+    Example:
+        ```python
+        pool = ResourcePool(connect, max_size=5, close=lambda conn: conn.close())
+
+        async with pool.lease() as conn:
+            await conn.execute("SELECT 1")
+
+        await pool.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        factory: ResourceFactory,
+        max_size: int = 10,
+        health_check: ResourceCheck | None = None,
+        idle_timeout: float | None = None,
+        close: ResourceClose | None = None,
+    ):
+        """
+        Initialize a ResourcePool.
+
+        Args:
+            factory: Creates a new resource, sync or async
+            max_size: Maximum number of resources alive at the same time
+            health_check: Optional check run before reusing an idle resource;
+                          resources failing it are closed and replaced
+            idle_timeout: Seconds a resource may stay idle before being closed
+            close: Optional function that closes a resource, sync or async
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self._factory = factory
+        self._health_check = health_check
+        self._idle_timeout = idle_timeout
+        self._close = close
+        self.max_size = max_size
+
+        self._idle: deque[tuple[Any, float]] = deque()
+        self._slots = asyncio.Semaphore(max_size)
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._released = asyncio.Event()
+
+    @property
+    def size(self) -> int:
+        """Number of resources currently alive, idle or in use."""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Number of idle resources ready to be reused."""
+        return len(self._idle)
+
+    @property
+    def in_use(self) -> int:
+        """Number of resources currently leased."""
+        return self._in_use
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def acquire(self) -> Any:
+        """
+        Take a resource from the pool, creating one if none is idle.
+
+        Raises:
+            RuntimeError: If the pool is closed
+        """
+        if self._closed:
+            raise RuntimeError("Resource pool is closed")
+
+        await self._slots.acquire()
+        try:
+            if self._closed:
+                raise RuntimeError("Resource pool is closed")
+            await self.evict_idle()
+            resource = await self._reuse_idle()
+            if resource is None:
+                resource = await _maybe_await(self._factory())
+                self._size += 1
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._in_use += 1
+        return resource
+
+    async def release(self, resource: Any, discard: bool = False) -> None:
+        """
+        Return a leased resource to the pool.
+
+        Args:
+            resource: The resource obtained from acquire()
+            discard: Close the resource instead of keeping it for reuse
+        """
+        self._in_use -= 1
+        try:
+            if discard or self._closed:
+                await self._destroy(resource)
+            else:
+                self._idle.append((resource, time.monotonic()))
+        finally:
+            self._slots.release()
+            self._released.set()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Any]:
+        """Acquire a resource for the duration of an `async with` block."""
+        resource = await self.acquire()
+        try:
+            yield resource
+        finally:
+            await self.release(resource)
+
+    async def evict_idle(self) -> int:
+        """
+        Close resources that have been idle for longer than idle_timeout.
+
+        Returns:
+            Number of resources closed
+        """
+        if self._idle_timeout is None:
+            return 0
+
+        deadline = time.monotonic() - self._idle_timeout
+        evicted = 0
+        # Idle resources are appended on release, so the oldest are first
+        while self._idle and self._idle[0][1] < deadline:
+            resource, _ = self._idle.popleft()
+            await self._destroy(resource)
+            evicted += 1
+        return evicted
+
+    async def close(self, timeout: float | None = None) -> None:
+        """
+        Shut the pool down gracefully.
+
+        New acquisitions fail immediately, leased resources are closed when
+        they are released, and idle ones are closed right away.
+
+        Args:
+            timeout: Seconds to wait for leased resources to be released;
+                     waits indefinitely if None
+        """
+        self._closed = True
+
+        while self._idle:
+            resource, _ = self._idle.popleft()
+            # One resource failing to close must not leak the others
+            try:
+                await self._destroy(resource)
+            except Exception as e:
+                logger.warning(f"Closing a pooled resource failed: {e}")
+
+        async def wait_released() -> None:
+            while self._in_use > 0:
+                self._released.clear()
+                await self._released.wait()
+
+        try:
+            await asyncio.wait_for(wait_released(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _reuse_idle(self) -> Any | None:
+        while self._idle:
+            resource, _ = self._idle.pop()
+            if self._health_check is None or await self._is_healthy(resource):
+                return resource
+            await self._destroy(resource)
+        return None
+
+    async def _is_healthy(self, resource: Any) -> bool:
+        try:
+            return bool(await _maybe_await(self._health_check(resource)))
+        except Exception:
+            return False
+
+    async def _destroy(self, resource: Any) -> None:
+        self._size -= 1
+        if self._close is not None:
+            await _maybe_await(self._close(resource))
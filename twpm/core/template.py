@@ -0,0 +1,179 @@
+"""
+Message templates with ListData placeholders.
+
+Templates are strings with `{key}` placeholders, such as
+`Template("Hi {user_name}, your plan is {plan}.")`. A template is parsed
+once into a render plan of literal text and field keys, then rendered for
+each session from its ListData, so nothing session-specific is ever
+stored on a node.
+
+Templating is opt-in: nodes render the messages, questions and titles
+given as a Template, and show plain strings exactly as written, braces
+included.
+
+Supported syntax:
+    - Placeholders: `{user_name}`, replaced by the value stored under the key
+    - Defaults: `{user_name|friend}`, used when the key is missing
+    - Escaped braces: `{{` and `}}` render as `{` and `}`
+
+Placeholders without a default render as an empty string when the key is
+missing. Defaults cannot contain `:` or `!`.
+"""
+
+from functools import lru_cache
+from string import Formatter
+
+from twpm.core.base import ListData, NodeKey
+
+_DEFAULT_SEPARATOR = "|"
+
+
+class TemplateError(ValueError):
+    """Raised when a template cannot be parsed."""
+
+
+class Template:
+    """
+    A parsed template rendered against ListData.
+
+    Instances pickle and compare by their source text.
+
+    Attributes:
+        source: The template text
+        names: Field keys referenced by the template, without duplicates
+
+    Example:
+        ```python
+        greeting = Template("Hi {user_name|there}, welcome!")
+        greeting.render(ListData(data={"user_name": "John"}))  # "Hi John, welcome!"
+        greeting.render(ListData(data={}))  # "Hi there, welcome!"
+        ```
+    """
+
+    __slots__ = ("source", "names", "_literals", "_fields")
+
+    def __init__(self, source: str):
+        """
+        Parse a template into its render plan.
+
+        Args:
+            source: The template text
+
+        Raises:
+            TemplateError: If the text is not a valid template
+        """
+        try:
+            parsed = list(Formatter().parse(source))
+        except ValueError as e:
+            raise TemplateError(f"Invalid template '{source}': {e}") from e
+
+        # Literal text and fields alternate, starting and ending with text
+        literals: list[str] = []
+        fields: list[tuple[int, str]] = []
+        names: dict[NodeKey, int] = {}
+        text = ""
+
+        for literal, field, format_spec, conversion in parsed:
+            text += literal
+            if field is None:
+                continue
+            if format_spec or conversion:
+                raise TemplateError(
+                    f"Format specs and conversions are not supported in: {source}"
+                )
+
+            key, _, default = field.partition(_DEFAULT_SEPARATOR)
+            key = key.strip()
+            if not key:
+                raise TemplateError(f"Empty placeholder in template: {source}")
+
+            index = names.setdefault(key, len(names))
+            literals.append(text)
+            fields.append((index, default))
+            text = ""
+
+        literals.append(text)
+
+        self.source = source
+        self.names: tuple[NodeKey, ...] = tuple(names)
+        self._literals = tuple(literals)
+        self._fields = tuple(fields)
+
+    @property
+    def is_static(self) -> bool:
+        """Whether the template has no placeholders."""
+        return not self._fields
+
+    def render(self, data: ListData) -> str:
+        """
+        Render the template with values from data.
+
+        Args:
+            data: Session data providing the placeholder values
+
+        Returns:
+            The rendered text
+        """
+        if not self._fields:
+            return self._literals[0]
+
+        values = data.get_many(self.names)
+        parts = [self._literals[0]]
+        for (index, default), literal in zip(self._fields, self._literals[1:]):
+            value = values[index]
+            parts.append(default if value is None else str(value))
+            parts.append(literal)
+        return "".join(parts)
+
+    def __reduce__(self):
+        return (compile_template, (self.source,))
+
+    def __str__(self) -> str:
+        return self.source
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Template) and other.source == self.source
+
+    def __hash__(self) -> int:
+        return hash(self.source)
+
+    def __repr__(self) -> str:
+        return f"Template({self.source!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_template(source: str) -> Template:
+    """
+    Parse a template, reusing previously parsed instances.
+
+    Args:
+        source: The template text
+
+    Returns:
+        The parsed Template
+
+    Raises:
+        TemplateError: If the text is not a valid template
+    """
+    return Template(source)
+
+
+def escape(text: str) -> str:
+    """Escape the braces of text so it renders verbatim as a template."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def as_template(text: "str | Template") -> Template:
+    """
+    Get the template of a node's text.
+
+    Args:
+        text: A Template, rendered with placeholders, or a plain string,
+              shown as written
+
+    Returns:
+        The Template to render
+    """
+    if isinstance(text, Template):
+        return text
+    return compile_template(escape(text))
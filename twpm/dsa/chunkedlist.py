@@ -0,0 +1,293 @@
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
+from itertools import chain, islice
+from typing import Any, overload
+
+# Chunks are split in two when they grow past twice this size
+DEFAULT_LOAD = 512
+
+
+class ChunkedList(MutableSequence):
+    """
+    Sequence stored as a list of bounded chunks, indexed by a Fenwick tree.
+
+    Positional reads, writes, inserts and deletes locate their chunk in
+    O(log n) and then touch a single chunk of at most 2 * load elements,
+    so they stay fast on sequences with millions of elements, where a
+    list shifts everything after the position and a linked list walks to it.
+
+    Slicing returns a ChunkedListView over the selected positions without
+    copying elements.
+
+    Example:
+        ```python
+        steps = ChunkedList(range(1_000_000))
+        steps.insert(500_000, -1)
+        del steps[10]
+        window = steps[1000:2000]  # view, no copy
+        ```
+    """
+
+    def __init__(self, elements: Iterable[Any] = (), load: int = DEFAULT_LOAD):
+        """
+        Initialize a ChunkedList.
+
+        Args:
+            elements: Initial elements
+            load: Target chunk size; larger chunks mean fewer chunks to
+                  index but more elements shifted per insert or delete
+        """
+        if load < 1:
+            raise ValueError("load must be at least 1")
+
+        self._load = load
+        self._chunks: list[list[Any]] = []
+        self._count = 0
+        # Fenwick tree of chunk lengths, 1-indexed
+        self._tree: list[int] = [0]
+        self._top = 0
+        self.extend(elements)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._chunks)
+
+    def __reversed__(self) -> Iterator[Any]:
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+    def __repr__(self) -> str:
+        return f"ChunkedList({list(self)!r})"
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ChunkedListView": ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return ChunkedListView(self, range(self._count)[index])
+
+        chunk, offset = self._locate(self._position(index))
+        return self._chunks[chunk][offset]
+
+    def __setitem__(self, index: int, element: Any) -> None:
+        if isinstance(index, slice):
+            raise TypeError("ChunkedList does not support slice assignment")
+
+        chunk, offset = self._locate(self._position(index))
+        self._chunks[chunk][offset] = element
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            positions = range(self._count)[index]
+            if not positions:
+                return
+            if abs(positions.step) == 1:
+                self._delete_range(min(positions), max(positions) + 1)
+                return
+            # Highest positions first so the remaining ones don't move
+            for position in sorted(positions, reverse=True):
+                self._delete(position)
+            return
+
+        self._delete(self._position(index))
+
+    def insert(self, index: int, element: Any) -> None:
+        """Insert an element before index, like list.insert."""
+        position = index + self._count if index < 0 else index
+        position = min(max(position, 0), self._count)
+
+        if position == self._count:
+            self.append(element)
+            return
+
+        chunk, offset = self._locate(position)
+        self._chunks[chunk].insert(offset, element)
+        self._count += 1
+        self._grew(chunk)
+
+    def append(self, element: Any) -> None:
+        if not self._chunks:
+            self._chunks.append([element])
+            self._count = 1
+            self._rebuild()
+            return
+
+        last = len(self._chunks) - 1
+        self._chunks[last].append(element)
+        self._count += 1
+        self._grew(last)
+
+    def extend(self, elements: Iterable[Any]) -> None:
+        """Append many elements, filling whole chunks and indexing them once."""
+        if elements is self:
+            elements = list(elements)
+
+        iterator = iter(elements)
+        added = 0
+
+        if self._chunks:
+            last = self._chunks[-1]
+            room = self._load - len(last)
+            if room > 0:
+                before = len(last)
+                last.extend(islice(iterator, room))
+                added += len(last) - before
+
+        while True:
+            chunk = list(islice(iterator, self._load))
+            if not chunk:
+                break
+            self._chunks.append(chunk)
+            added += len(chunk)
+
+        if added:
+            self._count += added
+            self._rebuild()
+
+    def pop(self, index: int = -1) -> Any:
+        if self._count == 0:
+            raise IndexError("pop from empty list")
+        return self._delete(self._position(index))
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._count = 0
+        self._rebuild()
+
+    def _position(self, index: int) -> int:
+        """Turn a possibly negative index into a position, checking bounds."""
+        position = index + self._count if index < 0 else index
+        if not 0 <= position < self._count:
+            raise IndexError("Index out of range")
+        return position
+
+    def _locate(self, position: int) -> tuple[int, int]:
+        """Find the chunk holding a valid position and the offset in it."""
+        tree = self._tree
+        size = len(tree)
+        chunk = 0
+        remaining = position
+        step = self._top
+
+        # Largest chunk count whose total length is <= position
+        while step:
+            candidate = chunk + step
+            if candidate < size and tree[candidate] <= remaining:
+                chunk = candidate
+                remaining -= tree[candidate]
+            step >>= 1
+
+        return chunk, remaining
+
+    def _delete(self, position: int) -> Any:
+        chunk, offset = self._locate(position)
+        elements = self._chunks[chunk]
+        element = elements.pop(offset)
+        self._count -= 1
+
+        if elements:
+            self._add(chunk, -1)
+        else:
+            del self._chunks[chunk]
+            self._rebuild()
+        return element
+
+    def _delete_range(self, start: int, stop: int) -> None:
+        """Delete a run of positions chunk by chunk, reindexing once."""
+        chunk, offset = self._locate(start)
+        remaining = stop - start
+
+        while remaining:
+            elements = self._chunks[chunk]
+            taken = min(len(elements) - offset, remaining)
+            del elements[offset : offset + taken]
+            remaining -= taken
+            offset = 0
+            chunk += 1
+
+        self._chunks = [elements for elements in self._chunks if elements]
+        self._count -= stop - start
+        self._rebuild()
+
+    def _grew(self, chunk: int) -> None:
+        """Account for an element added to a chunk, splitting it if too big."""
+        elements = self._chunks[chunk]
+        if len(elements) > 2 * self._load:
+            self._chunks.insert(chunk + 1, elements[self._load :])
+            del elements[self._load :]
+            self._rebuild()
+        else:
+            self._add(chunk, 1)
+
+    def _add(self, chunk: int, delta: int) -> None:
+        tree = self._tree
+        index = chunk + 1
+        while index < len(tree):
+            tree[index] += delta
+            index += index & -index
+
+    def _rebuild(self) -> None:
+        """Rebuild the Fenwick tree after chunks were added or removed, O(chunks)."""
+        tree = [0]
+        tree.extend(len(chunk) for chunk in self._chunks)
+        size = len(tree)
+        for index in range(1, size):
+            parent = index + (index & -index)
+            if parent < size:
+                tree[parent] += tree[index]
+
+        self._tree = tree
+        self._top = 1 << ((size - 1).bit_length() - 1) if size > 1 else 0
+
+
+class ChunkedListView(Sequence):
+    """
+    Read-only view of positions of a ChunkedList, created by slicing.
+
+    The view holds the positions, not the elements: it sees later writes to
+    those positions, and shifts if elements are inserted or deleted before
+    them.
+    """
+
+    __slots__ = ("_base", "_positions")
+
+    def __init__(self, base: ChunkedList, positions: range):
+        self._base = base
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ChunkedListView": ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return ChunkedListView(self._base, self._positions[index])
+        return self._base[self._positions[index]]
+
+    def __iter__(self) -> Iterator[Any]:
+        positions = self._positions
+        if not positions:
+            return iter(())
+        if positions.step == 1:
+            # Read whole chunks from the first position on
+            return islice(self._contiguous(), len(positions))
+        return (self._base[position] for position in positions)
+
+    def _contiguous(self) -> Iterator[Any]:
+        base = self._base
+        chunk, offset = base._locate(self._positions.start)
+        yield from islice(base._chunks[chunk], offset, None)
+        for elements in islice(base._chunks, chunk + 1, None):
+            yield from elements
+
+    def __repr__(self) -> str:
+        return f"ChunkedListView({list(self)!r})"
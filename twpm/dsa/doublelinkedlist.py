@@ -1,9 +1,10 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 from .linkedlist import LinkedList
 
 
-@dataclass
+@dataclass(slots=True)
 class DoubleNode:
     element: int = 0
     prev: "DoubleNode | None" = None
@@ -11,100 +12,108 @@ class DoubleNode:
 
 
 class DoubleLinkedList(LinkedList):
-    def __init__(self):
-        super().__init__()
-        # self._head: DoubleNode | None = None
-        self._tail: DoubleNode | None = None
+    """
+    Doubly linked list of integers.
+
+    Besides O(1) appends and access to both ends, indexing walks from
+    whichever end is nearer, so no lookup visits more than half the nodes.
+    """
+
+    def _node_at(self, position: int) -> DoubleNode:
+        if position < self._count // 2:
+            node = self._head
+            for _ in range(position):
+                node = node.next
+        else:
+            node = self._tail
+            for _ in range(self._count - 1 - position):
+                node = node.prev
+        return node
 
     def append(self, element: int):
-        node = DoubleNode(element=element)
+        node = DoubleNode(element=element, prev=self._tail)
 
-        if self._count == 0:
+        if self._tail is None:
             self._head = node
-            self._tail = node
         else:
-            last = self[self._count - 1]
-            last.next = node
-            node.prev = last
-            self._tail = node
+            self._tail.next = node
+        self._tail = node
 
         self._count += 1
 
     def pop(self, index: int) -> DoubleNode:
-        abs_index = abs(index)
-
-        if abs_index >= self._count and index != 0:
-            raise IndexError("Index out of range")
-
-        current = self._head
-
-        if abs_index == 0:
-            self._head = current.next
-            if self._head:
-                self._head.prev = None
-            else:
-                self._tail = None
-        else:
-            previous = self[abs_index - 1]
-            current = previous.next
-            previous.next = current.next
-            if current.next:
-                current.next.prev = previous
-            else:
-                self._tail = previous
+        if self._count == 0:
+            raise IndexError("pop from empty list")
+        current = self._node_at(self._index(index))
 
+        self._unlink(current)
         self._count -= 1
 
         return current
 
     def insert(self, index: int, element: int):
-        abs_index = abs(index)
+        if self._count == 0 and index == 0:
+            self.append(element)
+            return
+        current = self._node_at(self._index(index))
+
+        # The new node takes the position of the current one
+        node = DoubleNode(element=element, prev=current.prev, next=current)
+        if current.prev is None:
+            self._head = node
+        else:
+            current.prev.next = node
+        current.prev = node
 
-        if abs_index >= self._count and index != 0:
-            raise IndexError("Index out of range")
+        self._count += 1
 
-        node = DoubleNode(element=element)
+    def insert_after(self, index: int, element: int):
+        current = self._node_at(self._index(index))
 
-        if abs_index == 0:
-            current = self._head
-            node.next = current
-            if current:
-                current.prev = node
-            self._head = node
-            if self._count == 0:
-                self._tail = node
+        node = DoubleNode(element=element, prev=current, next=current.next)
+        if current.next is None:
+            self._tail = node
         else:
-            previous = self[abs_index - 1]
-            current = previous.next
-            previous.next = node
-            node.prev = previous
-            node.next = current
-            if current:
-                current.prev = node
-            else:
-                self._tail = node
+            current.next.prev = node
+        current.next = node
 
         self._count += 1
 
-    def insert_after(self, index: int, element: int):
-        abs_index = abs(index)
+    def _unlink(self, node: DoubleNode):
+        """Detach a node from the list, keeping its neighbours linked."""
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
 
-        if abs_index >= self._count:
-            raise IndexError("Index out of range")
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
 
-        node = DoubleNode(element=element)
-        current = self[abs_index]
-        current_next = current.next
+        node.prev = None
+        node.next = None
 
-        current.next = node
-        node.prev = current
-        node.next = current_next
-        if current_next:
-            current_next.prev = node
+    def __setitem__(self, index: int, node: DoubleNode):
+        "replace the item in the index with the given node"
+        current = self._node_at(self._index(index))
+
+        node.prev = current.prev
+        node.next = current.next
+        if current.prev is None:
+            self._head = node
         else:
+            current.prev.next = node
+        if current.next is None:
             self._tail = node
+        else:
+            current.next.prev = node
 
-        self._count += 1
+    def __reversed__(self) -> Iterator[DoubleNode]:
+        node = self._tail
+        while node is not None:
+            yield node
+            node = node.prev
 
-    def get_tail(self):
+    def get_tail(self) -> DoubleNode | None:
         return self._tail
@@ -0,0 +1,228 @@
+from array import array
+from collections.abc import Iterable, Iterator
+
+_MIN_CAPACITY = 8
+
+
+def _zeros(size: int) -> array:
+    return array("q", bytes(8 * size))
+
+
+class IntDeque:
+    """
+    Growable sequence of 64-bit integers stored in a ring buffer.
+
+    Elements live unboxed in an `array("q")`, 8 bytes each, instead of one
+    node object plus one int object per element as in LinkedList. Appends
+    and pops at both ends are amortized O(1); inserts and deletes in the
+    middle shift the elements with C-level slice copies.
+
+    The methods mirror LinkedList, but return elements rather than nodes,
+    since there are none.
+
+    Example:
+        ```python
+        scores = IntDeque(range(1_000_000))
+        scores.appendleft(-1)
+        total = sum(scores.view())  # no copy
+        ```
+    """
+
+    __slots__ = ("_buffer", "_start", "_count")
+
+    def __init__(self, elements: Iterable[int] = ()):
+        """
+        Initialize an IntDeque.
+
+        Args:
+            elements: Initial elements
+
+        Raises:
+            OverflowError: If an element does not fit in 64 bits
+        """
+        self._buffer = _zeros(_MIN_CAPACITY)
+        self._start = 0
+        self._count = 0
+        self.extend(elements)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    def _index(self, index: int) -> int:
+        """Turn a possibly negative index into a position, checking bounds."""
+        position = index + self._count if index < 0 else index
+        if not 0 <= position < self._count:
+            raise IndexError("Index out of range")
+        return position
+
+    def _slot(self, position: int) -> int:
+        # Capacities are powers of two
+        return (self._start + position) & (len(self._buffer) - 1)
+
+    def _reserve(self, size: int) -> None:
+        """Ensure room for `size` elements, stored contiguously from slot 0."""
+        capacity = len(self._buffer)
+        if size <= capacity and self._start + self._count <= capacity:
+            return
+
+        while capacity < size:
+            capacity *= 2
+        buffer = self._contents()
+        buffer.extend(_zeros(capacity - self._count))
+        self._buffer = buffer
+        self._start = 0
+
+    def _contents(self) -> array:
+        """Copy of the elements, in order."""
+        end = self._start + self._count
+        if end <= len(self._buffer):
+            return self._buffer[self._start : end]
+        return self._buffer[self._start :] + self._buffer[: end - len(self._buffer)]
+
+    def _make_contiguous(self) -> None:
+        """Unwrap the ring so elements occupy buffer[start:start + count]."""
+        if self._start + self._count > len(self._buffer):
+            buffer = self._contents()
+            buffer.extend(_zeros(len(self._buffer) - self._count))
+            self._buffer = buffer
+            self._start = 0
+
+    def append(self, element: int):
+        buffer = self._buffer
+        count = self._count
+        if count == len(buffer):
+            self._reserve(count + 1)
+            buffer = self._buffer
+        buffer[(self._start + count) & (len(buffer) - 1)] = element
+        self._count = count + 1
+
+    def appendleft(self, element: int):
+        if self._count == len(self._buffer):
+            self._reserve(self._count + 1)
+        self._start = (self._start - 1) & (len(self._buffer) - 1)
+        self._buffer[self._start] = element
+        self._count += 1
+
+    def pop(self, index: int = -1) -> int:
+        if self._count == 0:
+            raise IndexError("pop from empty list")
+        position = self._index(index)
+
+        if position == 0:
+            return self.popleft()
+
+        element = self._buffer[self._slot(position)]
+        if position < self._count - 1:
+            self._make_contiguous()
+            start = self._start + position
+            end = self._start + self._count
+            self._buffer[start : end - 1] = self._buffer[start + 1 : end]
+        self._count -= 1
+        return element
+
+    def popleft(self) -> int:
+        if self._count == 0:
+            raise IndexError("pop from empty list")
+        element = self._buffer[self._start]
+        self._start = (self._start + 1) & (len(self._buffer) - 1)
+        self._count -= 1
+        return element
+
+    def insert(self, index: int, element: int):
+        """Insert an element before index, like list.insert."""
+        position = index + self._count if index < 0 else index
+        position = min(max(position, 0), self._count)
+
+        if position == self._count:
+            self.append(element)
+            return
+        if position == 0:
+            self.appendleft(element)
+            return
+
+        self._reserve(self._count + 1)
+        self._make_contiguous()
+        buffer = self._buffer
+        start = self._start
+        end = start + self._count
+
+        if end < len(buffer):
+            # Shift the elements after the position right
+            buffer[start + position + 1 : end + 1] = buffer[start + position : end]
+        else:
+            # The ring ends at the buffer's end: shift the ones before left
+            buffer[start - 1 : start + position - 1] = buffer[start : start + position]
+            self._start = start = start - 1
+        buffer[start + position] = element
+        self._count += 1
+
+    def insert_after(self, index: int, element: int):
+        self.insert(self._index(index) + 1, element)
+
+    def extend(self, elements: Iterable[int]):
+        """Append many elements with a single copy into the buffer."""
+        if isinstance(elements, array) and elements.typecode == "q":
+            items = elements
+        else:
+            items = array("q", elements)
+        if not items:
+            return
+
+        self._reserve(self._count + len(items))
+        end = self._start + self._count
+        if end + len(items) > len(self._buffer):
+            # Not enough room after the elements: move them to slot 0
+            self._buffer = self._contents() + _zeros(len(self._buffer) - self._count)
+            self._start = 0
+            end = self._count
+        self._buffer[end : end + len(items)] = items
+        self._count += len(items)
+
+    def clear(self):
+        self._buffer = _zeros(_MIN_CAPACITY)
+        self._start = 0
+        self._count = 0
+
+    def view(self) -> memoryview:
+        """
+        Zero-copy view of the elements, for bulk reads.
+
+        A wrapped ring is unwrapped first. The view shares the current
+        buffer: it sees later writes, but not elements added once the
+        deque has grown into a new buffer.
+        """
+        self._make_contiguous()
+        return memoryview(self._buffer)[self._start : self._start + self._count]
+
+    def get_head(self) -> int | None:
+        return self._buffer[self._start] if self._count else None
+
+    def get_tail(self) -> int | None:
+        return self._buffer[self._slot(self._count - 1)] if self._count else None
+
+    def __bool__(self):
+        return self._count > 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._contents())
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self._contents())
+
+    def __getitem__(self, index: int) -> int:
+        return self._buffer[self._slot(self._index(index))]
+
+    def __setitem__(self, index: int, element: int):
+        self._buffer[self._slot(self._index(index))] = element
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntDeque):
+            return NotImplemented
+        return self._contents() == other._contents()
+
+    def __repr__(self):
+        return f"IntDeque({self._contents().tolist()!r})"
@@ -1,138 +1,152 @@
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-from typing import Self
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     element: int = 0
     next: "Node | None" = None
 
 
 class LinkedList:
+    """
+    Singly linked list of integers that tracks its head and tail.
+
+    Appending and reading either end are O(1); other positions are reached
+    by walking from the head. Indexes follow Python's rules, so -1 is the
+    last node.
+    """
+
     def __init__(self):
         self._count = 0
         self._head: Node | None = None
+        self._tail: Node | None = None
+
+    def _index(self, index: int) -> int:
+        """Turn a possibly negative index into a position, checking bounds."""
+        position = index + self._count if index < 0 else index
+        if not 0 <= position < self._count:
+            raise IndexError("Index out of range")
+        return position
+
+    def _node_at(self, position: int) -> Node:
+        """Get the node at a valid position."""
+        if position == self._count - 1:
+            return self._tail
+
+        node = self._head
+        for _ in range(position):
+            node = node.next
+        return node
 
     def append(self, element: int):
         node = Node(element=element)
-        if self._count == 0:
+        if self._tail is None:
             self._head = node
         else:
-            last = self[self._count - 1]
-            last.next = node
+            self._tail.next = node
+        self._tail = node
         self._count += 1
 
     def pop(self, index: int) -> Node:
-        abs_index = abs(index)
-
-        if abs_index >= self._count and index != 0:
-            raise IndexError("Index out of range")
-
-        current = self._head
+        if self._count == 0:
+            raise IndexError("pop from empty list")
+        position = self._index(index)
 
-        if abs_index == 0:
+        if position == 0:
+            current = self._head
             self._head = current.next
+            if self._head is None:
+                self._tail = None
         else:
-            previous = self[abs_index - 1]
+            previous = self._node_at(position - 1)
             current = previous.next
             previous.next = current.next
+            if current is self._tail:
+                self._tail = previous
 
+        current.next = None
         self._count -= 1
 
         return current
 
     def insert(self, index: int, element: int):
-        abs_index = abs(index)
-
-        if abs_index >= self._count and index != 0:
-            raise IndexError("Index out of range")
+        if self._count == 0 and index == 0:
+            self.append(element)
+            return
+        position = self._index(index)
 
         node = Node(element=element)
 
-        if abs_index == 0:
-            current = self._head
-            node.next = current
+        if position == 0:
+            node.next = self._head
             self._head = node
         else:
-            previous = self[abs_index - 1]
-            current = previous.next
+            previous = self._node_at(position - 1)
+            node.next = previous.next
             previous.next = node
-            node.next = current
 
         self._count += 1
 
-    def extend(self, list: Self):
-        if len(list) == 0:
-            return
-
-        last = self[self._count - 1]
-        first = list[0]
+    def extend(self, elements: "LinkedList | Iterable[int]"):
+        """Append copies of the elements of another list, or integers."""
+        if isinstance(elements, LinkedList):
+            elements = [node.element for node in elements]
 
-        last.next = first
-        self._count += len(list)
+        for element in elements:
+            self.append(element)
 
     def insert_after(self, index: int, element: int):
-        abs_index = abs(index)
-
-        if abs_index >= self._count:
-            raise IndexError("Index out of range")
-
-        node = Node(element=element)
-        current = self[abs_index]
-        current_next = current.next
+        position = self._index(index)
 
+        current = self._node_at(position)
+        node = Node(element=element, next=current.next)
         current.next = node
-        node.next = current_next
+        if current is self._tail:
+            self._tail = node
 
         self._count += 1
 
     def clear(self):
         self._head = None
+        self._tail = None
         self._count = 0
 
     def get_head(self) -> Node | None:
         return self._head
 
+    def get_tail(self) -> Node | None:
+        return self._tail
+
     def __bool__(self):
         return self._count > 0
 
     def __len__(self):
         return self._count
 
+    def __iter__(self) -> Iterator[Node]:
+        node = self._head
+        while node is not None:
+            yield node
+            node = node.next
+
     def __setitem__(self, index: int, node: Node):
         "replace the item in the index with the given node"
-        abs_index = abs(index)
-        if abs_index >= self._count and index != 0:
-            raise IndexError("Index out of range")
-
-        current = self._head
+        position = self._index(index)
 
-        if abs_index == 0:
-            node.next = current.next
+        if position == 0:
+            node.next = self._head.next
             self._head = node
         else:
-            previous = self[abs_index - 1]
-            current = previous.next
-            node.next = current.next
+            previous = self._node_at(position - 1)
+            node.next = previous.next.next
             previous.next = node
 
-    def __getitem__(self, index: int) -> Node:
-        abs_index = abs(index)
-
-        if abs_index >= self._count and index != 0:
-            raise IndexError("Index out of range")
-
-        node = self._head
-
-        for _ in range(index):
-            node = node.next
+        if position == self._count - 1:
+            self._tail = node
 
-        return node
+    def __getitem__(self, index: int) -> Node:
+        return self._node_at(self._index(index))
 
     def __str__(self):
-        current = self._head
-        elements = []
-        while current:
-            elements.append(str(current.element))
-            current = current.next
-        return " -> ".join(elements)
+        return " -> ".join(str(node.element) for node in self)